@@ -2,20 +2,94 @@
 Classe de base pour tous les analyseurs
 """
 
+import bisect
+import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import AbstractSet, FrozenSet, List, Dict, Any, Optional, Union
+
+
+# Types de ligne produits par BaseAnalyzer._classify_lines
+LINE_CODE = 0
+LINE_COMMENT = 1
+LINE_BLADE = 2
+
+_COMMENT_PREFIXES = ('//', '#', '/*', '*')
+
+# Au-delà de cette longueur (code minifié ou généré), une ligne n'est pas soumise aux
+# détecteurs coûteux : borne le temps de recherche des motifs en .* sur du source arbitraire
+MAX_ANALYZED_LINE_LENGTH = 4096
+
+# Directives Blade Laravel (correspondance par préfixe, comme "@if" dans "@ifdef")
+_BLADE_DIRECTIVE_RE = re.compile('@(?:' + '|'.join(sorted({
+    # Structures de contrôle
+    'if', 'elseif', 'unless', 'else', 'endif', 'endunless',
+    'for', 'foreach', 'while', 'endfor', 'endforeach', 'endwhile',
+    'switch', 'case', 'break', 'default', 'endswitch',
+    
+    # Inclusions
+    'include', 'includeIf', 'includeWhen', 'includeUnless', 'includeFirst',
+    'extends', 'section', 'endsection', 'show', 'stop', 'yield', 'parent',
+    'component', 'endcomponent', 'slot', 'endslot',
+    
+    # Autres
+    'csrf', 'method', 'auth', 'guest', 'endauth', 'endguest',
+    'can', 'cannot', 'endcan', 'endcannot',
+    'push', 'endpush', 'prepend', 'endprepend', 'stack',
+    'php', 'endphp', 'json', 'dd', 'dump'
+})) + ')')
+
+
+def classify_lines(lines: List[str]) -> bytearray:
+    """
+    Classer toutes les lignes d'un fichier en une seule passe (0 = code, sinon à ignorer)
+    
+    Les lignes de commentaire et les directives Blade sont marquées, y compris
+    l'intérieur des commentaires multi-lignes ``/* ... */`` dont les lignes ne
+    commencent pas par ``*``. SimpleAnalyzer calcule ce tableau une fois par fichier
+    et le transmet à chaque analyseur.
+    """
+    line_kind = bytearray(len(lines))
+    in_block_comment = False
+    
+    for i, line in enumerate(lines):
+        line_stripped = line.strip()
+        if in_block_comment:
+            line_kind[i] = LINE_COMMENT
+            if '*/' in line_stripped:
+                in_block_comment = False
+        elif line_stripped.startswith(_COMMENT_PREFIXES):
+            line_kind[i] = LINE_COMMENT
+            if line_stripped.startswith('/*') and '*/' not in line_stripped[2:]:
+                in_block_comment = True
+        elif '@' in line_stripped and _BLADE_DIRECTIVE_RE.search(line_stripped):
+            line_kind[i] = LINE_BLADE
+    
+    return line_kind
 
 
 class BaseAnalyzer(ABC):
     """Classe de base abstraite pour tous les analyseurs PHP"""
     
-    def __init__(self, config=None):
-        """Initialiser l'analyseur avec la configuration"""
+    # Règles dont l'analyseur peut produire des problèmes (None : non déclarées,
+    # l'analyseur est toujours exécuté)
+    rule_names: Optional[FrozenSet[str]] = None
+    
+    def __init__(self, config=None, enabled_rules: Optional[AbstractSet[str]] = None):
+        """
+        Initialiser l'analyseur avec la configuration
+        
+        Args:
+            config: Configuration de l'analyseur
+            enabled_rules: Règles dont les problèmes seront conservés après filtrage
+                (None : toutes celles que la configuration laisse passer)
+        """
         self.config = config
+        self.enabled_rules = enabled_rules
     
     @abstractmethod
-    def analyze(self, content: str, file_path: Path, lines: List[str]) -> List[Dict[str, Any]]:
+    def analyze(self, content: str, file_path: Path, lines: List[str],
+                line_kind: Optional[bytearray] = None) -> List[Dict[str, Any]]:
         """
         Analyser le contenu PHP et retourner une liste d'issues
         
@@ -23,13 +97,20 @@ class BaseAnalyzer(ABC):
             content: Contenu complet du fichier
             file_path: Chemin vers le fichier analysé
             lines: Liste des lignes du fichier
+            line_kind: Classification des lignes par classify_lines (calculée si absente)
             
         Returns:
             Liste des problèmes détectés sous forme de dictionnaires
         """
         pass
     
-    def _create_issue(self, rule_name: str, message: str, file_path: Path, line: int, 
+    def _should_report_rule(self, rule_name: str) -> bool:
+        """Vérifier si les problèmes d'une règle seront conservés (inutile de les calculer sinon)"""
+        if self.enabled_rules is not None:
+            return rule_name in self.enabled_rules
+        return self.config is None or self.config.should_apply_rule(rule_name)
+    
+    def _create_issue(self, rule_name: str, message: str, file_path: Union[str, Path], line: int, 
                      severity: str, issue_type: str, suggestion: str, 
                      code_snippet: str, column: int = 0) -> Dict[str, Any]:
         """
@@ -38,7 +119,7 @@ class BaseAnalyzer(ABC):
         Args:
             rule_name: Nom de la règle violée
             message: Message décrivant le problème
-            file_path: Chemin du fichier
+            file_path: Chemin du fichier (str déjà converti de préférence)
             line: Numéro de ligne
             severity: Sévérité (error, warning, info)
             issue_type: Type de problème (security, performance, error, etc.)
@@ -61,39 +142,31 @@ class BaseAnalyzer(ABC):
             'code_snippet': code_snippet
         }
     
+    def _compute_line_starts(self, content: str) -> List[int]:
+        """
+        Calculer la position de début de chaque ligne du contenu
+
+        Permet de retrouver le numéro de ligne d'un match obtenu sur le contenu
+        complet sans parcourir les lignes une par une.
+        """
+        line_starts = [0]
+        pos = content.find('\n')
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = content.find('\n', pos + 1)
+        return line_starts
+
+    def _line_number_at(self, line_starts: List[int], offset: int) -> int:
+        """Retourner le numéro de ligne (à partir de 1) d'une position dans le contenu"""
+        return bisect.bisect_right(line_starts, offset)
+
     def _is_comment_line(self, line: str) -> bool:
         """Vérifier si une ligne est un commentaire"""
-        line_stripped = line.strip()
-        return (line_stripped.startswith('//') or 
-                line_stripped.startswith('#') or 
-                line_stripped.startswith('/*') or
-                line_stripped.startswith('*'))
+        return line.strip().startswith(_COMMENT_PREFIXES)
     
     def _is_blade_directive(self, line: str) -> bool:
         """Vérifier si une ligne contient une directive Blade Laravel"""
-        blade_directives = {
-            # Structures de contrôle
-            'if', 'elseif', 'unless', 'else', 'endif', 'endunless',
-            'for', 'foreach', 'while', 'endfor', 'endforeach', 'endwhile',
-            'switch', 'case', 'break', 'default', 'endswitch',
-            
-            # Inclusions
-            'include', 'includeIf', 'includeWhen', 'includeUnless', 'includeFirst',
-            'extends', 'section', 'endsection', 'show', 'stop', 'yield', 'parent',
-            'component', 'endcomponent', 'slot', 'endslot',
-            
-            # Autres
-            'csrf', 'method', 'auth', 'guest', 'endauth', 'endguest',
-            'can', 'cannot', 'endcan', 'endcannot',
-            'push', 'endpush', 'prepend', 'endprepend', 'stack',
-            'php', 'endphp', 'json', 'dd', 'dump'
-        }
-        
-        line_stripped = line.strip()
-        for directive in blade_directives:
-            if f'@{directive}' in line_stripped:
-                return True
-        return False
+        return '@' in line and _BLADE_DIRECTIVE_RE.search(line) is not None
     
     def _remove_strings_and_comments(self, line: str) -> str:
         """
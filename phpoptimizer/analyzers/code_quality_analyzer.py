@@ -4,27 +4,46 @@ Analyseur spécialisé pour la qualité de code
 
 import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-from .base_analyzer import BaseAnalyzer
+from .base_analyzer import BaseAnalyzer, LINE_COMMENT, classify_lines
+
+
+# Syntaxe Blade ignorée par l'analyse ligne par ligne : @directive (dont @php, @endphp),
+# {{ variable }} et {!! html !!}, réunis en une seule expression compilée
+_BLADE_SYNTAX_RE = re.compile(r'@[a-zA-Z_]|\{\{.*\}\}|\{!!.*!!\}')
 
 
 class CodeQualityAnalyzer(BaseAnalyzer):
     """Analyseur spécialisé pour la qualité de code et les bonnes pratiques"""
     
-    def analyze(self, content: str, file_path: Path, lines: List[str]) -> List[Dict[str, Any]]:
+    # Règles dont cet analyseur peut produire des problèmes
+    rule_names = frozenset({
+        'best_practices.brace_style', 'best_practices.complex_condition',
+        'best_practices.function_naming', 'best_practices.line_length',
+        'best_practices.missing_docstring', 'best_practices.mixed_indentation',
+        'best_practices.multiple_statements', 'best_practices.naming',
+        'best_practices.too_many_parameters', 'performance.global_could_be_local',
+        'performance.unused_global_variable'
+    })
+    
+    def analyze(self, content: str, file_path: Path, lines: List[str],
+                line_kind: Optional[bytearray] = None) -> List[Dict[str, Any]]:
         """Analyser la qualité du code PHP"""
         issues = []
         
+        if line_kind is None:
+            line_kind = classify_lines(lines)
+        
         # Détecter les problèmes de variables globales
-        self._detect_unused_global_variables(content, file_path, lines, issues)
+        self._detect_unused_global_variables(content, file_path, lines, line_kind, issues)
         
         # Analyser ligne par ligne
         for line_num, line in enumerate(lines, 1):
             line_stripped = line.strip()
             
             # Ignorer les commentaires et directives Blade
-            if self._is_comment_line(line) or self._is_blade_directive(line):
+            if line_kind[line_num - 1] or self._is_blade_directive(line):
                 continue
             
             # Détecter les problèmes de style et bonnes pratiques
@@ -45,7 +64,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
         return issues
     
     def _detect_unused_global_variables(self, content: str, file_path: Path, lines: List[str], 
-                                      issues: List[Dict[str, Any]]) -> None:
+                                      line_kind: bytearray, issues: List[Dict[str, Any]]) -> None:
         """Détecter les variables globales inutilisées ou qui pourraient être locales"""
         # Dictionnaires pour tracker les variables globales
         global_declarations = {}  # ligne -> {var_name, function_name}
@@ -84,7 +103,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
             line_stripped = line.strip()
             
             # Ignorer les commentaires
-            if self._is_comment_line(line):
+            if line_kind[line_num - 1] == LINE_COMMENT:
                 continue
             
             # Déterminer dans quelle fonction on se trouve
@@ -191,7 +210,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
                 'warning',
                 'best_practices',
                 'Utiliser soit des espaces soit des tabulations de manière cohérente',
-                line.strip()
+                line_stripped
             ))
     
     def _detect_naming_issues(self, line_stripped: str, line_num: int, file_path: Path, 
@@ -222,7 +241,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
                         'info',
                         'best_practices',
                         'Utiliser des noms de variables descriptifs et explicites',
-                        line.strip()
+                        line_stripped
                     ))
                 break
         
@@ -238,7 +257,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
                 'info',
                 'best_practices',
                 'Utiliser des noms de fonctions descriptifs qui expliquent leur rôle',
-                line.strip()
+                line_stripped
             ))
     
     def _detect_complexity_issues(self, line_stripped: str, line_num: int, file_path: Path, 
@@ -259,7 +278,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
                         'warning',
                         'best_practices',
                         'Considérer regrouper les paramètres en objet ou diviser la fonction',
-                        line.strip()
+                        line_stripped
                     ))
         
         # Conditions trop complexes
@@ -278,7 +297,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
                     'warning',
                     'best_practices',
                     'Simplifier la condition ou utiliser des variables intermédiaires',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
@@ -298,7 +317,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
                     'warning',
                     'best_practices',
                     'Séparer chaque instruction sur sa propre ligne',
-                    line.strip()
+                    line_stripped
                 ))
         
         # Accolades mal placées (style K&R vs Allman) - Seulement pour les fonctions, pas les classes
@@ -318,7 +337,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
                     'info',
                     'best_practices',
                     'Considérer placer l\'accolade ouvrante sur la même ligne (style K&R) pour les fonctions',
-                    line.strip()
+                    line_stripped
                 ))
     
     def _detect_documentation_issues(self, line_stripped: str, line_num: int, file_path: Path, 
@@ -347,7 +366,7 @@ class CodeQualityAnalyzer(BaseAnalyzer):
                     'info',
                     'best_practices',
                     'Ajouter un commentaire de documentation pour les fonctions publiques',
-                    line.strip()
+                    line_stripped
                 ))
     
     def _get_current_function(self, line_num: int, function_boundaries: List[Dict]) -> str:
@@ -453,30 +472,9 @@ class CodeQualityAnalyzer(BaseAnalyzer):
                     
         return statement_count
 
-    def _is_comment_line(self, line: str) -> bool:
-        """Vérifier si une ligne est un commentaire"""
-        line_stripped = line.strip()
-        return (line_stripped.startswith('//') or 
-                line_stripped.startswith('/*') or 
-                line_stripped.startswith('*') or
-                line_stripped.startswith('#') or
-                line_stripped == '*/')
-
     def _is_blade_directive(self, line: str) -> bool:
-        """Vérifier si une ligne contient une directive Blade Laravel"""
-        line_stripped = line.strip()
-        blade_patterns = [
-            r'@[a-zA-Z_][a-zA-Z0-9_]*',  # @directive
-            r'{{\s*.*\s*}}',             # {{ variable }}
-            r'{!!\s*.*\s*!!}',           # {!! html !!}
-            r'@php\b',                   # @php
-            r'@endphp\b',               # @endphp
-        ]
-        
-        for pattern in blade_patterns:
-            if re.search(pattern, line_stripped):
-                return True
-        return False
+        """Vérifier si une ligne contient une directive ou un affichage Blade"""
+        return ('@' in line or '{' in line) and _BLADE_SYNTAX_RE.search(line) is not None
 
     def _get_line_length_suggestion(self, line: str, line_stripped: str) -> str:
         """Générer une suggestion spécifique pour raccourcir une ligne trop longue"""
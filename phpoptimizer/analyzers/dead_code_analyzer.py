@@ -11,16 +11,26 @@ Detects unreachable code patterns including:
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import re
-from .base_analyzer import BaseAnalyzer
+from .base_analyzer import BaseAnalyzer, LINE_COMMENT, classify_lines
 
 
 class DeadCodeAnalyzer(BaseAnalyzer):
     """Analyzer for detecting dead code patterns"""
     
-    def analyze(self, content: str, file_path: Path, lines: List[str]) -> List[Dict[str, Any]]:
+    # Règles dont cet analyseur peut produire des problèmes
+    rule_names = frozenset({
+        'dead_code.always_false_condition', 'dead_code.unreachable_after_break',
+        'dead_code.unreachable_after_return'
+    })
+    
+    def analyze(self, content: str, file_path: Path, lines: List[str],
+                line_kind: Optional[bytearray] = None) -> List[Dict[str, Any]]:
         """Analyze PHP code for dead code patterns"""
         issues = []
         
+        if line_kind is None:
+            line_kind = classify_lines(lines)
+        
         # Track function/method boundaries and control flow
         in_function = False
         brace_level = 0
@@ -29,14 +39,14 @@ class DeadCodeAnalyzer(BaseAnalyzer):
             stripped = line.strip()
             
             # Skip empty lines and comments
-            if not stripped or self._is_comment_line(stripped):
+            if not stripped or line_kind[line_num - 1] == LINE_COMMENT:
                 continue
             
             # Track brace levels for scope analysis
             brace_level += stripped.count('{') - stripped.count('}')
             
             # Check for unreachable code after flow control statements
-            unreachable_issue = self._check_unreachable_after_flow_control(lines, line_num - 1)
+            unreachable_issue = self._check_unreachable_after_flow_control(lines, line_kind, line_num - 1)
             if unreachable_issue:
                 issues.append(self._create_issue(
                     'dead_code.unreachable_after_return',
@@ -69,7 +79,7 @@ class DeadCodeAnalyzer(BaseAnalyzer):
                 ))
             
             # Check for unreachable code after break/continue
-            break_continue_issue = self._check_unreachable_after_break_continue(lines, line_num - 1)
+            break_continue_issue = self._check_unreachable_after_break_continue(lines, line_kind, line_num - 1)
             if break_continue_issue:
                 issues.append(self._create_issue(
                     'dead_code.unreachable_after_break',
@@ -88,7 +98,8 @@ class DeadCodeAnalyzer(BaseAnalyzer):
         
         return issues
     
-    def _check_unreachable_after_flow_control(self, lines: List[str], current_index: int) -> Optional[Dict[str, Any]]:
+    def _check_unreachable_after_flow_control(self, lines: List[str], line_kind: bytearray,
+                                              current_index: int) -> Optional[Dict[str, Any]]:
         """Check for unreachable code after return/exit/die/throw statements"""
         if current_index >= len(lines):
             return None
@@ -100,7 +111,7 @@ class DeadCodeAnalyzer(BaseAnalyzer):
             prev_line = lines[i].strip()
             
             # Skip empty lines and comments
-            if not prev_line or self._is_comment_line(prev_line):
+            if not prev_line or line_kind[i] == LINE_COMMENT:
                 continue
             
             # Check if previous line ends with flow control statement
@@ -136,7 +147,8 @@ class DeadCodeAnalyzer(BaseAnalyzer):
         
         return False
     
-    def _check_unreachable_after_break_continue(self, lines: List[str], current_index: int) -> bool:
+    def _check_unreachable_after_break_continue(self, lines: List[str], line_kind: bytearray,
+                                               current_index: int) -> bool:
         """Check for unreachable code after break/continue statements"""
         if current_index >= len(lines):
             return False
@@ -147,7 +159,7 @@ class DeadCodeAnalyzer(BaseAnalyzer):
         for i in range(current_index - 1, max(0, current_index - 2), -1):
             prev_line = lines[i].strip()
             
-            if not prev_line or self._is_comment_line(prev_line):
+            if not prev_line or line_kind[i] == LINE_COMMENT:
                 continue
             
             # Check if previous line is break or continue
@@ -8,17 +8,23 @@ remplacés par des appels directs pour améliorer les performances.
 import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from .base_analyzer import BaseAnalyzer
+from .base_analyzer import BaseAnalyzer, LINE_COMMENT, classify_lines
 
 
 class DynamicCallsAnalyzer(BaseAnalyzer):
     """Analyseur pour la réduction des appels dynamiques."""
     
-    def __init__(self, config=None):
-        super().__init__(config)
+    # Règles dont cet analyseur peut produire des problèmes
+    rule_names = frozenset({
+        'performance.dynamic_function_call', 'performance.dynamic_method_call'
+    })
+    
+    def __init__(self, config=None, enabled_rules=None):
+        super().__init__(config, enabled_rules)
         self.name = "Dynamic Calls Analyzer"
         self.description = "Détecte les appels dynamiques qui peuvent être optimisés"
-    def analyze(self, content: str, file_path: Path, lines: List[str]) -> List[Dict[str, Any]]:
+    def analyze(self, content: str, file_path: Path, lines: List[str],
+                line_kind: Optional[bytearray] = None) -> List[Dict[str, Any]]:
         """
         Analyse un fichier pour détecter les appels dynamiques optimisables.
         
@@ -32,6 +38,9 @@ class DynamicCallsAnalyzer(BaseAnalyzer):
         """
         issues = []
         
+        if line_kind is None:
+            line_kind = classify_lines(lines)
+        
         # Stocker les assignations de variables pour détecter les valeurs constantes
         variable_assignments = {}
         
@@ -40,7 +49,7 @@ class DynamicCallsAnalyzer(BaseAnalyzer):
             line_stripped = line.strip()
             
             # Ignorer les commentaires et lignes vides
-            if self._is_comment_line(line) or not line_stripped:
+            if line_kind[line_num - 1] == LINE_COMMENT or not line_stripped:
                 continue
                 
             # Détecter les assignations simples avec valeurs constantes
@@ -51,7 +60,7 @@ class DynamicCallsAnalyzer(BaseAnalyzer):
             line_stripped = line.strip()
             
             # Ignorer les commentaires et lignes vides
-            if self._is_comment_line(line) or not line_stripped:
+            if line_kind[line_num - 1] == LINE_COMMENT or not line_stripped:
                 continue
             
             # Détecter les appels de méthodes dynamiques
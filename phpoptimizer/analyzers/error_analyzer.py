@@ -4,23 +4,57 @@ Analyseur spécialisé pour la détection d'erreurs
 
 import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-from .base_analyzer import BaseAnalyzer
+from .base_analyzer import BaseAnalyzer, classify_lines
+
+
+# Fautes de frappe courantes : (faute, motif compilé, correction), dans l'ordre de priorité
+_COMMON_TYPOS = tuple(
+    (typo, re.compile(rf'\b{typo}\b', re.IGNORECASE), correction)
+    for typo, correction in (
+        ('echp', 'echo'),
+        ('prnt', 'print'),
+        ('var_dumped', 'var_dump'),
+        ('vardump', 'var_dump'),
+        ('lenght', 'length'),
+        ('widht', 'width'),
+        ('heigh', 'height'),
+        ('retrun', 'return'),
+        ('fucntion', 'function'),
+        ('calss', 'class'),
+        ('pubilc', 'public'),
+        ('privte', 'private'),
+        ('protcted', 'protected'),
+    )
+)
 
 
 class ErrorAnalyzer(BaseAnalyzer):
     """Analyseur spécialisé pour la détection d'erreurs de code"""
     
-    def analyze(self, content: str, file_path: Path, lines: List[str]) -> List[Dict[str, Any]]:
+    # Règles dont cet analyseur peut produire des problèmes
+    rule_names = frozenset({
+        'error.always_true_condition', 'error.assignment_in_condition',
+        'error.incorrect_argument_count', 'error.null_method_call', 'error.return_in_loop',
+        'error.string_math_operation', 'error.syntax_braces', 'error.syntax_parentheses',
+        'error.syntax_semicolon', 'error.type_comparison', 'error.typo',
+        'error.unclosed_quotes', 'error.uninitialized_variable'
+    })
+    
+    def analyze(self, content: str, file_path: Path, lines: List[str],
+                line_kind: Optional[bytearray] = None) -> List[Dict[str, Any]]:
         """Analyser les erreurs dans le code PHP"""
         issues = []
         
+        if line_kind is None:
+            line_kind = classify_lines(lines)
+        
         for line_num, line in enumerate(lines, 1):
             line_stripped = line.strip()
             
             # Ignorer les commentaires et directives Blade
-            if self._is_comment_line(line) or self._is_blade_directive(line):
+            if line_kind[line_num - 1]:
                 continue
             
             # Détecter les erreurs de syntaxe communes
@@ -65,7 +99,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                 'error',
                 'error',
                 'Vérifier que toutes les parenthèses sont correctement fermées',
-                line.strip()
+                line_stripped
             ))
         
         # Accolades non ouvertes après structure de contrôle
@@ -78,7 +112,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                 'warning',
                 'error',
                 'Ajouter une accolade ouvrante { ou une instruction sur la ligne suivante',
-                line.strip()
+                line_stripped
             ))
         
         # Point-virgule manquant
@@ -104,7 +138,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                 'warning',
                 'error',
                 'Ajouter un point-virgule à la fin de l\'instruction',
-                line.strip()
+                line_stripped
             ))
     
     def _detect_null_method_calls(self, line_stripped: str, line_num: int, file_path: Path, 
@@ -198,7 +232,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                         'warning',
                         'error',
                         'Vérifier que la variable n\'est pas null avant l\'appel de méthode avec isset() ou une condition',
-                        line.strip()
+                        line_stripped
                     ))
                 break
     
@@ -303,7 +337,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                         'warning',
                         'error',
                         f'S\'assurer que {var_name} est initialisée avant utilisation',
-                        line.strip()
+                        line_stripped
                     ))
     
     def _detect_function_argument_errors(self, line_stripped: str, line_num: int, file_path: Path, 
@@ -344,7 +378,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                         'error',
                         'error',
                         f'Vérifier la documentation de {func_name}() et corriger le nombre d\'arguments',
-                        line.strip()
+                        line_stripped
                     ))
     
     def _detect_assignment_in_conditions(self, line_stripped: str, line_num: int, file_path: Path, 
@@ -396,31 +430,16 @@ class ErrorAnalyzer(BaseAnalyzer):
                         'error',
                         'error',
                         'Remplacer = par == pour une comparaison ou === pour une comparaison stricte',
-                        line.strip()
+                        line_stripped
                     ))
                 break
     
     def _detect_typos(self, line_stripped: str, line_num: int, file_path: Path, 
                      line: str, issues: List[Dict[str, Any]]) -> None:
         """Détecter les erreurs de typographie courantes"""
-        common_typos = {
-            'echp': 'echo',
-            'prnt': 'print',
-            'var_dumped': 'var_dump',
-            'vardump': 'var_dump',
-            'lenght': 'length',
-            'widht': 'width',
-            'heigh': 'height',
-            'retrun': 'return',
-            'fucntion': 'function',
-            'calss': 'class',
-            'pubilc': 'public',
-            'privte': 'private',
-            'protcted': 'protected'
-        }
-        
-        for typo, correction in common_typos.items():
-            if re.search(rf'\b{typo}\b', line_stripped, re.IGNORECASE):
+        line_lower = line_stripped.lower()
+        for typo, pattern, correction in _COMMON_TYPOS:
+            if typo in line_lower and pattern.search(line_stripped):
                 issues.append(self._create_issue(
                     'error.typo',
                     f'Erreur de typographie: "{typo}"',
@@ -429,7 +448,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                     'warning',
                     'error',
                     f'Corriger en: "{correction}"',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
@@ -473,7 +492,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                 'info',  # Changed from 'error' to 'info'
                 'error',
                 'Vérifier que tous les guillemets simples sont correctement fermés',
-                line.strip()
+                line_stripped
             ))
         
         if double_quote_count % 2 != 0:
@@ -485,7 +504,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                 'info',  # Changed from 'error' to 'info'
                 'error',
                 'Vérifier que tous les guillemets doubles sont correctement fermés',
-                line.strip()
+                line_stripped
             ))
     
     def _count_unescaped_quotes(self, text: str, quote_char: str) -> int:
@@ -521,7 +540,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                 'warning',
                 'error',
                 'Vérifier que les valeurs sont numériques ou utiliser la concaténation (.)',
-                line.strip()
+                line_stripped
             ))
         
         # Comparaison avec des types différents
@@ -542,7 +561,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                     'warning',
                     'error',
                     'Vérifier que les types sont compatibles ou utiliser une conversion explicite',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
@@ -566,7 +585,7 @@ class ErrorAnalyzer(BaseAnalyzer):
                     'warning',
                     'error',
                     'Vérifier la logique de la condition',
-                    line.strip()
+                    line_stripped
                 ))
                 break
         
@@ -580,5 +599,5 @@ class ErrorAnalyzer(BaseAnalyzer):
                 'info',
                 'error',
                 'Vérifier si le return est intentionnel ou si une variable de contrôle serait plus appropriée',
-                line.strip()
+                line_stripped
             ))
@@ -4,15 +4,26 @@ Analyseur spécialisé pour les boucles et leur performance
 
 import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-from .base_analyzer import BaseAnalyzer
+from .base_analyzer import BaseAnalyzer, LINE_COMMENT, classify_lines
 
 
 class LoopAnalyzer(BaseAnalyzer):
     """Analyseur spécialisé pour les problèmes liés aux boucles"""
     
-    def analyze(self, content: str, file_path: Path, lines: List[str]) -> List[Dict[str, Any]]:
+    # Règles dont cet analyseur peut produire des problèmes
+    rule_names = frozenset({
+        'error.foreach_non_iterable', 'performance.deeply_nested_loops',
+        'performance.function_in_loop', 'performance.heavy_function_in_loop',
+        'performance.inefficient_loops', 'performance.linear_search_in_loop',
+        'performance.loop_fusion_opportunity', 'performance.nested_loop_same_array',
+        'performance.object_creation_in_loop', 'performance.query_in_loop',
+        'performance.sort_in_loop'
+    })
+    
+    def analyze(self, content: str, file_path: Path, lines: List[str],
+                line_kind: Optional[bytearray] = None) -> List[Dict[str, Any]]:
         """Analyser les problèmes de boucles dans le code PHP"""
         issues = []
         
@@ -20,14 +31,17 @@ class LoopAnalyzer(BaseAnalyzer):
         loop_stack = []
         in_loop = False
         
+        if line_kind is None:
+            line_kind = classify_lines(lines)
+        
         # Analyser les boucles consécutives pour la fusion
-        self._detect_consecutive_loop_fusion(lines, file_path, issues)
+        self._detect_consecutive_loop_fusion(lines, line_kind, file_path, issues)
         
         for line_num, line in enumerate(lines, 1):
             line_stripped = line.strip()
             
             # Ignorer les commentaires et directives Blade
-            if self._is_comment_line(line) or self._is_blade_directive(line):
+            if line_kind[line_num - 1]:
                 continue
             
             # Détecter le début d'une boucle
@@ -72,7 +86,8 @@ class LoopAnalyzer(BaseAnalyzer):
         
         return issues
 
-    def _detect_consecutive_loop_fusion(self, lines: List[str], file_path: Path, issues: List[Dict[str, Any]]) -> None:
+    def _detect_consecutive_loop_fusion(self, lines: List[str], line_kind: bytearray, file_path: Path,
+                                        issues: List[Dict[str, Any]]) -> None:
         """Détecter les opportunités de fusion de boucles consécutives"""
         loops = []
         i = 0
@@ -81,7 +96,7 @@ class LoopAnalyzer(BaseAnalyzer):
             line_stripped = lines[i].strip()
             
             # Ignorer les commentaires et lignes vides
-            if self._is_comment_line(lines[i]) or not line_stripped:
+            if line_kind[i] == LINE_COMMENT or not line_stripped:
                 i += 1
                 continue
             
@@ -168,7 +183,7 @@ class LoopAnalyzer(BaseAnalyzer):
                 'warning',
                 'performance',
                 'Stocker count() dans une variable avant la boucle: $length = count($array); for($i = 0; $i < $length; $i++)',
-                line.strip()
+                line_stripped
             ))
     
     def _detect_deeply_nested_loops(self, loop_stack: List[int], line_num: int, file_path: Path, 
@@ -199,7 +214,7 @@ class LoopAnalyzer(BaseAnalyzer):
                 'warning',
                 'performance',
                 'Stocker le résultat dans une variable avant la boucle',
-                line.strip()
+                line_stripped
             ))
     
     def _detect_queries_in_loop(self, line_stripped: str, line_num: int, file_path: Path, 
@@ -214,7 +229,7 @@ class LoopAnalyzer(BaseAnalyzer):
                 'error',
                 'performance',
                 'Extraire la requête hors de la boucle ou utiliser une requête groupée',
-                line.strip()
+                line_stripped
             ))
     
     def _detect_heavy_functions_in_loop(self, line_stripped: str, line_num: int, file_path: Path, 
@@ -249,7 +264,7 @@ class LoopAnalyzer(BaseAnalyzer):
                     'warning',
                     'performance',
                     f'Extraire {func}() hors de la boucle et mettre en cache le résultat',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
@@ -283,7 +298,7 @@ class LoopAnalyzer(BaseAnalyzer):
                         'warning',
                         'performance',
                         f'Extraire la création de {class_name} hors de la boucle et réutiliser l\'instance',
-                        line.strip()
+                        line_stripped
                     ))
                     break
     
@@ -302,7 +317,7 @@ class LoopAnalyzer(BaseAnalyzer):
                     'warning',
                     'performance',
                     f'Extraire le tri {sort_func}() hors de la boucle pour améliorer les performances',
-                    line.strip()
+                    line_stripped
                 ))
                 break
         
@@ -318,7 +333,7 @@ class LoopAnalyzer(BaseAnalyzer):
                     'warning',
                     'performance',
                     f'Convertir le tableau en clé-valeur ou utiliser array_flip() avant la boucle pour une recherche O(1)',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
@@ -356,7 +371,7 @@ class LoopAnalyzer(BaseAnalyzer):
                                         'warning',
                                         'performance',
                                         'Revoir l\'algorithme pour éviter le parcours quadratique du même tableau',
-                                        line.strip()
+                                        line_stripped
                                     ))
                                     break
                             
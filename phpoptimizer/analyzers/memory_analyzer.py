@@ -4,27 +4,51 @@ Analyseur spécialisé pour la gestion mémoire
 
 import re
 from pathlib import Path
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Optional, Set
 
-from .base_analyzer import BaseAnalyzer
+from .base_analyzer import BaseAnalyzer, LINE_COMMENT, classify_lines
+
+
+# Ressources à libérer : (ouverture, motif compilé, fermeture, description)
+_RESOURCE_PATTERNS = tuple(
+    (open_func, re.compile(rf'\b{open_func}\s*\('), close_func, description)
+    for open_func, close_func, description in (
+        ('fopen', 'fclose', 'Fichier ouvert non fermé'),
+        ('curl_init', 'curl_close', 'Session cURL non fermée'),
+        ('mysqli_connect', 'mysqli_close', 'Connexion MySQL non fermée'),
+        ('imagecreate', 'imagedestroy', 'Image GD non détruite'),
+        ('opendir', 'closedir', 'Répertoire ouvert non fermé'),
+    )
+)
 
 
 class MemoryAnalyzer(BaseAnalyzer):
     """Analyseur spécialisé pour les problèmes de gestion mémoire"""
     
-    def analyze(self, content: str, file_path: Path, lines: List[str]) -> List[Dict[str, Any]]:
+    # Règles dont cet analyseur peut produire des problèmes
+    rule_names = frozenset({
+        'performance.array_merge_memory', 'performance.circular_reference',
+        'performance.excessive_memory', 'performance.memory_management',
+        'performance.resource_leak'
+    })
+    
+    def analyze(self, content: str, file_path: Path, lines: List[str],
+                line_kind: Optional[bytearray] = None) -> List[Dict[str, Any]]:
         """Analyser les problèmes de gestion mémoire dans le code PHP"""
         issues = []
         
+        if line_kind is None:
+            line_kind = classify_lines(lines)
+        
         # Détecter les problèmes de gestion mémoire
-        self._detect_memory_management_issues(content, file_path, lines, issues)
+        self._detect_memory_management_issues(content, file_path, lines, line_kind, issues)
         
         # Analyser ligne par ligne pour d'autres problèmes
         for line_num, line in enumerate(lines, 1):
             line_stripped = line.strip()
             
             # Ignorer les commentaires et directives Blade
-            if self._is_comment_line(line) or self._is_blade_directive(line):
+            if line_kind[line_num - 1]:
                 continue
             
             # Détecter les fuites mémoire potentielles
@@ -39,7 +63,7 @@ class MemoryAnalyzer(BaseAnalyzer):
         return issues
     
     def _detect_memory_management_issues(self, content: str, file_path: Path, lines: List[str], 
-                                       issues: List[Dict[str, Any]]) -> None:
+                                       line_kind: bytearray, issues: List[Dict[str, Any]]) -> None:
         """Détecter les problèmes de gestion mémoire (oublis de unset())"""
         # Patterns pour détecter les gros tableaux
         large_array_patterns = [
@@ -67,7 +91,7 @@ class MemoryAnalyzer(BaseAnalyzer):
                         large_variables.add(var_name)
                         
                         # Vérifier si cette variable est libérée avec unset()
-                        if not self._is_variable_unset(content, var_name, line_num):
+                        if not self._is_variable_unset(lines, line_kind, var_name, line_num):
                             issues.append(self._create_issue(
                                 'performance.memory_management',
                                 f'Gros tableau ${var_name} ({size} éléments) non libéré avec unset()',
@@ -95,7 +119,7 @@ class MemoryAnalyzer(BaseAnalyzer):
                                         var_name = var_match.group(1)
                                         large_variables.add(var_name)
                                         
-                                        if not self._is_variable_unset(content, var_name, i + 1):
+                                        if not self._is_variable_unset(lines, line_kind, var_name, i + 1):
                                             issues.append(self._create_issue(
                                                 'performance.memory_management',
                                                 f'Tableau ${var_name} rempli dans une boucle ({loop_size} itérations) non libéré',
@@ -112,16 +136,8 @@ class MemoryAnalyzer(BaseAnalyzer):
                             line: str, issues: List[Dict[str, Any]]) -> None:
         """Détecter les fuites mémoire potentielles"""
         # Ressources non libérées
-        resource_patterns = [
-            ('fopen', 'fclose', 'Fichier ouvert non fermé'),
-            ('curl_init', 'curl_close', 'Session cURL non fermée'),
-            ('mysqli_connect', 'mysqli_close', 'Connexion MySQL non fermée'),
-            ('imagecreate', 'imagedestroy', 'Image GD non détruite'),
-            ('opendir', 'closedir', 'Répertoire ouvert non fermé')
-        ]
-        
-        for open_func, close_func, description in resource_patterns:
-            if re.search(rf'\b{open_func}\s*\(', line_stripped):
+        for open_func, open_pattern, close_func, description in _RESOURCE_PATTERNS:
+            if open_func in line_stripped and open_pattern.search(line_stripped):
                 # Vérifier si la ressource est fermée dans le même contexte de fonction
                 is_closed = self._is_resource_properly_closed(line_num, file_path, open_func, close_func)
                 if not is_closed:
@@ -133,7 +149,7 @@ class MemoryAnalyzer(BaseAnalyzer):
                         'warning',
                         'performance',
                         f'S\'assurer d\'appeler {close_func}() après utilisation de {open_func}()',
-                        line.strip()
+                        line_stripped
                     ))
                 break
 
@@ -162,10 +178,11 @@ class MemoryAnalyzer(BaseAnalyzer):
             resource_var = var_match.group(1)
             
             # Chercher l'appel de fermeture dans le scope de la fonction
+            close_pattern = re.compile(rf'{close_func}\s*\(\s*\${resource_var}\s*\)')
             for i in range(function_start, function_end):
                 if i < len(lines):
                     line = lines[i].strip()
-                    if re.search(rf'{close_func}\s*\(\s*\${resource_var}\s*\)', line):
+                    if close_pattern.search(line):
                         return True
             
             # Si on arrive ici, la ressource n'est pas fermée dans la fonction
@@ -232,7 +249,7 @@ class MemoryAnalyzer(BaseAnalyzer):
                     'warning',
                     'performance',
                     'Considérer un traitement par blocs ou streaming pour économiser la mémoire',
-                    line.strip()
+                    line_stripped
                 ))
                 break
         
@@ -246,7 +263,7 @@ class MemoryAnalyzer(BaseAnalyzer):
                 'info',
                 'performance',
                 'Considérer l\'opérateur + ou des boucles pour économiser la mémoire',
-                line.strip()
+                line_stripped
             ))
     
     def _detect_circular_references(self, line_stripped: str, line_num: int, file_path: Path, 
@@ -269,24 +286,23 @@ class MemoryAnalyzer(BaseAnalyzer):
                     'warning',
                     'performance',
                     'Éviter les références circulaires qui peuvent causer des fuites mémoire',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
-    def _is_variable_unset(self, content: str, var_name: str, after_line: int) -> bool:
+    def _is_variable_unset(self, lines: List[str], line_kind: bytearray, var_name: str, after_line: int) -> bool:
         """
         Vérifier si une variable est libérée avec unset() après sa déclaration.
         
         Args:
-            content: Le contenu du fichier PHP
+            lines: Les lignes du fichier PHP
+            line_kind: Classification des lignes (commentaires ignorés)
             var_name: Le nom de la variable à rechercher (sans le $)
             after_line: La ligne après laquelle commencer la recherche (1-indexed)
             
         Returns:
             True si un unset() de cette variable est trouvé dans la portée actuelle
         """
-        lines = content.split('\n')
-        
         # Calculer le niveau d'accolades initial pour déterminer la portée
         initial_brace_level = self._calculate_brace_level(lines, after_line - 1)
         
@@ -295,7 +311,7 @@ class MemoryAnalyzer(BaseAnalyzer):
             line = lines[i].strip()
             
             # Ignorer les lignes vides et les commentaires
-            if not line or self._is_comment_line(line):
+            if not line or line_kind[i] == LINE_COMMENT:
                 continue
             
             # Vérifier si la variable est dans un unset()
@@ -2,38 +2,202 @@
 Analyseur spécialisé pour les problèmes de performance
 """
 
+import bisect
 import re
+import sys
+from array import array
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import DefaultDict, List, Dict, Any, Optional, Sequence, Tuple
 
 
-from .base_analyzer import BaseAnalyzer
+from .base_analyzer import BaseAnalyzer, LINE_COMMENT, MAX_ANALYZED_LINE_LENGTH, classify_lines
 from ..rules.performance import ConstantPropagationRule
 
 
+# Expression mathématique du type $var = $a * $b + $c. Les espaces sont limités
+# à la ligne courante ([^\S\n]) car le motif est appliqué au contenu complet.
+_MATH_EXPR_RE = re.compile(
+    r'\$[a-zA-Z_][a-zA-Z0-9_]*[^\S\n]*=[^\S\n]*'
+    r'(\$[a-zA-Z_][a-zA-Z0-9_]*[^\S\n]*[\+\-\*\/][^\S\n]*\$[a-zA-Z_][a-zA-Z0-9_]*'
+    r'(?:[^\S\n]*[\+\-\*\/][^\S\n]*\$[a-zA-Z_][a-zA-Z0-9_]*)*)'
+)
+
+# Préfiltre unique : littéraux dont au moins un est requis par les détecteurs ligne
+# par ligne. Une ligne qui n'en contient aucun ne peut produire aucun problème.
+# Appliqué au contenu déjà passé en minuscules : la recherche reste sensible à la casse,
+# nettement plus rapide qu'IGNORECASE sur un texte contenant des caractères non ASCII.
+_LINE_PREFILTER_RE = re.compile(
+    r'unused|\$temp|\$dummy|\.='
+    r'|array_unique|array_intersect|array_diff|in_array|array_push|array_merge|count'
+    r'|preg_|file_get_contents|glob|scandir|substr|strlen|fgets|mysql_query'
+    r'|file_exists|is_file|is_dir|is_readable|is_writable'
+)
+
+# Détecteurs ligne par ligne (dans l'ordre d'exécution) et mots-clés, en minuscules,
+# dont au moins un doit figurer dans le fichier pour que le détecteur puisse s'appliquer
+_LINE_DETECTOR_TRIGGERS = (
+    ('_detect_unused_variables', ('unused', '$temp', '$dummy')),
+    ('_detect_expensive_function_calls', ('array_unique', 'array_intersect', 'array_diff', 'in_array',
+                                          'preg_match', 'file_get_contents', 'glob', 'scandir')),
+    ('_detect_inefficient_array_operations', ('array_push', 'count', 'array_merge')),
+    ('_detect_string_performance_issues', ('.=', 'substr', 'strlen')),
+    ('_detect_regex_performance_issues', ('preg_',)),
+    ('_detect_io_performance_issues', ('fgets', 'file_exists', 'is_file', 'is_dir', 'is_readable',
+                                       'is_writable', 'mysql_query')),
+)
+
+# Motifs des détecteurs ligne par ligne, chacun précédé du littéral obligatoire
+# vérifié par une simple recherche de sous-chaîne avant d'exécuter l'expression
+_VARIABLE_RE = re.compile(r'\$[a-zA-Z_][a-zA-Z0-9_]*')
+_UNUSED_VARIABLE_PATTERNS = (
+    # "unused" recherché par anticipation : un seul [a-zA-Z0-9_]* consomme le nom (pas de retour arrière quadratique)
+    ('unused', re.compile(r'\$[a-zA-Z_](?=[a-zA-Z0-9_]*unused)[a-zA-Z0-9_]*\s*=', re.IGNORECASE)),
+    ('$unused', re.compile(r'\$unused[a-zA-Z_][a-zA-Z0-9_]*\s*=', re.IGNORECASE)),
+    ('$temp', re.compile(r'\$temp[0-9]*\s*=.*(?!temp)', re.IGNORECASE)),  # variables temp non réutilisées
+    ('$dummy', re.compile(r'\$dummy[a-zA-Z0-9_]*\s*=', re.IGNORECASE)),
+)
+# Fonctions coûteuses simples (nom suivi d'une parenthèse) : une seule alternance par ligne
+_EXPENSIVE_FUNCS_RE = re.compile(r'\b(array_unique|array_intersect|array_diff|glob|scandir)\s*\(', re.IGNORECASE)
+# Table par ordre de priorité : (littéral, motif conditionnel ou None, nom affiché, suggestion).
+# Seules les entrées avec contrainte supplémentaire gardent leur propre motif.
+_EXPENSIVE_FUNCTION_PATTERNS = (
+    ('array_unique', None, 'array_unique', 'array_flip puis array_keys peut être plus rapide'),
+    ('array_intersect', None, 'array_intersect', 'Considérer array_intersect_key si approprié'),
+    ('array_diff', None, 'array_diff', 'Considérer array_diff_key si approprié'),
+    ('in_array', re.compile(r'\bin_array.*true\s*\(', re.IGNORECASE),
+     'in_array.*true', 'Utiliser array_key_exists ou array_flip pour de gros tableaux'),
+    ('preg_match', re.compile(r'\bpreg_match.*\.\*\s*\(', re.IGNORECASE),
+     'preg_match.*', 'Expression régulière avec .* peut être lente'),
+    ('file_get_contents', re.compile(r'\bfile_get_contents.*http\s*\(', re.IGNORECASE),
+     'file_get_contents.*http', 'Considérer cURL avec timeout pour les URL HTTP'),
+    ('glob', None, 'glob', 'Considérer opendir/readdir pour de gros répertoires'),
+    ('scandir', None, 'scandir', 'Filtrer les résultats tôt si possible'),
+)
+# [^,)]+ absorbe déjà les espaces : pas de \s* autour de l'élément ajouté
+_ARRAY_PUSH_SINGLE_RE = re.compile(r'array_push\s*\(\s*\$[a-zA-Z_][a-zA-Z0-9_]*\s*,[^,)]+\)')
+# count(...) > 0 implique la comparaison générique count(...) [><=!]+ \d+
+_COUNT_GREATER_ZERO_RE = re.compile(r'count\s*\([^)]+\)\s*>\s*0')
+# array_merge(... $var, array(...)) en deux temps : l'appel jusqu'à la première ')' (suivie
+# d'une autre ')'), puis `$var, array(` cherché dans ses arguments. Même résultat que le motif
+# d'origine array_merge\s*\([^)]*\$var\s*,\s*array\s*\([^)]*\)\s*\), sans son retour
+# arrière quadratique sur les candidats `$var, array(` d'une même ligne
+_ARRAY_MERGE_CALL_RE = re.compile(r'array_merge\s*\(([^)]*)\)\s*\)')
+_ARRAY_MERGE_SMALL_ARRAY_RE = re.compile(r'\$[a-zA-Z_][a-zA-Z0-9_]*\s*,\s*array\s*\(')
+_STRING_CONCAT_RE = re.compile(r'\$[a-zA-Z_][a-zA-Z0-9_]*\s*\.=')
+_SUBSTR_FIRST_CHAR_RE = re.compile(r'substr\s*\([^,]+,\s*0\s*,\s*1\s*\)')
+_STRLEN_COMPARISON_RE = re.compile(r'strlen\s*\([^)]+\)\s*[><=!]+\s*0')
+_FGETS_FOPEN_RE = re.compile(r'fgets\s*\(.*fopen\s*\(')
+# Fonctions de vérification de fichier, par ordre de priorité de signalement
+_FILE_CHECK_FUNCTIONS = ('file_exists', 'is_file', 'is_dir', 'is_readable', 'is_writable')
+_FILE_CHECK_RE = re.compile(
+    r'\b(file_exists|is_file|is_dir|is_readable|is_writable)\s*\([^)]*\$[a-zA-Z_][a-zA-Z0-9_]*\)'
+)
+_MYSQL_QUERY_RE = re.compile(r'mysql_query\s*\(.*\$')
+
+# Motifs de _detect_regex_performance_issues, compilés une seule fois
+# (vérifiés contre le ReDoS par tests/test_regex_safety.py)
+_REGEX_PERFORMANCE_PATTERNS = (
+    (re.compile(r'preg_match\s*\([^)]*\.\*\.\*', re.IGNORECASE),
+     'Expression régulière avec .*.* peut être très lente'),
+    (re.compile(r'preg_match\s*\([^)]*\.\+\.\+', re.IGNORECASE),
+     'Expression régulière avec .+.+ peut être très lente'),
+    (re.compile(r'preg_replace\s*\([^)]*\.\*', re.IGNORECASE),
+     'preg_replace avec .* peut être inefficace'),
+    (re.compile(r'preg_match_all\s*\([^)]*\.\*', re.IGNORECASE),
+     'preg_match_all avec .* peut consommer beaucoup de mémoire'),
+)
+_REGEX_OVERKILL_PATTERNS = (
+    (re.compile(r'preg_match\s*\([\'"][^\'"\[\]{}()*+?.\\|^$]*[\'"]'),
+     'Expression régulière simple'),
+    (re.compile(r'preg_replace\s*\([\'"][^\'"\[\]{}()*+?.\\|^$]*[\'"].*[\'"][^\'"\[\]{}()*+?.\\|^$]*[\'"]'),
+     'Remplacement simple'),
+)
+
+# Motifs de _detect_repetitive_array_access et de ses auxiliaires
+_FUNCTION_START_RE = re.compile(
+    r'\b(?:function|public|private|protected|static)\s+(?:static\s+)?(?:function\s+)?'
+    r'([a-zA-Z_][a-zA-Z0-9_]*)\s*\('
+)
+# Une seule répétition par suffixe : (?:X)+(?:X)* accepte les mêmes chaînes que (?:X)+
+_ARRAY_ACCESS_RE = re.compile(r'\$[a-zA-Z_][a-zA-Z0-9_]*(?:\[[^\]]+\])+')
+_OBJECT_ACCESS_RE = re.compile(r'\$[a-zA-Z_][a-zA-Z0-9_]*(?:->[a-zA-Z_][a-zA-Z0-9_]*)+')
+_MIXED_ACCESS_RE = re.compile(r'\$[a-zA-Z_][a-zA-Z0-9_]*(?:->[a-zA-Z_][a-zA-Z0-9_]*)+(?:\[[^\]]+\])+')
+_ROOT_VARIABLE_RE = re.compile(r'(\$[a-zA-Z_][a-zA-Z0-9_]*)')
+# Parties d'un nom de variable temporaire, en un seul parcours de l'expression d'accès :
+# variable racine (en tête uniquement), clé littérale entre quotes, propriété d'objet
+_NAME_PARTS_RE = re.compile(
+    r"^\$(?P<root>[a-zA-Z_][a-zA-Z0-9_]*)"
+    r"|\['(?P<key>[^']+)'\]|\[\"(?P<dkey>[^\"]+)\"\]"
+    r"|->(?P<prop>[a-zA-Z_][a-zA-Z0-9_]*)"
+)
+
+# Fonctions PHP qui modifient le tableau passé en argument
+_ARRAY_MODIFYING_FUNCTIONS = (
+    'unset', 'array_pop', 'array_push', 'array_shift', 'array_unshift',
+    'array_splice', 'sort', 'rsort', 'asort', 'arsort', 'ksort', 'krsort',
+    'shuffle', 'array_reverse', 'array_walk', 'array_walk_recursive'
+)
+# Appel d'une fonction modifiante : capture des arguments jusqu'à la première parenthèse fermante
+_MODIFYING_CALL_RE = re.compile(r'\b(?:' + '|'.join(_ARRAY_MODIFYING_FUNCTIONS) + r')\s*\(([^)]*)')
+# Chaque fonction modifiante contient l'un de ces littéraux : rejet sans regex des autres lignes
+_MODIFYING_CALL_LITERALS = ('array_', 'sort', 'unset', 'shuffle')
+# Opérateur d'affectation (pas ==)
+_ASSIGNMENT_OP_RE = re.compile(r'=(?!=)')
+# Variable (ou suite de caractères d'identifiant après $) dans une cible ou des arguments
+_VARIABLE_TOKEN_RE = re.compile(r'\$[a-zA-Z0-9_]+')
+
+
+# Opérateurs composés (+=, .=, ...) et caractères interdits après un = simple (==, =<, =>, =!)
+_COMPOUND_ASSIGNMENT_CHARS = frozenset('+-*/.%&|^')
+_NOT_ASSIGNMENT_AFTER_EQ = frozenset('=<>!')
+
+
 class PerformanceAnalyzer(BaseAnalyzer):
     """Analyseur spécialisé pour les problèmes de performance"""
     
-    def analyze(self, content: str, file_path: Path, lines: List[str]) -> List[Dict[str, Any]]:
+    # Règles dont cet analyseur peut produire des problèmes
+    rule_names = frozenset({
+        'performance.array_merge_single', 'performance.array_push_single',
+        'performance.constant_propagation', 'performance.count_vs_empty',
+        'performance.expensive_function', 'performance.inefficient_file_reading',
+        'performance.regex_overkill', 'performance.regex_performance',
+        'performance.repeated_calculations', 'performance.repeated_file_checks',
+        'performance.repetitive_array_access', 'performance.string_concatenation',
+        'performance.strlen_vs_empty', 'performance.substr_first_char',
+        'performance.unprepared_query', 'performance.unused_variables'
+    })
+    
+    def __init__(self, config=None, enabled_rules=None):
+        """Initialiser l'analyseur avec la configuration"""
+        super().__init__(config, enabled_rules)
+        # Règle de propagation de constantes, créée à la première analyse
+        self._const_rule = None
+    
+    def analyze(self, content: str, file_path: Path, lines: List[str],
+                line_kind: Optional[bytearray] = None) -> List[Dict[str, Any]]:
         """Analyser les problèmes de performance dans le code PHP"""
         issues = []
+        # Chemin converti une seule fois puis transmis tel quel à chaque problème créé
+        file_str = str(file_path)
         # Exécuter les règles dynamiques (dont propagation de constantes)
-        config = self.config
-        # On instancie la règle avec la config globale
-        const_rule = ConstantPropagationRule(config)
-        parse_result = {'content': content, 'lines': lines, 'file_path': str(file_path)}
+        # La règle ne conserve aucun état entre deux analyses : une instance par analyseur
+        const_rule = self._const_rule
+        if const_rule is None:
+            const_rule = self._const_rule = ConstantPropagationRule(self.config)
+        parse_result = {'content': content, 'lines': lines, 'file_path': file_str}
         try:
             const_issues = const_rule.analyze(parse_result)
+            # Ajouter le chemin du fichier si absent
             for issue in const_issues:
-                # Ajouter le chemin du fichier si absent
                 if not issue.get('file_path'):
-                    issue['file_path'] = str(file_path)
-                issues.append(issue)
+                    issue['file_path'] = file_str
+            issues.extend(const_issues)
         except Exception as e:
             issues.append({
                 'rule_name': 'performance.constant_propagation',
                 'message': f'Erreur lors de la propagation de constantes: {e}',
-                'file_path': str(file_path),
+                'file_path': file_str,
                 'line': 0,
                 'column': 0,
                 'severity': 'error',
@@ -43,63 +207,78 @@ class PerformanceAnalyzer(BaseAnalyzer):
             })
         
         # Détecter les calculs répétés
-        self._detect_repeated_calculations(lines, file_path, issues)
+        self._detect_repeated_calculations(content, lines, file_str, issues)
+        
+        # Classification et lignes nettoyées calculées une seule fois pour tous les parcours
+        if line_kind is None:
+            line_kind = classify_lines(lines)
+        stripped_lines = [line.strip() for line in lines]
         
         # Détecter les accès répétitifs aux tableaux (si activé)
         if self.config.is_rule_enabled('performance.repetitive_array_access'):
-            self._detect_repetitive_array_access(lines, file_path, issues)
-        
-        # Analyser ligne par ligne
-        for line_num, line in enumerate(lines, 1):
-            line_stripped = line.strip()
-            
-            # Ignorer les commentaires et directives Blade
-            if self._is_comment_line(line) or self._is_blade_directive(line):
-                continue
-            
-            # Détecter les variables non utilisées
-            self._detect_unused_variables(line_stripped, line_num, file_path, line, issues)
+            self._detect_repetitive_array_access(stripped_lines, line_kind, file_str, issues)
+        
+        # Ne conserver que les détecteurs dont un mot-clé apparaît dans le fichier
+        content_lower = content.lower()
+        detectors = [getattr(self, name) for name, triggers in _LINE_DETECTOR_TRIGGERS
+                     if any(trigger in content_lower for trigger in triggers)]
+        if not detectors:
+            return issues
+        
+        # Seules les lignes contenant un littéral du préfiltre peuvent produire un problème :
+        # le préfiltre parcourt le contenu complet et saute à la ligne suivante après chaque
+        # correspondance, le numéro de ligne étant retrouvé par dichotomie. Les positions
+        # sont celles de content_lower (lower() peut changer la longueur, jamais les \n).
+        line_starts = self._compute_line_starts(content_lower)
+        line_count = len(line_starts)
+        prefilter = _LINE_PREFILTER_RE.search
+        match = prefilter(content_lower)
+        while match is not None:
+            line_num = self._line_number_at(line_starts, match.start())
             
-            # Détecter les fonctions coûteuses utilisées inutilement
-            self._detect_expensive_function_calls(line_stripped, line_num, file_path, line, issues)
+            # Ignorer les commentaires, directives Blade et lignes trop longues
+            line_stripped = stripped_lines[line_num - 1]
+            if not line_kind[line_num - 1] and len(line_stripped) <= MAX_ANALYZED_LINE_LENGTH:
+                line = lines[line_num - 1]
+                for detect in detectors:
+                    detect(line_stripped, line_num, file_str, line, issues)
             
-            # Détecter les opérations inefficaces sur les tableaux
-            self._detect_inefficient_array_operations(line_stripped, line_num, file_path, line, issues)
-            
-            # Détecter les problèmes de chaînes de caractères
-            self._detect_string_performance_issues(line_stripped, line_num, file_path, line, issues)
-            
-            # Détecter les problèmes de régularité d'expressions
-            self._detect_regex_performance_issues(line_stripped, line_num, file_path, line, issues)
-            
-            # Détecter les problèmes d'I/O
-            self._detect_io_performance_issues(line_stripped, line_num, file_path, line, issues)
+            if line_num >= line_count:
+                break
+            match = prefilter(content_lower, line_starts[line_num])
         
         return issues
     
-    def _detect_repeated_calculations(self, lines: List[str], file_path: Path, 
+    def _detect_repeated_calculations(self, content: str, lines: List[str], file_str: str, 
                                     issues: List[Dict[str, Any]]) -> None:
         """Détecter les calculs répétés dans le même contexte"""
-        math_expressions = {}
-        
-        for line_num, line in enumerate(lines, 1):
-            # Rechercher les expressions mathématiques du type $var = $a * $b + $c
-            match = re.search(r'\$[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*(\$[a-zA-Z_][a-zA-Z0-9_]*\s*[\+\-\*\/]\s*\$[a-zA-Z_][a-zA-Z0-9_]*(?:\s*[\+\-\*\/]\s*\$[a-zA-Z_][a-zA-Z0-9_]*)*)', line)
-            if match:
-                expr = match.group(1)
-                expr_clean = re.sub(r'\s+', ' ', expr.strip())
-                
-                # Ignorer les expressions contenant $this (référence d'objet)
-                if '$this' in expr_clean:
-                    continue
-                
-                # Ignorer les expressions trop simples
-                if not re.search(r'[\+\-\*\/]', expr_clean):
-                    continue
-                
-                if expr_clean not in math_expressions:
-                    math_expressions[expr_clean] = []
-                math_expressions[expr_clean].append((line_num, line.strip()))
+        math_expressions: DefaultDict[str, List[Tuple[int, str]]] = defaultdict(list)
+        # Liaisons locales pour la boucle chaude
+        count_newlines = content.count
+        intern = sys.intern
+        line_num = 1
+        last_offset = 0
+        last_line_num = 0
+        
+        # Un seul parcours du contenu complet ; seul le premier match de chaque ligne compte.
+        # Les matches arrivent dans l'ordre : le numéro de ligne avance par comptage incrémental.
+        for match in _MATH_EXPR_RE.finditer(content):
+            offset = match.start()
+            line_num += count_newlines('\n', last_offset, offset)
+            last_offset = offset
+            if line_num == last_line_num:
+                continue
+            last_line_num = line_num
+            
+            expr = match.group(1)
+            
+            # Ignorer les expressions contenant $this (référence d'objet)
+            if '$this' in expr:
+                continue
+            
+            # Le motif garantit déjà la présence d'un opérateur ; normaliser les espaces
+            expr_clean = ' '.join(expr.split())
+            math_expressions[intern(expr_clean)].append((line_num, lines[line_num - 1].strip()))
         
         # Signaler les expressions répétées
         for expr, occurrences in math_expressions.items():
@@ -108,7 +287,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
                 issues.append(self._create_issue(
                     'performance.repeated_calculations',
                     f'Calcul répété détecté: {expr} (trouvé {len(occurrences)} fois)',
-                    file_path,
+                    file_str,
                     first_line,
                     'info',
                     'performance',
@@ -116,255 +295,238 @@ class PerformanceAnalyzer(BaseAnalyzer):
                     first_code
                 ))
     
-    def _detect_unused_variables(self, line_stripped: str, line_num: int, file_path: Path, 
+    def _detect_unused_variables(self, line_stripped: str, line_num: int, file_str: str, 
                                 line: str, issues: List[Dict[str, Any]]) -> None:
         """Détecter les variables potentiellement non utilisées"""
         # Simple détection basée sur le nom (contient "unused" ou similaire)
-        unused_patterns = [
-            r'\$[a-zA-Z_][a-zA-Z0-9_]*unused[a-zA-Z0-9_]*\s*=',
-            r'\$unused[a-zA-Z_][a-zA-Z0-9_]*\s*=',
-            r'\$temp[0-9]*\s*=.*(?!temp)',  # variables temp non réutilisées
-            r'\$dummy[a-zA-Z0-9_]*\s*='
-        ]
-        
-        for pattern in unused_patterns:
-            if re.search(pattern, line_stripped, re.IGNORECASE):
-                var_match = re.search(r'\$[a-zA-Z_][a-zA-Z0-9_]*', line_stripped)
+        line_lower = line_stripped.lower()
+        for literal, pattern in _UNUSED_VARIABLE_PATTERNS:
+            if literal in line_lower and pattern.search(line_stripped):
+                var_match = _VARIABLE_RE.search(line_stripped)
                 if var_match:
                     var_name = var_match.group(0)
                     issues.append(self._create_issue(
                         'performance.unused_variables',
                         f'Variable potentiellement non utilisée: {var_name}',
-                        file_path,
+                        file_str,
                         line_num,
                         'info',
                         'performance',
                         f'Supprimer {var_name} si elle n\'est pas utilisée',
-                        line.strip()
+                        line_stripped
                     ))
                 break
     
-    def _detect_expensive_function_calls(self, line_stripped: str, line_num: int, file_path: Path, 
+    def _detect_expensive_function_calls(self, line_stripped: str, line_num: int, file_str: str, 
                                        line: str, issues: List[Dict[str, Any]]) -> None:
         """Détecter les appels de fonctions coûteuses qui pourraient être optimisés"""
-        expensive_functions = [
-            ('array_unique', 'array_flip puis array_keys peut être plus rapide'),
-            ('array_intersect', 'Considérer array_intersect_key si approprié'),
-            ('array_diff', 'Considérer array_diff_key si approprié'),
-            ('in_array.*true', 'Utiliser array_key_exists ou array_flip pour de gros tableaux'),
-            ('preg_match.*\\.\\*', 'Expression régulière avec .* peut être lente'),
-            ('file_get_contents.*http', 'Considérer cURL avec timeout pour les URL HTTP'),
-            ('glob', 'Considérer opendir/readdir pour de gros répertoires'),
-            ('scandir', 'Filtrer les résultats tôt si possible')
-        ]
-        
-        for func_pattern, suggestion in expensive_functions:
-            if re.search(rf'\b{func_pattern}\s*\(', line_stripped, re.IGNORECASE):
-                func_name = func_pattern.split('\\.*')[0].split('\\.')[0]  # Nettoyer le nom
-                issues.append(self._create_issue(
-                    'performance.expensive_function',
-                    f'Fonction potentiellement coûteuse: {func_name}()',
-                    file_path,
-                    line_num,
-                    'info',
-                    'performance',
-                    suggestion,
-                    line.strip()
-                ))
-                break
+        line_lower = line_stripped.lower()
+        found = {name.lower() for name in _EXPENSIVE_FUNCS_RE.findall(line_stripped)}
+        for literal, pattern, func_name, suggestion in _EXPENSIVE_FUNCTION_PATTERNS:
+            if pattern is None:
+                if literal not in found:
+                    continue
+            elif literal not in line_lower or not pattern.search(line_stripped):
+                continue
+            issues.append(self._create_issue(
+                'performance.expensive_function',
+                f'Fonction potentiellement coûteuse: {func_name}()',
+                file_str,
+                line_num,
+                'info',
+                'performance',
+                suggestion,
+                line_stripped
+            ))
+            break
     
-    def _detect_inefficient_array_operations(self, line_stripped: str, line_num: int, file_path: Path, 
+    def _detect_inefficient_array_operations(self, line_stripped: str, line_num: int, file_str: str, 
                                            line: str, issues: List[Dict[str, Any]]) -> None:
         """Détecter les opérations inefficaces sur les tableaux"""
         # array_push vs affectation directe
-        if re.search(r'array_push\s*\(\s*\$[a-zA-Z_][a-zA-Z0-9_]*\s*,\s*[^,)]+\s*\)', line_stripped):
+        if 'array_push' in line_stripped and _ARRAY_PUSH_SINGLE_RE.search(line_stripped):
             issues.append(self._create_issue(
                 'performance.array_push_single',
                 'array_push() avec un seul élément est moins efficace que l\'affectation directe',
-                file_path,
+                file_str,
                 line_num,
                 'info',
                 'performance',
                 'Utiliser $array[] = $value au lieu de array_push($array, $value)',
-                line.strip()
+                line_stripped
             ))
         
         # Utilisation de count() dans des conditions multiples
-        if re.search(r'count\s*\([^)]+\)\s*[><=!]+\s*\d+', line_stripped):
-            if re.search(r'count\s*\([^)]+\)\s*>\s*0', line_stripped):
-                issues.append(self._create_issue(
-                    'performance.count_vs_empty',
-                    'count($array) > 0 est moins efficace que !empty($array)',
-                    file_path,
-                    line_num,
-                    'info',
-                    'performance',
-                    'Utiliser !empty($array) au lieu de count($array) > 0',
-                    line.strip()
-                ))
+        if 'count' in line_stripped and _COUNT_GREATER_ZERO_RE.search(line_stripped):
+            issues.append(self._create_issue(
+                'performance.count_vs_empty',
+                'count($array) > 0 est moins efficace que !empty($array)',
+                file_str,
+                line_num,
+                'info',
+                'performance',
+                'Utiliser !empty($array) au lieu de count($array) > 0',
+                line_stripped
+            ))
         
         # Concatenation de tableaux inefficace
-        if re.search(r'array_merge\s*\([^)]*\$[a-zA-Z_][a-zA-Z0-9_]*\s*,\s*array\s*\([^)]*\)\s*\)', line_stripped):
+        if 'array_merge' in line_stripped and any(
+                _ARRAY_MERGE_SMALL_ARRAY_RE.search(call.group(1))
+                for call in _ARRAY_MERGE_CALL_RE.finditer(line_stripped)):
             issues.append(self._create_issue(
                 'performance.array_merge_single',
                 'array_merge() avec un petit tableau peut être inefficace',
-                file_path,
+                file_str,
                 line_num,
                 'info',
                 'performance',
                 'Considérer l\'opérateur + ou array_push() pour de meilleures performances',
-                line.strip()
+                line_stripped
             ))
     
-    def _detect_string_performance_issues(self, line_stripped: str, line_num: int, file_path: Path, 
+    def _detect_string_performance_issues(self, line_stripped: str, line_num: int, file_str: str, 
                                         line: str, issues: List[Dict[str, Any]]) -> None:
         """Détecter les problèmes de performance liés aux chaînes"""
         # Concaténation de chaînes en boucle (approximatif)
-        if re.search(r'\$[a-zA-Z_][a-zA-Z0-9_]*\s*\.=', line_stripped):
+        if '.=' in line_stripped and _STRING_CONCAT_RE.search(line_stripped):
             issues.append(self._create_issue(
                 'performance.string_concatenation',
                 'Concaténation de chaînes (.=) peut être inefficace en boucle',
-                file_path,
+                file_str,
                 line_num,
                 'info',
                 'performance',
                 'Considérer utiliser un tableau et implode() pour de nombreuses concaténations',
-                line.strip()
+                line_stripped
             ))
         
         # substr vs array access
-        if re.search(r'substr\s*\([^,]+,\s*0\s*,\s*1\s*\)', line_stripped):
+        if 'substr' in line_stripped and _SUBSTR_FIRST_CHAR_RE.search(line_stripped):
             issues.append(self._create_issue(
                 'performance.substr_first_char',
                 'substr($str, 0, 1) est moins efficace que $str[0]',
-                file_path,
+                file_str,
                 line_num,
                 'info',
                 'performance',
                 'Utiliser $str[0] pour récupérer le premier caractère',
-                line.strip()
+                line_stripped
             ))
         
         # strlen dans les conditions
-        if re.search(r'strlen\s*\([^)]+\)\s*[><=!]+\s*0', line_stripped):
+        if 'strlen' in line_stripped and _STRLEN_COMPARISON_RE.search(line_stripped):
             issues.append(self._create_issue(
                 'performance.strlen_vs_empty',
                 'strlen() pour vérifier si une chaîne est vide est moins efficace',
-                file_path,
+                file_str,
                 line_num,
                 'info',
                 'performance',
                 'Utiliser empty($str) ou $str === \'\' pour vérifier si une chaîne est vide',
-                line.strip()
+                line_stripped
             ))
     
-    def _detect_regex_performance_issues(self, line_stripped: str, line_num: int, file_path: Path, 
+    def _detect_regex_performance_issues(self, line_stripped: str, line_num: int, file_str: str, 
                                        line: str, issues: List[Dict[str, Any]]) -> None:
         """Détecter les problèmes de performance avec les expressions régulières"""
+        if 'preg_' not in line_stripped.lower():
+            return
+        
         # Regex avec quantificateurs gourmands
-        regex_patterns_to_check = [
-            (r'preg_match\s*\([^)]*\.\*\.\*', 'Expression régulière avec .*.* peut être très lente'),
-            (r'preg_match\s*\([^)]*\.\+\.\+', 'Expression régulière avec .+.+ peut être très lente'),
-            (r'preg_replace\s*\([^)]*\.\*', 'preg_replace avec .* peut être inefficace'),
-            (r'preg_match_all\s*\([^)]*\.\*', 'preg_match_all avec .* peut consommer beaucoup de mémoire')
-        ]
-        
-        for pattern, message in regex_patterns_to_check:
-            if re.search(pattern, line_stripped, re.IGNORECASE):
+        for pattern, message in _REGEX_PERFORMANCE_PATTERNS:
+            if pattern.search(line_stripped):
                 issues.append(self._create_issue(
                     'performance.regex_performance',
                     message,
-                    file_path,
+                    file_str,
                     line_num,
                     'warning',
                     'performance',
                     'Optimiser l\'expression régulière ou utiliser des fonctions de chaînes plus simples',
-                    line.strip()
+                    line_stripped
                 ))
                 break
         
         # Utilisation de regex pour des opérations simples
-        simple_operations = [
-            (r'preg_match\s*\([\'"][^\'"\[\]{}()*+?.\\|^$]*[\'"]', 'Expression régulière simple'),
-            (r'preg_replace\s*\([\'"][^\'"\[\]{}()*+?.\\|^$]*[\'"].*[\'"][^\'"\[\]{}()*+?.\\|^$]*[\'"]', 'Remplacement simple')
-        ]
-        
-        for pattern, description in simple_operations:
-            if re.search(pattern, line_stripped):
+        for pattern, description in _REGEX_OVERKILL_PATTERNS:
+            if pattern.search(line_stripped):
                 issues.append(self._create_issue(
                     'performance.regex_overkill',
                     f'{description} - regex peut être excessive',
-                    file_path,
+                    file_str,
                     line_num,
                     'info',
                     'performance',
                     'Considérer str_replace(), strpos(), ou substr() pour des opérations de chaînes simples',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
-    def _detect_io_performance_issues(self, line_stripped: str, line_num: int, file_path: Path, 
+    def _detect_io_performance_issues(self, line_stripped: str, line_num: int, file_str: str, 
                                     line: str, issues: List[Dict[str, Any]]) -> None:
         """Détecter les problèmes de performance liés aux I/O"""
         # Lecture de fichier ligne par ligne inefficace
-        if re.search(r'fgets\s*\(.*fopen\s*\(', line_stripped):
+        if 'fgets' in line_stripped and _FGETS_FOPEN_RE.search(line_stripped):
             issues.append(self._create_issue(
                 'performance.inefficient_file_reading',
                 'Lecture de fichier ligne par ligne avec fopen/fgets peut être inefficace',
-                file_path,
+                file_str,
                 line_num,
                 'info',
                 'performance',
                 'Considérer file() ou file_get_contents() pour les petits fichiers',
-                line.strip()
+                line_stripped
             ))
         
         # Vérifications d'existence de fichier répétées
-        file_check_functions = ['file_exists', 'is_file', 'is_dir', 'is_readable', 'is_writable']
-        for func in file_check_functions:
-            if re.search(rf'\b{func}\s*\([^)]*\$[a-zA-Z_][a-zA-Z0-9_]*\)', line_stripped):
+        # Une seule alternance pour toutes les fonctions de vérification de fichier
+        if 'file_exists' in line_stripped or 'is_' in line_stripped:
+            found = {match.group(1) for match in _FILE_CHECK_RE.finditer(line_stripped)}
+            if found:
+                func = next(name for name in _FILE_CHECK_FUNCTIONS if name in found)
                 issues.append(self._create_issue(
                     'performance.repeated_file_checks',
                     f'Vérification de fichier {func}() - considérer la mise en cache si répétée',
-                    file_path,
+                    file_str,
                     line_num,
                     'info',
                     'performance',
                     f'Mettre en cache le résultat de {func}() si appelé plusieurs fois',
-                    line.strip()
+                    line_stripped
                 ))
-                break
         
         # Opérations de base de données sans préparation
-        if re.search(r'mysql_query\s*\(.*\$', line_stripped):
+        if 'mysql_query' in line_stripped and _MYSQL_QUERY_RE.search(line_stripped):
             issues.append(self._create_issue(
                 'performance.unprepared_query',
                 'Requête SQL non préparée - peut être inefficace et dangereuse',
-                file_path,
+                file_str,
                 line_num,
                 'warning',
                 'performance',
                 'Utiliser des requêtes préparées pour de meilleures performances et sécurité',
-                line.strip()
+                line_stripped
             ))
     
-    def _detect_repetitive_array_access(self, lines: List[str], file_path: Path, 
+    def _detect_repetitive_array_access(self, stripped_lines: List[str], line_kind: bytearray, file_str: str, 
                                       issues: List[Dict[str, Any]]) -> None:
         """Détecter les accès répétitifs aux tableaux et suggérer des variables temporaires"""
+        # Modifications de chaque ligne, calculées une seule fois pour tous les accès
+        line_mutations = self._collect_line_mutations(stripped_lines, line_kind)
+        mutation_index = self._index_mutated_variables(line_mutations)
+        
         # Dictionnaire pour stocker les accès trouvés par fonction/méthode
         function_scopes = {}
         current_function = None
         current_scope_start = 0
         
-        for line_num, line in enumerate(lines, 1):
-            line_stripped = line.strip()
-            
+        for line_num, line_stripped in enumerate(stripped_lines, 1):
             # Ignorer les commentaires et lignes vides
-            if self._is_comment_line(line) or not line_stripped:
+            if line_kind[line_num - 1] == LINE_COMMENT or not line_stripped:
                 continue
             
             # Détecter le début d'une fonction/méthode
-            function_match = re.search(r'\b(?:function|public|private|protected|static)\s+(?:static\s+)?(?:function\s+)?([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', line_stripped)
+            function_match = _FUNCTION_START_RE.search(line_stripped)
             if function_match:
                 current_function = function_match.group(1)
                 current_scope_start = line_num
@@ -380,7 +542,8 @@ class PerformanceAnalyzer(BaseAnalyzer):
                 # Vérifier si c'est probablement la fin de la fonction
                 if line_num - current_scope_start > 2:  # Au moins quelques lignes dans la fonction
                     function_scopes[current_function]['end'] = line_num
-                    self._analyze_function_array_accesses(function_scopes[current_function], file_path, lines, issues)
+                    self._analyze_function_array_accesses(function_scopes[current_function], file_str,
+                                                          line_mutations, mutation_index, issues)
                     current_function = None
                 continue
             
@@ -390,10 +553,16 @@ class PerformanceAnalyzer(BaseAnalyzer):
                 if current_function not in function_scopes:
                     function_scopes[current_function] = {
                         'start': 1,
-                        'end': len(lines),
+                        'end': len(stripped_lines),
                         'accesses': {}
                     }
             
+            # Un accès exige une variable suivie de [ ou -> : rejet rapide sans regex
+            if '$' not in line_stripped or ('[' not in line_stripped and '->' not in line_stripped):
+                continue
+            if len(line_stripped) > MAX_ANALYZED_LINE_LENGTH:
+                continue
+            
             # Extraire tous les accès aux tableaux/objets de la ligne
             array_accesses = self._extract_array_accesses(line_stripped)
             
@@ -402,68 +571,77 @@ class PerformanceAnalyzer(BaseAnalyzer):
                 if self._is_assignment_target(line_stripped, access):
                     continue
                 
-                # Ajouter l'accès à la liste pour cette fonction
-                if access not in function_scopes[current_function]['accesses']:
-                    function_scopes[current_function]['accesses'][access] = []
-                
-                function_scopes[current_function]['accesses'][access].append({
-                    'line': line_num,
-                    'code': line_stripped,
-                    'full_line': line.strip()
-                })
+                # Ajouter l'occurrence pour cette fonction : numéros de ligne et lignes
+                # nettoyées dans deux séquences parallèles plutôt qu'un dict par occurrence
+                access_lines, access_codes = function_scopes[current_function]['accesses'].setdefault(
+                    access, (array('i'), []))
+                access_lines.append(line_num)
+                access_codes.append(line_stripped)
         
         # Analyser la fonction globale s'il y en a une
         if '__global__' in function_scopes:
-            self._analyze_function_array_accesses(function_scopes['__global__'], file_path, lines, issues)
+            self._analyze_function_array_accesses(function_scopes['__global__'], file_str,
+                                                  line_mutations, mutation_index, issues)
     
     def _extract_array_accesses(self, line: str) -> List[str]:
         """Extraire tous les accès aux tableaux et objets d'une ligne"""
         accesses = []
+        has_bracket = '[' in line
+        has_arrow = '->' in line
+        
+        # Accès aux tableaux simples et imbriqués : $array['key'] ou $array["key"] ou $array[$var]
+        if has_bracket:
+            accesses.extend(_ARRAY_ACCESS_RE.findall(line))
+        
+        # Accès aux propriétés d'objets : $object->property->subproperty
+        if has_arrow:
+            accesses.extend(_OBJECT_ACCESS_RE.findall(line))
+            
+            # Accès mixtes (objet puis tableau) : $object->property['key'] ou $object->property[$var]
+            if has_bracket:
+                accesses.extend(_MIXED_ACCESS_RE.findall(line))
         
-        # Pattern pour les accès aux tableaux simples et imbriqués
-        # $array['key'] ou $array["key"] ou $array[$var]
-        array_pattern = r'\$[a-zA-Z_][a-zA-Z0-9_]*(?:\[[^\]]+\])+(?:\[[^\]]+\])*'
-        array_matches = re.findall(array_pattern, line)
-        accesses.extend(array_matches)
-        
-        # Pattern pour les accès aux propriétés d'objets
-        # $object->property->subproperty
-        object_pattern = r'\$[a-zA-Z_][a-zA-Z0-9_]*(?:->[a-zA-Z_][a-zA-Z0-9_]*)+(?:->[a-zA-Z_][a-zA-Z0-9_]*)*'
-        object_matches = re.findall(object_pattern, line)
-        accesses.extend(object_matches)
-        
-        # Pattern pour les accès mixtes (objet puis tableau)
-        # $object->property['key'] ou $object->property[$var]
-        mixed_pattern = r'\$[a-zA-Z_][a-zA-Z0-9_]*(?:->[a-zA-Z_][a-zA-Z0-9_]*)+(?:\[[^\]]+\])+(?:\[[^\]]+\])*'
-        mixed_matches = re.findall(mixed_pattern, line)
-        accesses.extend(mixed_matches)
-        
-        return list(set(accesses))  # Éliminer les doublons
+        # Éliminer les doublons en conservant l'ordre (résultat déterministe) ; les accès
+        # internés partagent un seul objet chaîne par expression dans les dictionnaires d'accès
+        return [sys.intern(access) for access in dict.fromkeys(accesses)]
     
     def _is_assignment_target(self, line: str, access: str) -> bool:
         """Vérifier si l'accès est une cible d'assignation (côté gauche du =)"""
-        # Chercher si l'accès apparaît avant un = qui n'est pas dans une comparaison
-        escaped_access = re.escape(access)
-        
-        # Pattern pour détecter une assignation (pas ==, !=, <=, >=)
-        assignment_pattern = rf'{escaped_access}\s*=(?!=|<|>|!)'
-        if re.search(assignment_pattern, line):
-            return True
-        
-        # Vérifier aussi les opérateurs d'assignation composés
-        compound_assignment_pattern = rf'{escaped_access}\s*[+\-*/.%&|^]='
-        if re.search(compound_assignment_pattern, line):
-            return True
-        
-        # Vérifier unset()
-        unset_pattern = rf'unset\s*\([^)]*{escaped_access}'
-        if re.search(unset_pattern, line):
-            return True
-        
+        # Recherche par chaînes, équivalente à :
+        #   access\s*=(?!=|<|>|!)  |  access\s*[+\-*/.%&|^]=  |  unset\s*\([^)]*access
+        size = len(line)
+        start = line.find(access)
+        while start >= 0:
+            pos = start + len(access)
+            while pos < size and line[pos].isspace():
+                pos += 1
+            if pos < size:
+                char = line[pos]
+                if char == '=':
+                    if pos + 1 == size or line[pos + 1] not in _NOT_ASSIGNMENT_AFTER_EQ:
+                        return True
+                elif char in _COMPOUND_ASSIGNMENT_CHARS and line[pos + 1:pos + 2] == '=':
+                    return True
+            start = line.find(access, start + 1)
+        
+        # unset(...) : l'accès doit commencer avant la première parenthèse fermante
+        start = line.find('unset')
+        while start >= 0:
+            pos = start + 5
+            while pos < size and line[pos].isspace():
+                pos += 1
+            if pos < size and line[pos] == '(':
+                close = line.find(')', pos)
+                found = line.find(access, pos + 1)
+                if found >= 0 and (close < 0 or found <= close):
+                    return True
+            start = line.find('unset', start + 1)
         return False
     
-    def _analyze_function_array_accesses(self, function_info: Dict[str, Any], file_path: Path, 
-                                       lines: List[str], issues: List[Dict[str, Any]]) -> None:
+    def _analyze_function_array_accesses(self, function_info: Dict[str, Any], file_str: str, 
+                                       line_mutations: List[Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]],
+                                       mutation_index: Dict[str, List[int]],
+                                       issues: List[Dict[str, Any]]) -> None:
         """Analyser les accès aux tableaux dans une fonction et détecter les répétitions"""
         accesses = function_info['accesses']
         
@@ -471,18 +649,17 @@ class PerformanceAnalyzer(BaseAnalyzer):
         rule_config = self.config.get_rule_config('performance.repetitive_array_access')
         min_occurrences = rule_config.params.get('min_occurrences', 3)
         
-        for access_expr, occurrences in accesses.items():
+        for access_expr, (access_lines, access_codes) in accesses.items():
             # Seuil de détection configurable
-            if len(occurrences) < min_occurrences:
+            if len(access_lines) < min_occurrences:
                 continue
             
             # Vérifier s'il y a des modifications de la variable/tableau entre les accès
-            if self._has_modifications_between_accesses(access_expr, occurrences, lines):
+            if self._has_modifications_between_accesses(access_expr, access_lines, line_mutations,
+                                                        mutation_index):
                 continue
             
             # Générer une alerte pour cet accès répétitif
-            first_occurrence = occurrences[0]
-            
             # Déterminer le type d'accès pour le message
             access_type = self._determine_access_type(access_expr)
             
@@ -491,71 +668,107 @@ class PerformanceAnalyzer(BaseAnalyzer):
             
             issues.append(self._create_issue(
                 'performance.repetitive_array_access',
-                f'Accès répétitif détecté: {access_expr} (utilisé {len(occurrences)} fois)',
-                file_path,
-                first_occurrence['line'],
+                f'Accès répétitif détecté: {access_expr} (utilisé {len(access_lines)} fois)',
+                file_str,
+                access_lines[0],
                 'info',
                 'performance',
                 f'Stocker {access_expr} dans une variable temporaire ${temp_var_name} pour améliorer les performances.\n'
                 f'Exemple: ${temp_var_name} = {access_expr}; puis utiliser ${temp_var_name}',
-                first_occurrence['full_line']
+                access_codes[0]
             ))
     
-    def _has_modifications_between_accesses(self, access_expr: str, occurrences: List[Dict[str, Any]], 
-                                          lines: List[str]) -> bool:
+    def _collect_line_mutations(self, stripped_lines: List[str], line_kind: bytearray
+                                ) -> List[Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]]:
+        """
+        Relever une fois par ligne les cibles d'affectation et les arguments des fonctions modifiantes
+        
+        Chaque entrée vaut None (commentaire ou ligne sans modification possible) ou le couple
+        (textes précédant chaque opérateur =, arguments de chaque appel modifiant).
+        """
+        line_mutations = []
+        for line_num, line in enumerate(stripped_lines, 1):
+            # Une ligne trop longue n'est pas analysée : ses accès ne sont pas relevés non plus
+            if line_kind[line_num - 1] == LINE_COMMENT or len(line) > MAX_ANALYZED_LINE_LENGTH:
+                line_mutations.append(None)
+                continue
+            
+            targets = ()
+            if '=' in line:
+                targets = tuple(line[:match.start()].rstrip() for match in _ASSIGNMENT_OP_RE.finditer(line))
+            call_args = ()
+            if '(' in line and any(literal in line for literal in _MODIFYING_CALL_LITERALS):
+                call_args = tuple(_MODIFYING_CALL_RE.findall(line))
+            line_mutations.append((targets, call_args) if targets or call_args else None)
+        
+        return line_mutations
+    
+    def _index_mutated_variables(self, line_mutations: List[Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]]
+                                 ) -> Dict[str, List[int]]:
+        """
+        Indexer, pour chaque préfixe de variable ($a, $ab, $abc...), les lignes qui le modifient
+        
+        Toute modification détectée par _line_modifies_variable contient la variable racine
+        dans une cible ou dans des arguments : seules les lignes indexées sous cette racine
+        doivent être vérifiées. Les indices (croissants) sont ceux de line_mutations.
+        """
+        mutation_index: DefaultDict[str, List[int]] = defaultdict(list)
+        for index, mutations in enumerate(line_mutations):
+            if not mutations:
+                continue
+            targets, call_args = mutations
+            prefixes = set()
+            for text in targets + call_args:
+                for token in _VARIABLE_TOKEN_RE.findall(text):
+                    prefixes.update(token[:end] for end in range(2, len(token) + 1))
+            for prefix in prefixes:
+                mutation_index[prefix].append(index)
+        return mutation_index
+    
+    def _has_modifications_between_accesses(self, access_expr: str, access_lines: Sequence[int], 
+                                          line_mutations: List[Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]],
+                                          mutation_index: Dict[str, List[int]]) -> bool:
         """Vérifier s'il y a des modifications de la variable/tableau entre les accès"""
         # Extraire la variable racine de l'expression d'accès
-        root_var_match = re.match(r'(\$[a-zA-Z_][a-zA-Z0-9_]*)', access_expr)
+        root_var_match = _ROOT_VARIABLE_RE.match(access_expr)
         if not root_var_match:
             return False
         
         root_var = root_var_match.group(1)
         
+        # Seules les lignes dont les modifications mentionnent la racine peuvent la modifier
+        candidates = mutation_index.get(root_var)
+        if not candidates:
+            return False
+        
         # Vérifier entre chaque paire d'accès consécutifs
-        for i in range(len(occurrences) - 1):
-            current_line = occurrences[i]['line']
-            next_line = occurrences[i + 1]['line']
+        for i in range(len(access_lines) - 1):
+            current_line = access_lines[i]
+            next_line = access_lines[i + 1]
             
-            # Vérifier les lignes entre les deux accès
-            for line_num in range(current_line + 1, next_line):
-                if line_num > len(lines):
-                    break
-                
-                line = lines[line_num - 1].strip()  # -1 car les lignes sont indexées à partir de 0
-                
-                # Ignorer les commentaires
-                if self._is_comment_line(lines[line_num - 1]):
-                    continue
-                
-                # Vérifier les modifications de la variable racine
-                if self._line_modifies_variable(line, root_var, access_expr):
+            # Lignes entre les deux accès, indices current_line à next_line - 2
+            # (-1 car les lignes sont indexées à partir de 0)
+            position = bisect.bisect_left(candidates, current_line)
+            while position < len(candidates) and candidates[position] < next_line - 1:
+                if self._line_modifies_variable(line_mutations[candidates[position]], root_var, access_expr):
                     return True
+                position += 1
         
         return False
     
-    def _line_modifies_variable(self, line: str, root_var: str, access_expr: str) -> bool:
-        """Vérifier si une ligne modifie la variable ou l'expression d'accès"""
-        # Échapper les caractères spéciaux pour regex
-        escaped_root = re.escape(root_var)
-        escaped_access = re.escape(access_expr)
-        
-        # Assignation directe à la variable racine
-        if re.search(rf'{escaped_root}\s*=(?!=)', line):
-            return True
-        
-        # Assignation à l'expression d'accès exacte
-        if re.search(rf'{escaped_access}\s*=(?!=)', line):
-            return True
+    def _line_modifies_variable(self, mutations: Tuple[Tuple[str, ...], Tuple[str, ...]],
+                                root_var: str, access_expr: str) -> bool:
+        """Vérifier si les modifications relevées sur une ligne touchent la variable ou l'expression d'accès"""
+        targets, call_args = mutations
+        
+        # Assignation directe à la variable racine ou à l'expression d'accès exacte
+        for target in targets:
+            if target.endswith(root_var) or target.endswith(access_expr):
+                return True
         
         # Fonctions qui modifient les tableaux
-        modifying_functions = [
-            'unset', 'array_pop', 'array_push', 'array_shift', 'array_unshift',
-            'array_splice', 'sort', 'rsort', 'asort', 'arsort', 'ksort', 'krsort',
-            'shuffle', 'array_reverse', 'array_walk', 'array_walk_recursive'
-        ]
-        
-        for func in modifying_functions:
-            if re.search(rf'\b{func}\s*\([^)]*{escaped_root}', line):
+        for args in call_args:
+            if root_var in args:
                 return True
         
         return False
@@ -573,33 +786,29 @@ class PerformanceAnalyzer(BaseAnalyzer):
     
     def _generate_temp_variable_name(self, access_expr: str) -> str:
         """Générer un nom de variable temporaire basé sur l'expression d'accès"""
-        # Extraire les éléments significatifs de l'expression
-        parts = []
-        
-        # Extraire la variable racine
-        root_match = re.match(r'\$([a-zA-Z_][a-zA-Z0-9_]*)', access_expr)
-        if root_match:
-            parts.append(root_match.group(1))
-        
-        # Extraire les clés de tableau littérales
-        key_matches = re.findall(r"\['([^']+)'\]|\[\"([^\"]+)\"\]", access_expr)
-        for match in key_matches:
-            key = match[0] or match[1]  # Premier ou deuxième groupe non vide
-            if key.isalnum():  # Seulement les clés alphanumériques
-                parts.append(key)
-        
-        # Extraire les propriétés d'objet
-        prop_matches = re.findall(r'->([a-zA-Z_][a-zA-Z0-9_]*)', access_expr)
-        parts.extend(prop_matches)
-        
-        # Construire le nom de la variable temporaire
-        if len(parts) > 1:
-            # Utiliser camelCase pour combiner les parties
-            var_name = parts[0]
-            for part in parts[1:]:
-                var_name += part.capitalize()
+        # Extraire les éléments significatifs de l'expression : racine, clés puis propriétés
+        root = None
+        keys = []
+        props = []
+        for match in _NAME_PARTS_RE.finditer(access_expr):
+            kind = match.lastgroup
+            if kind == 'root':
+                root = match.group('root')
+            elif kind == 'prop':
+                props.append(match.group('prop'))
+            else:
+                key = match.group(kind)
+                if key.isalnum():  # Seulement les clés alphanumériques
+                    keys.append(key)
+        
+        # Construire le nom de la variable temporaire en camelCase
+        parts = [root] if root else []
+        parts.extend(keys)
+        parts.extend(props)
+        if parts:
+            var_name = parts[0] + ''.join(part.capitalize() for part in parts[1:])
         else:
-            var_name = parts[0] if parts else 'temp'
+            var_name = 'temp'
         
         # Ajouter un suffixe si nécessaire
         if len(var_name) > 20:
@@ -4,112 +4,304 @@ Analyseur spécialisé pour la sécurité
 
 import re
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
-from .base_analyzer import BaseAnalyzer
+from .base_analyzer import BaseAnalyzer, classify_lines
+
+
+# Les patterns de chaque catégorie restent compilés séparément : une alternance
+# unique (?P<g0>...)|(?P<g1>...) perd le préfixe littéral que le moteur `re`
+# exploite pour chaque pattern isolé et s'est révélée plus lente à l'usage.
+# Elle renverrait de plus le match le plus à gauche, pas le premier pattern
+# de la liste.
+# Chaque motif est précédé d'un littéral obligatoire, en minuscules, vérifié par
+# une simple recherche de sous-chaîne avant d'exécuter l'expression.
+# Ces littéraux tiennent lieu d'aiguillage par mot-clé : les motifs sont cherchés
+# n'importe où dans la ligne (`if ($x) echo $_GET['y'];`), un aiguillage sur le
+# premier mot en manquerait, et lancer la recherche à la position du littéral
+# n'apporte rien, le moteur sautant déjà au préfixe littéral du motif.
+
+# Les motifs sont écrits en minuscules et appliqués à la ligne déjà passée en minuscules :
+# la recherche sensible à la casse évite le repli de casse du moteur `re` (deux fois plus
+# rapide). PHP ne reconnaît que les blancs ASCII, d'où re.ASCII pour \s.
+_PATTERN_FLAGS = re.ASCII
+
+# Patterns d'injection SQL (améliorés pour éviter les faux positifs XPath/autres)
+_SQL_INJECTION_PATTERNS = tuple(
+    (literal, re.compile(pattern, _PATTERN_FLAGS), description)
+    for literal, pattern, description in (
+        ('mysql_query', r'mysql_query\s*\([^)]*\$[a-z_]', 'mysql_query avec variable non échappée'),
+        ('mysqli_query', r'mysqli_query\s*\([^)]*\$[a-z_]', 'mysqli_query avec variable non échappée'),
+        # Patterns SQL spécifiques (PDO, bases de données) - éviter XPath, API, etc.
+        ('query', r'\$(?:pdo|db|database|connection|conn|mysql|mysqli)\s*->\s*query\s*\([^)]*\$[a-z_]', 'Méthode query() de base de données avec variable non échappée'),
+        # Mots-clés SQL dans les chaînes avec variables
+        ('select', r'select\s.*\$[a-z_]', 'Requête SELECT avec concaténation de variable'),
+        ('insert', r'insert\s.*\$[a-z_]', 'Requête INSERT avec concaténation de variable'),
+        ('update', r'update\s.*\$[a-z_]', 'Requête UPDATE avec concaténation de variable'),
+        ('delete', r'delete\s.*\$[a-z_]', 'Requête DELETE avec concaténation de variable'),
+        ('where', r'where\s.*\$[a-z_]', 'Clause WHERE avec concaténation de variable'),
+        ('order', r'order\s+by\s.*\$[a-z_]', 'Clause ORDER BY avec concaténation de variable'),
+    )
+)
+
+# Exclusions pour éviter les faux positifs (XPath, API REST, etc.)
+_SQL_EXCLUSION_PATTERNS = tuple(re.compile(pattern, _PATTERN_FLAGS) for pattern in (
+    r'\$xpath\s*->\s*query\s*\(',  # XPath queries
+    r'\$dom\s*->\s*query\s*\(',    # DOM queries
+    r'\$client\s*->\s*query\s*\(', # API client queries
+    r'\$api\s*->\s*query\s*\(',    # API queries
+    r'curl_.*query',               # cURL avec query parameters
+    r'http_build_query',           # Construction de query string HTTP
+))
+
+# Appel à execute() et arguments considérés comme sûrs
+_EXECUTE_CALL_RE = re.compile(r'\$(?:[a-zA-Z_][a-zA-Z0-9_]*)\s*->\s*execute\s*\(([^)]+)\)')
+# Variables clairement destinées aux paramètres liés: execute($params)
+_SAFE_EXECUTE_VARIABLES = frozenset(('$params', '$parameters', '$bindings'))
+_VARIABLE_RE = re.compile(r'\$[a-zA-Z_]')
+
+# Patterns XSS et fonctions d'échappement qui les neutralisent
+_XSS_PATTERNS = tuple(
+    (literal, re.compile(pattern, _PATTERN_FLAGS), description)
+    for literal, pattern, description in (
+        ('echo', r'echo\s+\$_(get|post|request|cookie|server)\[', 'echo de données utilisateur non filtrées'),
+        ('print', r'print\s+\$_(get|post|request|cookie|server)\[', 'print de données utilisateur non filtrées'),
+        ('printf', r'printf\s*\([^)]*\$_(get|post|request|cookie|server)\[', 'printf avec données utilisateur'),
+        ('<?=', r'<\?=\s*\$_(get|post|request|cookie|server)\[', 'Balise courte PHP avec données utilisateur'),
+        ('echo', r'echo\s+["\'][^"\']*\$_(get|post|request|cookie|server)', 'echo dans chaîne avec données utilisateur'),
+        ('innerhtml', r'innerhtml\s*=.*\$_(get|post|request|cookie|server)', 'innerHTML avec données utilisateur'),
+        ('document.write', r'document\.write\s*\([^)]*\$_(get|post|request|cookie|server)', 'document.write avec données utilisateur'),
+    )
+)
+_XSS_ESCAPING_RE = re.compile(r'htmlspecialchars|htmlentities|filter_var|strip_tags', _PATTERN_FLAGS)
+
+# Patterns d'inclusion dangereuse
+_INCLUSION_PATTERNS = tuple(
+    (literal, re.compile(pattern, _PATTERN_FLAGS), description)
+    for literal, pattern, description in (
+        ('include', r'include\s*\(\s*\$_(get|post|request)\[', 'include avec données utilisateur'),
+        ('include_once', r'include_once\s*\(\s*\$_(get|post|request)\[', 'include_once avec données utilisateur'),
+        ('require', r'require\s*\(\s*\$_(get|post|request)\[', 'require avec données utilisateur'),
+        ('require_once', r'require_once\s*\(\s*\$_(get|post|request)\[', 'require_once avec données utilisateur'),
+        ('file_get_contents', r'file_get_contents\s*\(\s*\$_(get|post|request)\[', 'file_get_contents avec données utilisateur'),
+        ('fopen', r'fopen\s*\(\s*\$_(get|post|request)\[', 'fopen avec données utilisateur'),
+        ('readfile', r'readfile\s*\(\s*\$_(get|post|request)\[', 'readfile avec données utilisateur'),
+    )
+)
+
+# Algorithmes de hachage faibles
+_WEAK_HASH_PATTERNS = tuple(
+    (literal, re.compile(pattern, _PATTERN_FLAGS), description)
+    for literal, pattern, description in (
+        ('md5', r'md5\s*\([^)]*password', 'MD5 pour hachage de mot de passe'),
+        ('sha1', r'sha1\s*\([^)]*password', 'SHA1 pour hachage de mot de passe'),
+        ('hash', r'hash\s*\(\s*["\']md5["\']', 'hash() avec MD5'),
+        ('hash', r'hash\s*\(\s*["\']sha1["\']', 'hash() avec SHA1'),
+        ('crypt', r'crypt\s*\([^)]*\$[a-z_]*password', 'crypt() simple pour mot de passe'),
+    )
+)
+
+# Exposition de données sensibles
+_SENSITIVE_PATTERNS = tuple(
+    (literal, re.compile(pattern, _PATTERN_FLAGS), description)
+    for literal, pattern, description in (
+        ('var_dump', r'var_dump\s*\(\s*\$_(get|post|request|cookie|session)', 'var_dump de données utilisateur'),
+        ('print_r', r'print_r\s*\(\s*\$_(get|post|request|cookie|session)', 'print_r de données utilisateur'),
+        ('error_reporting', r'error_reporting\s*\(\s*e_all', 'error_reporting(E_ALL) en production'),
+        ('display_errors', r'ini_set\s*\(\s*["\']display_errors["\'].*1', 'display_errors activé'),
+        ('phpinfo', r'phpinfo\s*\(\s*\)', 'phpinfo() exposé'),
+        ('echo', r'echo\s.{0,300}password.{0,300}\$[a-z_]', 'echo possible de mot de passe'),
+        ('print', r'print\s.{0,300}password.{0,300}\$[a-z_]', 'print possible de mot de passe'),
+    )
+)
+
+# Problèmes d'authentification
+_AUTH_PATTERNS = tuple(
+    (literal, re.compile(pattern, _PATTERN_FLAGS), description)
+    for literal, pattern, description in (
+        ('session_start', r'session_start\s*\(\s*\).{0,300}\$_session\[.{0,300}admin.{0,300}\]\s*=\s*true', 'Attribution directe de privilèges admin'),
+        ('$_session', r'\$_session\[.{0,300}user.{0,300}\]\s*=\s*\$_(get|post)\[', 'Attribution de session depuis données utilisateur'),
+        ('$_session', r'if\s*\(\s*\$_session\[.*\]\s*\)', 'Vérification de session simple sans validation'),
+        ('setcookie', r'setcookie\s*\([^)]*false\s*\)', 'Cookie non sécurisé (httpOnly=false)'),
+        ('session_regenerate_id', r'session_regenerate_id\s*\(\s*false', 'session_regenerate_id sans suppression de l\'ancien ID'),
+    )
+)
+
+# Fonctions dangereuses : (littéral de préfiltre, motif compilé, nom, description, sévérité),
+# dans l'ordre de priorité ; seul le premier motif trouvé sur une ligne est signalé
+# (appliqués à la ligne d'origine avec repli Unicode : \b doit compter les lettres
+# accentuées dans le nom, que str.lower() peut décomposer, p. ex. 'İ' -> 'i̇')
+_DANGEROUS_FUNCTIONS = tuple(
+    (func.split('.*')[0], re.compile(rf'\b{func}\s*\(', re.IGNORECASE), func, description,
+     'error' if func in ('eval', 'exec', 'system') else 'warning')
+    for func, description in (
+        ('eval', 'Exécution de code arbitraire'),
+        ('exec', 'Exécution de commandes système'),
+        ('system', 'Exécution de commandes système'),
+        ('shell_exec', 'Exécution de commandes shell'),
+        ('passthru', 'Exécution de commandes système'),
+        ('proc_open', 'Ouverture de processus'),
+        ('popen', 'Ouverture de pipe vers processus'),
+        ('assert', 'Assertion (peut exécuter du code)'),
+        ('create_function', 'Création de fonction dynamique'),
+        ('file_put_contents.*php://input', 'Écriture depuis php://input'),
+        ('move_uploaded_file.*\\$_(GET|POST)', 'move_uploaded_file avec données utilisateur'),
+    )
+)
+
+# Sur une ligne ASCII, les appels sont relevés une seule fois (nom suivi de '(', même
+# découpage que \bnom\s*\() puis cherchés parmi les fonctions simples : nom -> indice de
+# priorité dans _DANGEROUS_FUNCTIONS. Les deux motifs composés restent des expressions.
+_CALL_RE = re.compile(r'\b(\w+)\s*\(')
+_DANGEROUS_CALLS = {
+    func: index for index, (_, _, func, _, _) in enumerate(_DANGEROUS_FUNCTIONS) if '.*' not in func
+}
+_DANGEROUS_COMPOSITE_PATTERNS = tuple(entry for entry in _DANGEROUS_FUNCTIONS if '.*' in entry[2])
+
+
+# Problèmes de configuration
+_CONFIG_PATTERNS = tuple(
+    (literal, re.compile(pattern, _PATTERN_FLAGS), description)
+    for literal, pattern, description in (
+        ('allow_url_include', r'ini_set\s*\(\s*["\']allow_url_include["\'].*1', 'allow_url_include activé'),
+        ('allow_url_fopen', r'ini_set\s*\(\s*["\']allow_url_fopen["\'].*1', 'allow_url_fopen activé'),
+        ('register_globals', r'ini_set\s*\(\s*["\']register_globals["\'].*1', 'register_globals activé'),
+        ('extract', r'extract\s*\(\s*\$_(get|post|request)', 'extract() avec données utilisateur'),
+        ('parse_str', r'parse_str\s*\([^)]*\$_(get|post|request)', 'parse_str avec données utilisateur'),
+        ('unserialize', r'unserialize\s*\(\s*\$_(get|post|request)', 'unserialize avec données utilisateur'),
+    )
+)
+
+# Préfiltre : tout pattern ci-dessus exige soit un '$' (variables, superglobales),
+# soit l'un de ces littéraux. Une ligne qui n'en contient aucun est ignorée.
+_TRIGGER_RE = re.compile(
+    r'password|hash|error_reporting|display_errors|phpinfo|setcookie|session_regenerate_id'
+    r'|eval|exec|system|passthru|proc_open|popen|assert|create_function|php://input'
+    r'|allow_url|register_globals',
+    re.IGNORECASE | re.ASCII
+)
+
+# Détecteurs (dans l'ordre d'exécution) et mots-clés, en minuscules, dont au moins
+# un doit figurer dans le fichier pour que le détecteur puisse s'appliquer
+_DETECTOR_TRIGGERS = (
+    ('_detect_sql_injection', ('query', 'execute', 'select', 'insert', 'update', 'delete',
+                               'where', 'order')),
+    ('_detect_xss_vulnerability', ('echo', 'print', '<?=', 'innerhtml', 'document.write')),
+    ('_detect_file_inclusion_vulnerability', ('include', 'require', 'file_get_contents', 'fopen',
+                                              'readfile')),
+    ('_detect_weak_password_hashing', ('md5', 'sha1', 'hash', 'crypt')),
+    ('_detect_sensitive_data_exposure', ('var_dump', 'print', 'error_reporting', 'display_errors',
+                                         'phpinfo', 'echo')),
+    ('_detect_auth_issues', ('$_session', 'setcookie', 'session_regenerate_id')),
+    ('_detect_dangerous_functions', ('eval', 'exec', 'system', 'passthru', 'proc_open', 'popen',
+                                     'assert', 'create_function', 'php://input', 'move_uploaded_file')),
+    ('_detect_configuration_issues', ('allow_url', 'register_globals', 'extract', 'parse_str',
+                                      'unserialize')),
+)
+
+# Nombre maximal de lignes dont les problèmes détectés sont mémorisés (code généré,
+# boilerplate ORM : les mêmes lignes reviennent d'un fichier à l'autre)
+_LINE_FINDINGS_CACHE_SIZE = 8192
 
 
 class SecurityAnalyzer(BaseAnalyzer):
     """Analyseur spécialisé pour les problèmes de sécurité"""
     
-    def analyze(self, content: str, file_path: Path, lines: List[str]) -> List[Dict[str, Any]]:
+    # Règles dont cet analyseur peut produire des problèmes
+    rule_names = frozenset({
+        'security.authentication', 'security.configuration', 'security.dangerous_function',
+        'security.file_inclusion', 'security.sensitive_data_exposure',
+        'security.sql_injection', 'security.weak_password_hashing',
+        'security.xss_vulnerability'
+    })
+    
+    def __init__(self, config=None, enabled_rules=None):
+        """Initialiser l'analyseur avec la configuration"""
+        super().__init__(config, enabled_rules)
+        # Texte de ligne -> (règle, message, sévérité, suggestion) de chaque problème détecté.
+        # Le résultat ne dépend que du texte : un détecteur écarté pour un fichier faute de
+        # mot-clé ne pourrait de toute façon rien signaler sur ses lignes.
+        self._line_findings: Dict[str, Tuple[Tuple[str, str, str, str], ...]] = {}
+    
+    def analyze(self, content: str, file_path: Path, lines: List[str],
+                line_kind: Optional[bytearray] = None) -> List[Dict[str, Any]]:
         """Analyser les problèmes de sécurité dans le code PHP"""
         issues = []
         
+        # Ne conserver que les détecteurs dont un mot-clé apparaît dans le fichier ;
+        # la boucle ligne par ligne parcourt ensuite cette table de méthodes liées.
+        # Des recherches de sous-chaînes successives restent plus rapides ici qu'une
+        # alternance unique de tous les mots-clés passée sur le contenu.
+        content_lower = content.lower()
+        detectors = [getattr(self, name) for name, triggers in _DETECTOR_TRIGGERS
+                     if any(trigger in content_lower for trigger in triggers)]
+        if not detectors:
+            return issues
+        
+        if line_kind is None:
+            line_kind = classify_lines(lines)
+        line_findings = self._line_findings
+        
         for line_num, line in enumerate(lines, 1):
-            line_stripped = line.strip()
-            
             # Ignorer les commentaires et directives Blade
-            if self._is_comment_line(line) or self._is_blade_directive(line):
+            if line_kind[line_num - 1]:
                 continue
             
-            # Détecter les injections SQL
-            self._detect_sql_injection(line_stripped, line_num, file_path, line, issues)
-            
-            # Détecter les vulnérabilités XSS
-            self._detect_xss_vulnerability(line_stripped, line_num, file_path, line, issues)
-            
-            # Détecter les inclusions de fichiers dangereuses
-            self._detect_file_inclusion_vulnerability(line_stripped, line_num, file_path, line, issues)
-            
-            # Détecter les hachages faibles
-            self._detect_weak_password_hashing(line_stripped, line_num, file_path, line, issues)
+            line_stripped = line.strip()
             
-            # Détecter l'exposition de variables sensibles
-            self._detect_sensitive_data_exposure(line_stripped, line_num, file_path, line, issues)
+            # Aucun détecteur ne peut se déclencher sans variable ni mot-clé sensible ;
+            # sans '$', tous les patterns exigent en outre un appel, donc un '('
+            # (lignes vides, accolades et HTML pur sont écartés sans regex)
+            if '$' not in line_stripped and (
+                    '(' not in line_stripped or not _TRIGGER_RE.search(line_stripped)):
+                continue
             
-            # Détecter les problèmes d'authentification et autorisation
-            self._detect_auth_issues(line_stripped, line_num, file_path, line, issues)
+            # Ligne déjà rencontrée : reconstruire ses problèmes sans relancer les détecteurs
+            findings = line_findings.get(line_stripped)
+            if findings is not None:
+                for rule_name, message, severity, suggestion in findings:
+                    issues.append(self._create_issue(rule_name, message, file_path, line_num,
+                                                     severity, 'security', suggestion, line_stripped))
+                continue
             
-            # Détecter l'utilisation de fonctions dangereuses
-            self._detect_dangerous_functions(line_stripped, line_num, file_path, line, issues)
+            # Minuscules pour les préfiltres littéraux des détecteurs
+            line_lower = line_stripped.lower()
+            first_issue = len(issues)
+            for detect in detectors:
+                detect(line_stripped, line_lower, line_num, file_path, issues)
             
-            # Détecter les problèmes de configuration
-            self._detect_configuration_issues(line_stripped, line_num, file_path, line, issues)
+            if len(line_findings) >= _LINE_FINDINGS_CACHE_SIZE:
+                del line_findings[next(iter(line_findings))]
+            if len(issues) == first_issue:
+                line_findings[line_stripped] = ()
+            else:
+                line_findings[line_stripped] = tuple(
+                    (issue['rule_name'], issue['message'], issue['severity'], issue['suggestion'])
+                    for issue in issues[first_issue:]
+                )
         
         return issues
     
-    def _detect_sql_injection(self, line_stripped: str, line_num: int, file_path: Path, 
-                             line: str, issues: List[Dict[str, Any]]) -> None:
+    def _detect_sql_injection(self, line_stripped: str, line_lower: str, line_num: int, file_path: Path, 
+                             issues: List[Dict[str, Any]]) -> None:
         """Détecter les vulnérabilités d'injection SQL"""
-        # Patterns d'injection SQL (améliorés pour éviter les faux positifs XPath/autres)
-        sql_injection_patterns = [
-            (r'mysql_query\s*\([^)]*\$[a-zA-Z_][a-zA-Z0-9_]*', 'mysql_query avec variable non échappée'),
-            (r'mysqli_query\s*\([^)]*\$[a-zA-Z_][a-zA-Z0-9_]*', 'mysqli_query avec variable non échappée'),
-            # Patterns SQL spécifiques (PDO, bases de données) - éviter XPath, API, etc.
-            (r'\$(?:pdo|db|database|connection|conn|mysql|mysqli)\s*->\s*query\s*\([^)]*\$[a-zA-Z_][a-zA-Z0-9_]*', 'Méthode query() de base de données avec variable non échappée'),
-            # Mots-clés SQL dans les chaînes avec variables
-            (r'SELECT\s+.*\$[a-zA-Z_][a-zA-Z0-9_]*', 'Requête SELECT avec concaténation de variable'),
-            (r'INSERT\s+.*\$[a-zA-Z_][a-zA-Z0-9_]*', 'Requête INSERT avec concaténation de variable'),
-            (r'UPDATE\s+.*\$[a-zA-Z_][a-zA-Z0-9_]*', 'Requête UPDATE avec concaténation de variable'),
-            (r'DELETE\s+.*\$[a-zA-Z_][a-zA-Z0-9_]*', 'Requête DELETE avec concaténation de variable'),
-            (r'WHERE\s+.*\$[a-zA-Z_][a-zA-Z0-9_]*', 'Clause WHERE avec concaténation de variable'),
-            (r'ORDER\s+BY\s+.*\$[a-zA-Z_][a-zA-Z0-9_]*', 'Clause ORDER BY avec concaténation de variable')
-        ]
-        
-        # Exclusions pour éviter les faux positifs (XPath, API REST, etc.)
-        exclusion_patterns = [
-            r'\$xpath\s*->\s*query\s*\(',  # XPath queries
-            r'\$dom\s*->\s*query\s*\(',    # DOM queries
-            r'\$client\s*->\s*query\s*\(', # API client queries
-            r'\$api\s*->\s*query\s*\(',    # API queries
-            r'curl_.*query',               # cURL avec query parameters
-            r'http_build_query',           # Construction de query string HTTP
-        ]
-        
-        # Vérifier les exclusions d'abord
-        for exclusion in exclusion_patterns:
-            if re.search(exclusion, line_stripped, re.IGNORECASE):
-                return  # Sortir sans signaler - c'est un faux positif
+        # execute(), query() et mots-clés SQL : tous les motifs exigent une variable PHP
+        if '$' not in line_lower:
+            return
+
+        # Vérifier les exclusions d'abord (toutes contiennent "query")
+        if 'query' in line_lower:
+            for exclusion in _SQL_EXCLUSION_PATTERNS:
+                if exclusion.search(line_lower):
+                    return  # Sortir sans signaler - c'est un faux positif
         
         # Vérification particulière pour execute() - permettre les tableaux de paramètres sécurisés
-        execute_match = re.search(r'\$(?:[a-zA-Z_][a-zA-Z0-9_]*)\s*->\s*execute\s*\(([^)]+)\)', line_stripped)
+        execute_match = _EXECUTE_CALL_RE.search(line_stripped) if 'execute' in line_stripped else None
         if execute_match:
             execute_content = execute_match.group(1).strip()
             
-            # Cas sécurisés : ne pas signaler comme injection SQL
-            safe_execute_patterns = [
-                # Tableau de paramètres direct: execute([...])
-                r'^\[\s*.*\s*\]$',
-                # Tableau de paramètres avec variables: execute([$var1, $var2])
-                r'^\[\s*\$[a-zA-Z_][a-zA-Z0-9_]*(?:\s*,\s*\$[a-zA-Z_][a-zA-Z0-9_]*)*\s*\]$',
-                # Appel sans paramètres: execute()
-                r'^\s*$',
-                # Variable qui est clairement un tableau de paramètres
-                r'^\$[a-zA-Z_][a-zA-Z0-9_]*_params$',
-                r'^\$params$',
-                r'^\$parameters$',
-                r'^\$bindings$'
-            ]
-            
-            is_safe = False
-            for safe_pattern in safe_execute_patterns:
-                if re.search(safe_pattern, execute_content):
-                    is_safe = True
-                    break
-            
-            # Si ce n'est pas un pattern sécurisé, c'est potentiellement dangereux
-            if not is_safe and re.search(r'\$[a-zA-Z_][a-zA-Z0-9_]*', execute_content):
+            # Si ce n'est pas un argument sécurisé, c'est potentiellement dangereux
+            if not self._is_safe_execute_argument(execute_content) and _VARIABLE_RE.search(execute_content):
                 issues.append(self._create_issue(
                     'security.sql_injection',
                     'Injection SQL potentielle: execute() avec variable non sécurisée',
@@ -118,13 +310,13 @@ class SecurityAnalyzer(BaseAnalyzer):
                     'error',
                     'security',
                     'Utiliser des requêtes préparées avec des paramètres liés dans un tableau pour éviter les injections SQL',
-                    line.strip()
+                    line_stripped
                 ))
                 return
         
         # Patterns d'injection SQL classiques
-        for pattern, description in sql_injection_patterns:
-            if re.search(pattern, line_stripped, re.IGNORECASE):
+        for literal, pattern, description in _SQL_INJECTION_PATTERNS:
+            if literal in line_lower and pattern.search(line_lower):
                 issues.append(self._create_issue(
                     'security.sql_injection',
                     f'Injection SQL potentielle: {description}',
@@ -133,28 +325,32 @@ class SecurityAnalyzer(BaseAnalyzer):
                     'error',
                     'security',
                     'Utiliser des requêtes préparées avec des paramètres liés pour éviter les injections SQL',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
-    def _detect_xss_vulnerability(self, line_stripped: str, line_num: int, file_path: Path, 
-                                 line: str, issues: List[Dict[str, Any]]) -> None:
-        """Détecter les vulnérabilités XSS"""
-        # Patterns XSS
-        xss_patterns = [
-            (r'echo\s+\$_(GET|POST|REQUEST|COOKIE|SERVER)\[', 'echo de données utilisateur non filtrées'),
-            (r'print\s+\$_(GET|POST|REQUEST|COOKIE|SERVER)\[', 'print de données utilisateur non filtrées'),
-            (r'printf\s*\([^)]*\$_(GET|POST|REQUEST|COOKIE|SERVER)\[', 'printf avec données utilisateur'),
-            (r'<\?=\s*\$_(GET|POST|REQUEST|COOKIE|SERVER)\[', 'Balise courte PHP avec données utilisateur'),
-            (r'echo\s+["\'][^"\']*\$_(GET|POST|REQUEST|COOKIE|SERVER)', 'echo dans chaîne avec données utilisateur'),
-            (r'innerHTML\s*=.*\$_(GET|POST|REQUEST|COOKIE|SERVER)', 'innerHTML avec données utilisateur'),
-            (r'document\.write\s*\([^)]*\$_(GET|POST|REQUEST|COOKIE|SERVER)', 'document.write avec données utilisateur')
-        ]
+    def _is_safe_execute_argument(self, argument: str) -> bool:
+        """Vérifier si l'argument (déjà nettoyé) d'execute() est un jeu de paramètres liés"""
+        # Appel sans paramètres ou variable de paramètres connue
+        if not argument or argument in _SAFE_EXECUTE_VARIABLES:
+            return True
         
-        for pattern, description in xss_patterns:
-            if re.search(pattern, line_stripped, re.IGNORECASE):
+        # Tableau de paramètres direct: execute([...]), execute([$var1, $var2])
+        if argument[0] == '[':
+            return len(argument) > 1 and argument[-1] == ']'
+        
+        # Variable qui est clairement un tableau de paramètres: execute($user_params)
+        name = argument[1:]
+        return (argument[0] == '$' and len(name) > 7 and name.endswith('_params')
+                and name.isascii() and name.isidentifier())
+    
+    def _detect_xss_vulnerability(self, line_stripped: str, line_lower: str, line_num: int, file_path: Path, 
+                                 issues: List[Dict[str, Any]]) -> None:
+        """Détecter les vulnérabilités XSS"""
+        for literal, pattern, description in _XSS_PATTERNS:
+            if literal in line_lower and pattern.search(line_lower):
                 # Vérifier si htmlspecialchars ou autre fonction d'échappement est utilisée
-                if not re.search(r'htmlspecialchars|htmlentities|filter_var|strip_tags', line_stripped, re.IGNORECASE):
+                if not _XSS_ESCAPING_RE.search(line_lower):
                     issues.append(self._create_issue(
                         'security.xss_vulnerability',
                         f'Vulnérabilité XSS: {description}',
@@ -163,26 +359,15 @@ class SecurityAnalyzer(BaseAnalyzer):
                         'error',
                         'security',
                         'Utiliser htmlspecialchars(), htmlentities() ou filter_var() pour échapper les données utilisateur',
-                        line.strip()
+                        line_stripped
                     ))
                 break
     
-    def _detect_file_inclusion_vulnerability(self, line_stripped: str, line_num: int, file_path: Path, 
-                                           line: str, issues: List[Dict[str, Any]]) -> None:
+    def _detect_file_inclusion_vulnerability(self, line_stripped: str, line_lower: str, line_num: int, file_path: Path, 
+                                           issues: List[Dict[str, Any]]) -> None:
         """Détecter les vulnérabilités d'inclusion de fichiers"""
-        # Patterns d'inclusion dangereuse
-        inclusion_patterns = [
-            (r'include\s*\(\s*\$_(GET|POST|REQUEST)\[', 'include avec données utilisateur'),
-            (r'include_once\s*\(\s*\$_(GET|POST|REQUEST)\[', 'include_once avec données utilisateur'),
-            (r'require\s*\(\s*\$_(GET|POST|REQUEST)\[', 'require avec données utilisateur'),
-            (r'require_once\s*\(\s*\$_(GET|POST|REQUEST)\[', 'require_once avec données utilisateur'),
-            (r'file_get_contents\s*\(\s*\$_(GET|POST|REQUEST)\[', 'file_get_contents avec données utilisateur'),
-            (r'fopen\s*\(\s*\$_(GET|POST|REQUEST)\[', 'fopen avec données utilisateur'),
-            (r'readfile\s*\(\s*\$_(GET|POST|REQUEST)\[', 'readfile avec données utilisateur')
-        ]
-        
-        for pattern, description in inclusion_patterns:
-            if re.search(pattern, line_stripped, re.IGNORECASE):
+        for literal, pattern, description in _INCLUSION_PATTERNS:
+            if literal in line_lower and pattern.search(line_lower):
                 issues.append(self._create_issue(
                     'security.file_inclusion',
                     f'Inclusion de fichier dangereuse: {description}',
@@ -191,24 +376,15 @@ class SecurityAnalyzer(BaseAnalyzer):
                     'error',
                     'security',
                     'Valider et filtrer les noms de fichiers, utiliser une whitelist de fichiers autorisés',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
-    def _detect_weak_password_hashing(self, line_stripped: str, line_num: int, file_path: Path, 
-                                     line: str, issues: List[Dict[str, Any]]) -> None:
+    def _detect_weak_password_hashing(self, line_stripped: str, line_lower: str, line_num: int, file_path: Path, 
+                                     issues: List[Dict[str, Any]]) -> None:
         """Détecter les algorithmes de hachage faibles pour les mots de passe"""
-        # Algorithmes faibles
-        weak_hash_patterns = [
-            (r'md5\s*\([^)]*password', 'MD5 pour hachage de mot de passe'),
-            (r'sha1\s*\([^)]*password', 'SHA1 pour hachage de mot de passe'),
-            (r'hash\s*\(\s*["\']md5["\']', 'hash() avec MD5'),
-            (r'hash\s*\(\s*["\']sha1["\']', 'hash() avec SHA1'),
-            (r'crypt\s*\([^)]*\$[a-zA-Z_]*password', 'crypt() simple pour mot de passe')
-        ]
-        
-        for pattern, description in weak_hash_patterns:
-            if re.search(pattern, line_stripped, re.IGNORECASE):
+        for literal, pattern, description in _WEAK_HASH_PATTERNS:
+            if literal in line_lower and pattern.search(line_lower):
                 issues.append(self._create_issue(
                     'security.weak_password_hashing',
                     f'Algorithme de hachage faible: {description}',
@@ -217,26 +393,15 @@ class SecurityAnalyzer(BaseAnalyzer):
                     'error',
                     'security',
                     'Utiliser password_hash() avec PASSWORD_DEFAULT ou PASSWORD_ARGON2ID',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
-    def _detect_sensitive_data_exposure(self, line_stripped: str, line_num: int, file_path: Path, 
-                                      line: str, issues: List[Dict[str, Any]]) -> None:
+    def _detect_sensitive_data_exposure(self, line_stripped: str, line_lower: str, line_num: int, file_path: Path, 
+                                      issues: List[Dict[str, Any]]) -> None:
         """Détecter l'exposition de données sensibles"""
-        # Exposition de données sensibles
-        sensitive_patterns = [
-            (r'var_dump\s*\(\s*\$_(GET|POST|REQUEST|COOKIE|SESSION)', 'var_dump de données utilisateur'),
-            (r'print_r\s*\(\s*\$_(GET|POST|REQUEST|COOKIE|SESSION)', 'print_r de données utilisateur'),
-            (r'error_reporting\s*\(\s*E_ALL', 'error_reporting(E_ALL) en production'),
-            (r'ini_set\s*\(\s*["\']display_errors["\'].*1', 'display_errors activé'),
-            (r'phpinfo\s*\(\s*\)', 'phpinfo() exposé'),
-            (r'echo\s+.*password.*\$[a-zA-Z_]', 'echo possible de mot de passe'),
-            (r'print\s+.*password.*\$[a-zA-Z_]', 'print possible de mot de passe')
-        ]
-        
-        for pattern, description in sensitive_patterns:
-            if re.search(pattern, line_stripped, re.IGNORECASE):
+        for literal, pattern, description in _SENSITIVE_PATTERNS:
+            if literal in line_lower and pattern.search(line_lower):
                 issues.append(self._create_issue(
                     'security.sensitive_data_exposure',
                     f'Exposition possible de données sensibles: {description}',
@@ -245,24 +410,15 @@ class SecurityAnalyzer(BaseAnalyzer):
                     'warning',
                     'security',
                     'Éviter d\'exposer des données sensibles, désactiver les fonctions de debug en production',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
-    def _detect_auth_issues(self, line_stripped: str, line_num: int, file_path: Path, 
-                           line: str, issues: List[Dict[str, Any]]) -> None:
+    def _detect_auth_issues(self, line_stripped: str, line_lower: str, line_num: int, file_path: Path, 
+                           issues: List[Dict[str, Any]]) -> None:
         """Détecter les problèmes d'authentification et d'autorisation"""
-        # Problèmes d'authentification
-        auth_patterns = [
-            (r'session_start\s*\(\s*\).*\$_SESSION\[.*admin.*\]\s*=\s*true', 'Attribution directe de privilèges admin'),
-            (r'\$_SESSION\[.*user.*\]\s*=\s*\$_(GET|POST)\[', 'Attribution de session depuis données utilisateur'),
-            (r'if\s*\(\s*\$_SESSION\[.*\]\s*\)', 'Vérification de session simple sans validation'),
-            (r'setcookie\s*\([^)]*false\s*\)', 'Cookie non sécurisé (httpOnly=false)'),
-            (r'session_regenerate_id\s*\(\s*false', 'session_regenerate_id sans suppression de l\'ancien ID')
-        ]
-        
-        for pattern, description in auth_patterns:
-            if re.search(pattern, line_stripped, re.IGNORECASE):
+        for literal, pattern, description in _AUTH_PATTERNS:
+            if literal in line_lower and pattern.search(line_lower):
                 issues.append(self._create_issue(
                     'security.authentication',
                     f'Problème d\'authentification: {description}',
@@ -271,31 +427,28 @@ class SecurityAnalyzer(BaseAnalyzer):
                     'warning',
                     'security',
                     'Implémenter une authentification et autorisation robustes',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
-    def _detect_dangerous_functions(self, line_stripped: str, line_num: int, file_path: Path, 
-                                  line: str, issues: List[Dict[str, Any]]) -> None:
+    def _detect_dangerous_functions(self, line_stripped: str, line_lower: str, line_num: int, file_path: Path, 
+                                  issues: List[Dict[str, Any]]) -> None:
         """Détecter l'utilisation de fonctions dangereuses"""
-        # Fonctions dangereuses
-        dangerous_functions = [
-            ('eval', 'Exécution de code arbitraire'),
-            ('exec', 'Exécution de commandes système'),
-            ('system', 'Exécution de commandes système'),
-            ('shell_exec', 'Exécution de commandes shell'),
-            ('passthru', 'Exécution de commandes système'),
-            ('proc_open', 'Ouverture de processus'),
-            ('popen', 'Ouverture de pipe vers processus'),
-            ('assert', 'Assertion (peut exécuter du code)'),
-            ('create_function', 'Création de fonction dynamique'),
-            ('file_put_contents.*php://input', 'Écriture depuis php://input'),
-            ('move_uploaded_file.*\\$_(GET|POST)', 'move_uploaded_file avec données utilisateur')
-        ]
+        if line_stripped.isascii():
+            # Un test d'appartenance par appel plutôt qu'une recherche par fonction ; la
+            # fonction la plus prioritaire l'emporte, les motifs composés venant en dernier
+            best = None
+            for match in _CALL_RE.finditer(line_lower):
+                index = _DANGEROUS_CALLS.get(match.group(1))
+                if index is not None and (best is None or index < best):
+                    best = index
+            candidates = (_DANGEROUS_FUNCTIONS[best],) if best is not None else _DANGEROUS_COMPOSITE_PATTERNS
+        else:
+            # Repli de casse Unicode du moteur `re` (p. ex. 'ſ' pour 's') : motifs d'origine
+            candidates = _DANGEROUS_FUNCTIONS
         
-        for func, description in dangerous_functions:
-            if re.search(rf'\b{func}\s*\(', line_stripped, re.IGNORECASE):
-                severity = 'error' if func in ['eval', 'exec', 'system'] else 'warning'
+        for literal, pattern, func, description, severity in candidates:
+            if literal in line_lower and pattern.search(line_stripped):
                 issues.append(self._create_issue(
                     'security.dangerous_function',
                     f'Fonction dangereuse: {func}() - {description}',
@@ -304,25 +457,15 @@ class SecurityAnalyzer(BaseAnalyzer):
                     severity,
                     'security',
                     f'Éviter l\'utilisation de {func}(), chercher une alternative plus sûre',
-                    line.strip()
+                    line_stripped
                 ))
                 break
     
-    def _detect_configuration_issues(self, line_stripped: str, line_num: int, file_path: Path, 
-                                   line: str, issues: List[Dict[str, Any]]) -> None:
+    def _detect_configuration_issues(self, line_stripped: str, line_lower: str, line_num: int, file_path: Path, 
+                                   issues: List[Dict[str, Any]]) -> None:
         """Détecter les problèmes de configuration de sécurité"""
-        # Problèmes de configuration
-        config_patterns = [
-            (r'ini_set\s*\(\s*["\']allow_url_include["\'].*1', 'allow_url_include activé'),
-            (r'ini_set\s*\(\s*["\']allow_url_fopen["\'].*1', 'allow_url_fopen activé'),
-            (r'ini_set\s*\(\s*["\']register_globals["\'].*1', 'register_globals activé'),
-            (r'extract\s*\(\s*\$_(GET|POST|REQUEST)', 'extract() avec données utilisateur'),
-            (r'parse_str\s*\([^)]*\$_(GET|POST|REQUEST)', 'parse_str avec données utilisateur'),
-            (r'unserialize\s*\(\s*\$_(GET|POST|REQUEST)', 'unserialize avec données utilisateur')
-        ]
-        
-        for pattern, description in config_patterns:
-            if re.search(pattern, line_stripped, re.IGNORECASE):
+        for literal, pattern, description in _CONFIG_PATTERNS:
+            if literal in line_lower and pattern.search(line_lower):
                 issues.append(self._create_issue(
                     'security.configuration',
                     f'Configuration dangereuse: {description}',
@@ -331,5 +474,5 @@ class SecurityAnalyzer(BaseAnalyzer):
                     'warning',
                     'security',
                     'Réviser la configuration de sécurité, désactiver les options dangereuses',
-                    line.strip()
+                    line_stripped
                 ))
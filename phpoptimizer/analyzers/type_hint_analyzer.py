@@ -2,138 +2,354 @@
 Type Hint Analyzer - Détecte les opportunités d'ajout de type hints pour optimiser les performances PHP
 """
 
+import functools
 import re
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 from .base_analyzer import BaseAnalyzer
 
 
+# Patterns pour détecter les fonctions sans type hints ; l'assertion (?=[psf]) ne change
+# rien aux correspondances mais donne au moteur le premier caractère possible, ce qui lui
+# permet d'écarter en C les positions qui ne peuvent pas commencer une déclaration
+_FUNCTION_RE = re.compile(
+    r'(?=[psf])(?:(?:public|private|protected|static)\s+)*function\s+(\w+)\s*\(([^)]*)\)(?:\s*:\s*(\w+(?:\|\w+)*|\?\w+))?\s*\{',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Mot-clé requis par _FUNCTION_RE, recherché d'abord pour écarter les scripts sans fonction
+_FUNCTION_KEYWORD_RE = re.compile(r'function', re.IGNORECASE)
+
+# Paramètres d'une fonction : virgules séparatrices (hors parenthèses), type et nom
+_PARAM_SPLIT_RE = re.compile(r',(?![^(]*\))')
+_PARAM_TYPE_NAME_RE = re.compile(r'(?:(\w+(?:\|\w+)*|\?\w+)\s+)?(\$\w+)')
+
+# Patterns pour détecter les types à partir du contexte
+_TYPE_INFERENCE_PATTERNS = {
+    'int': [
+        re.compile(r'\$\w+\s*=\s*\d+'),  # $var = 42
+        re.compile(r'\$\w+\s*=\s*count\('),  # $var = count()
+        re.compile(r'\$\w+\s*=\s*strlen\('),  # $var = strlen()
+        re.compile(r'\$\w+\s*=\s*sizeof\('),  # $var = sizeof()
+    ],
+    'float': [
+        re.compile(r'\$\w+\s*=\s*\d+\.\d+'),  # $var = 3.14
+        re.compile(r'\$\w+\s*=\s*floatval\('),  # $var = floatval()
+    ],
+    'string': [
+        re.compile(r'\$\w+\s*=\s*["\'][^"\']*["\']'),  # $var = "text"
+        re.compile(r'\$\w+\s*=\s*trim\('),  # $var = trim()
+        re.compile(r'\$\w+\s*=\s*strtolower\('),  # $var = strtolower()
+        re.compile(r'\$\w+\s*=\s*strtoupper\('),  # $var = strtoupper()
+        re.compile(r'\$\w+\s*=\s*substr\('),  # $var = substr()
+    ],
+    'bool': [
+        re.compile(r'\$\w+\s*=\s*(?:true|false)'),  # $var = true
+        re.compile(r'\$\w+\s*=\s*is_\w+\('),  # $var = is_array()
+        re.compile(r'\$\w+\s*=\s*empty\('),  # $var = empty()
+        re.compile(r'\$\w+\s*=\s*isset\('),  # $var = isset()
+    ],
+    'array': [
+        re.compile(r'\$\w+\s*=\s*\['),  # $var = [
+        re.compile(r'\$\w+\s*=\s*array\('),  # $var = array()
+        re.compile(r'\$\w+\s*=\s*explode\('),  # $var = explode()
+        re.compile(r'\$\w+\s*=\s*range\('),  # $var = range()
+    ]
+}
+
+# 1. Vérifications de type explicites, en un seul motif : le groupe « t » donne le type,
+# la priorité entre plusieurs vérifications suit l'ordre de ce tuple
+_TYPE_CHECK_PRIORITY = ('array', 'string', 'int', 'float', 'bool')
+_TYPE_CHECK_TEMPLATE = r'is_(?P<t>' + '|'.join(_TYPE_CHECK_PRIORITY) + r')\s*\(\s*{P}\s*\)'
+
+# Autres indices d'usage d'un paramètre, par ordre de priorité : le premier motif trouvé
+# dans le corps de la fonction donne le type ({P} = nom du paramètre échappé)
+_PARAMETER_USAGE_TEMPLATES = (
+    # 2. Usage comme array
+    ('array', r'{P}\s*\['),
+    ('array', r'foreach\s*\(\s*{P}\s+as'),
+    ('array', r'count\s*\(\s*{P}\s*\)'),
+    ('array', r'array_sum\s*\(\s*{P}\s*\)'),
+    ('array', r'array_\w+\s*\(\s*{P}\s*\)'),
+    # 3. Usage comme string
+    ('string', r'strlen\s*\(\s*{P}\s*\)'),
+    ('string', r'{P}\s*\.\s*["\']'),
+    ('string', r'trim\s*\(\s*{P}\s*\)'),
+    # 4. Usage arithmétique et comparaisons : les motifs qui commencent par le paramètre
+    # sont regroupés (préfixe littéral commun), les autres restent séparés, plus rapides
+    # qu'une alternative unique sans préfixe
+    ('int|float', r'{P}\s*(?:[+\-*/]\s*(?:\d|\$\w)|[<>=!]+\s*\d)'),
+    ('int|float', r'\$\w+\s*[+\-*/]\s*{P}'),
+    ('int|float', r'\d+\s*[<>=!]+\s*{P}'),
+)
+
+# Fonctions de retour connues
+_RETURN_TYPE_PATTERNS = {
+    'int': ['count', 'strlen', 'sizeof', 'strpos', 'strrpos', 'rand', 'mt_rand', 'array_sum'],
+    'float': ['floatval', 'microtime', 'round', 'ceil', 'floor'],
+    'string': ['trim', 'strtolower', 'strtoupper', 'substr', 'str_replace', 'htmlspecialchars'],
+    'bool': ['is_array', 'is_string', 'is_int', 'is_float', 'empty', 'isset', 'in_array'],
+    'array': ['explode', 'range', 'array_merge', 'array_keys', 'array_values']
+}
+
+# Superglobales et variables spéciales PHP
+_PHP_SUPERGLOBALS = frozenset({
+    '$_GET', '$_POST', '$_REQUEST', '$_SESSION', '$_COOKIE',
+    '$_SERVER', '$_ENV', '$_FILES', '$GLOBALS'
+})
+
+# Instructions return et classification de leur expression
+_RETURN_STMT_RE = re.compile(r'return\s+([^;]+);', re.IGNORECASE)
+# Littéraux (expression entière) : le nom du groupe trouvé est le type
+_RETURN_LITERAL_RE = re.compile(
+    r'(?:(?P<bool>true|false)|(?P<null>(?i:null))|(?P<int>\d+)|(?P<float>\d+\.\d+)'
+    r'|(?P<string>["\'].*["\']))\Z'
+)
+# Appels de fonctions connues, par type dans l'ordre de priorité
+_KNOWN_CALLS_BY_TYPE = tuple(
+    (return_type, re.compile(
+        '(?:' + '|'.join(re.escape(func) for func in _RETURN_TYPE_PATTERNS[return_type]) + r')\('
+    ))
+    for return_type in ('int', 'string', 'bool', 'array', 'float')
+)
+_BOOLEAN_EXPR_RE = re.compile(r'[<>]|[!=]=|false|true', re.IGNORECASE | re.ASCII)
+_CALL_EXPR_RE = re.compile(r'\w+\s*\([^)]*\)')
+_ARITHMETIC_EXPR_RE = re.compile(r'\$\w+\s*[+\-*/]\s*(?:\$\w|\d)|\d\s*[+\-*/]\s*\$\w')
+
+
+@functools.lru_cache(maxsize=1024)
+def _parameter_usage_patterns(param_name: str) -> Tuple[re.Pattern, Tuple[Tuple[str, re.Pattern], ...]]:
+    """
+    Compiler les motifs d'usage d'un nom de paramètre
+
+    Mémorisé pour tout le processus : les mêmes noms ($id, $data, $value...) reviennent
+    d'une fonction et d'un fichier à l'autre.
+
+    Returns:
+        Motif des vérifications is_*() et motifs des autres usages, dans l'ordre de priorité
+    """
+    escaped_name = re.escape(param_name)
+    type_check_pattern = re.compile(_TYPE_CHECK_TEMPLATE.replace('{P}', escaped_name))
+    return type_check_pattern, tuple(
+        (inferred_type, re.compile(template.replace('{P}', escaped_name)))
+        for inferred_type, template in _PARAMETER_USAGE_TEMPLATES
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _infer_parameter_type_in_body(param_name: str, func_body: str) -> Optional[str]:
+    """
+    Inférer le type d'un paramètre à partir de son usage dans le corps de la fonction
+
+    Mémorisé pour tout le processus, comme le type de retour : les corps identiques
+    (fonctions copiées, code généré, dépendances embarquées) ne sont analysés qu'une fois.
+    """
+    type_check_pattern, usage_patterns = _parameter_usage_patterns(param_name)
+    
+    # Vérifications de type explicites : un seul parcours du corps, puis la plus prioritaire
+    checked_types = {match.group('t') for match in type_check_pattern.finditer(func_body)}
+    if checked_types:
+        return min(checked_types, key=_TYPE_CHECK_PRIORITY.index)
+    
+    # Chercher d'autres indices sur le type du paramètre
+    for inferred_type, pattern in usage_patterns:
+        if pattern.search(func_body):
+            return inferred_type
+    
+    return None
+
+
+def _classify_return_expression(return_expr: str) -> Optional[str]:
+    """Déterminer le type d'une expression de retour ('null' pour null, None si inconnu)"""
+    literal_match = _RETURN_LITERAL_RE.match(return_expr)
+    if literal_match:
+        return literal_match.lastgroup
+    if return_expr.startswith(('[', 'array(')):
+        return 'array'
+    
+    # Les motifs d'appel exigent une parenthèse : return $x; n'en contient pas
+    has_call = '(' in return_expr
+    
+    # Fonctions connues (avant les expressions génériques)
+    if has_call:
+        for return_type, known_call_re in _KNOWN_CALLS_BY_TYPE:
+            if known_call_re.search(return_expr):
+                return return_type
+    
+    # Expressions booléennes complexes (après les fonctions)
+    if _BOOLEAN_EXPR_RE.search(return_expr):
+        return 'bool'
+    # Appels de fonctions inconnues - suggérer mixed
+    if has_call and _CALL_EXPR_RE.search(return_expr):
+        return 'mixed'
+    # Opérations arithmétiques - suggérer int|float
+    if _ARITHMETIC_EXPR_RE.search(return_expr):
+        return 'int|float'
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _infer_return_type_of_body(func_body: str) -> Optional[str]:
+    """Inférer le type de retour d'une fonction à partir de ses instructions return (mémorisé)"""
+    
+    # Chercher toutes les instructions return
+    return_types = set()
+    has_null = False
+    
+    for match in _RETURN_STMT_RE.finditer(func_body):
+        return_type = _classify_return_expression(match.group(1).strip())
+        if return_type == 'null':
+            has_null = True
+        elif return_type:
+            return_types.add(return_type)
+    
+    # Si tous les returns sont du même type
+    if len(return_types) == 1:
+        return_type = return_types.pop()
+        # Si on a null en plus d'un autre type, suggérer nullable
+        if has_null:
+            if return_type == 'mixed':
+                return "?mixed"
+            else:
+                return f"?{return_type}"
+        return return_type
+    
+    # Si plusieurs types, suggérer union type (PHP 8+)
+    if len(return_types) > 1:
+        union_type = '|'.join(sorted(return_types))
+        if has_null:
+            union_type = f"?({union_type})"
+        return union_type
+    
+    # Si seulement null
+    if has_null and not return_types:
+        return "?mixed"
+        
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _adapt_type(type_hint: str, supports_union: bool, supports_mixed: bool,
+                supports_nullable: bool) -> str:
+    """Adapter un type hint aux fonctionnalités de la version PHP cible ('' = pas de suggestion)"""
+    # Si le type contient des pipes (union types), vérifier la compatibilité
+    if '|' in type_hint:
+        if not supports_union:
+            # PHP < 8.0 : convertir les union types en types plus génériques
+            if type_hint == 'int|float':
+                return 'float'  # float accepte aussi les int
+            elif 'string' in type_hint and 'int' in type_hint:
+                return 'string'  # Privilégier string pour les conversions
+            else:
+                # Pour les autres union types, utiliser le premier type ou mixed si supporté
+                types = type_hint.split('|')
+                if supports_mixed:
+                    return 'mixed'
+                else:
+                    return types[0]  # Premier type de l'union
+    
+    # Vérifier les types spéciaux PHP 8.0+
+    if type_hint == 'mixed' and not supports_mixed:
+        return ''  # Pas de suggestion pour mixed si non supporté
+    
+    # Vérifier les types nullable
+    if type_hint.startswith('?') and not supports_nullable:
+        # PHP < 7.1 : enlever le ? et garder le type de base ou ne pas suggérer
+        base_type = type_hint[1:]
+        if base_type == 'mixed':
+            return ''  # Pas de suggestion
+        return base_type
+    
+    # Vérifier le type nullable mixed spécialement
+    if type_hint == '?mixed':
+        if not supports_nullable:
+            return ''  # PHP < 7.1 ne supporte pas nullable
+        elif not supports_mixed:
+            return ''  # PHP < 8.0 ne supporte pas mixed
+    
+    return type_hint
+
+
 class TypeHintAnalyzer(BaseAnalyzer):
     """Analyseur pour la détection des opportunités d'ajout de type hints PHP"""
     
-    def __init__(self, config=None):
-        super().__init__()
+    # Règles dont cet analyseur peut produire des problèmes
+    rule_names = frozenset({
+        'best_practices.nullable_types', 'performance.missing_parameter_type',
+        'performance.missing_return_type', 'performance.mixed_type_opportunity'
+    })
+    
+    def __init__(self, config=None, enabled_rules=None):
+        super().__init__(config, enabled_rules)
         self.config = config  # Configuration pour connaître la version PHP cible
         
-        # Patterns pour détecter les fonctions sans type hints
-        self.function_pattern = re.compile(
-            r'(?:(?:public|private|protected|static)\s+)*function\s+(\w+)\s*\(([^)]*)\)(?:\s*:\s*(\w+(?:\|\w+)*|\?\w+))?\s*\{',
-            re.IGNORECASE | re.MULTILINE
-        )
-        
-        # Patterns pour détecter les types à partir du contexte
-        self.type_inference_patterns = {
-            'int': [
-                re.compile(r'\$\w+\s*=\s*\d+'),  # $var = 42
-                re.compile(r'\$\w+\s*=\s*count\('),  # $var = count()
-                re.compile(r'\$\w+\s*=\s*strlen\('),  # $var = strlen()
-                re.compile(r'\$\w+\s*=\s*sizeof\('),  # $var = sizeof()
-            ],
-            'float': [
-                re.compile(r'\$\w+\s*=\s*\d+\.\d+'),  # $var = 3.14
-                re.compile(r'\$\w+\s*=\s*floatval\('),  # $var = floatval()
-            ],
-            'string': [
-                re.compile(r'\$\w+\s*=\s*["\'][^"\']*["\']'),  # $var = "text"
-                re.compile(r'\$\w+\s*=\s*trim\('),  # $var = trim()
-                re.compile(r'\$\w+\s*=\s*strtolower\('),  # $var = strtolower()
-                re.compile(r'\$\w+\s*=\s*strtoupper\('),  # $var = strtoupper()
-                re.compile(r'\$\w+\s*=\s*substr\('),  # $var = substr()
-            ],
-            'bool': [
-                re.compile(r'\$\w+\s*=\s*(?:true|false)'),  # $var = true
-                re.compile(r'\$\w+\s*=\s*is_\w+\('),  # $var = is_array()
-                re.compile(r'\$\w+\s*=\s*empty\('),  # $var = empty()
-                re.compile(r'\$\w+\s*=\s*isset\('),  # $var = isset()
-            ],
-            'array': [
-                re.compile(r'\$\w+\s*=\s*\['),  # $var = [
-                re.compile(r'\$\w+\s*=\s*array\('),  # $var = array()
-                re.compile(r'\$\w+\s*=\s*explode\('),  # $var = explode()
-                re.compile(r'\$\w+\s*=\s*range\('),  # $var = range()
-            ]
-        }
-        
-        # Fonctions de retour connues
-        self.return_type_patterns = {
-            'int': ['count', 'strlen', 'sizeof', 'strpos', 'strrpos', 'rand', 'mt_rand', 'array_sum'],
-            'float': ['floatval', 'microtime', 'round', 'ceil', 'floor'],
-            'string': ['trim', 'strtolower', 'strtoupper', 'substr', 'str_replace', 'htmlspecialchars'],
-            'bool': ['is_array', 'is_string', 'is_int', 'is_float', 'empty', 'isset', 'in_array'],
-            'array': ['explode', 'range', 'array_merge', 'array_keys', 'array_values']
-        }
-        
-        # Superglobales et variables spéciales PHP
-        self.php_superglobals = {
-            '$_GET', '$_POST', '$_REQUEST', '$_SESSION', '$_COOKIE', 
-            '$_SERVER', '$_ENV', '$_FILES', '$GLOBALS'
-        }
+        # Position de la fonction -> corps extrait, pour le fichier en cours d'analyse
+        # (partagé par l'analyse des paramètres et celle du type de retour)
+        self._function_bodies: Dict[int, str] = {}
+        # Version PHP -> (union, mixed, nullable) supportés, recalculé si la version change
+        self._version_support: Tuple[Optional[str], Tuple[bool, bool, bool]] = (None, (True, True, True))
 
     def _adapt_type_for_php_version(self, type_hint: str) -> str:
         """Adapter un type hint selon la version PHP cible"""
         if not self.config:
             return type_hint
-        
-        # Si le type contient des pipes (union types), vérifier la compatibilité
-        if '|' in type_hint:
-            if not self.config.supports_union_types():
-                # PHP < 8.0 : convertir les union types en types plus génériques
-                if type_hint == 'int|float':
-                    return 'float'  # float accepte aussi les int
-                elif 'string' in type_hint and 'int' in type_hint:
-                    return 'string'  # Privilégier string pour les conversions
-                else:
-                    # Pour les autres union types, utiliser le premier type ou mixed si supporté
-                    types = type_hint.split('|')
-                    if self.config.supports_mixed_type():
-                        return 'mixed'
-                    else:
-                        return types[0]  # Premier type de l'union
-        
-        # Vérifier les types spéciaux PHP 8.0+
-        if type_hint == 'mixed' and not self.config.supports_mixed_type():
-            return ''  # Pas de suggestion pour mixed si non supporté
-        
-        # Vérifier les types nullable
-        if type_hint.startswith('?') and not self.config.supports_nullable_types():
-            # PHP < 7.1 : enlever le ? et garder le type de base ou ne pas suggérer
-            base_type = type_hint[1:]
-            if base_type == 'mixed':
-                return ''  # Pas de suggestion
-            return base_type
-        
-        # Vérifier le type nullable mixed spécialement
-        if type_hint == '?mixed':
-            if not self.config.supports_nullable_types():
-                return ''  # PHP < 7.1 ne supporte pas nullable
-            elif not self.config.supports_mixed_type():
-                return ''  # PHP < 8.0 ne supporte pas mixed
-        
-        return type_hint
+        return _adapt_type(type_hint, *self._get_version_support())
 
-    def analyze(self, content: str, file_path: Path, lines: List[str]) -> List[Dict]:
+    def _get_version_support(self) -> Tuple[bool, bool, bool]:
+        """Types union, mixed et nullable supportés par la version PHP configurée"""
+        php_version = self.config.php_version
+        cached_version, support = self._version_support
+        if cached_version != php_version:
+            support = (self.config.supports_union_types(),
+                       self.config.supports_mixed_type(),
+                       self.config.supports_nullable_types())
+            self._version_support = (php_version, support)
+        return support
+
+    def analyze(self, content: str, file_path: Path, lines: List[str],
+                line_kind: Optional[bytearray] = None) -> List[Dict]:
         """Analyse le contenu pour détecter les opportunités de type hints"""
         issues = []
+        self._function_bodies.clear()
+        
+        # Règles écartées (configuration, règles incluses/exclues) : aucune inférence
+        # ni construction de message pour des problèmes qui seraient filtrés
+        check_parameters = self._should_report_rule('performance.missing_parameter_type')
+        check_return_type = self._should_report_rule('performance.missing_return_type')
+        if not (check_parameters or check_return_type):
+            return issues
+        
+        # Aucun mot-clé function : rien à analyser, inutile de parcourir le fichier avec _FUNCTION_RE
+        if _FUNCTION_KEYWORD_RE.search(content) is None:
+            return issues
+        
+        # Ligne de chaque fonction obtenue en comptant en C les sauts de ligne depuis
+        # la fonction précédente : un seul parcours du contenu pour tout le fichier
+        line_num = 1
+        counted_up_to = 0
         
         # Analyser les fonctions
-        for match in self.function_pattern.finditer(content):
+        for match in _FUNCTION_RE.finditer(content):
             func_name = match.group(1)
             params = match.group(2).strip() if match.group(2) else ""
             return_type = match.group(3)
             
-            line_num = content[:match.start()].count('\n') + 1
+            line_num += content.count('\n', counted_up_to, match.start())
+            counted_up_to = match.start()
             
             # Analyser les paramètres
-            param_issues = self._analyze_function_parameters(
-                func_name, params, content, file_path, line_num, lines, match.start()
-            )
-            issues.extend(param_issues)
+            if check_parameters:
+                param_issues = self._analyze_function_parameters(
+                    func_name, params, content, file_path, line_num, lines, match.start()
+                )
+                issues.extend(param_issues)
             
             # Analyser le type de retour
-            return_issues = self._analyze_return_type(
-                func_name, return_type, content, file_path, line_num, lines, match.start()
-            )
-            issues.extend(return_issues)
+            if check_return_type:
+                return_issues = self._analyze_return_type(
+                    func_name, return_type, content, file_path, line_num, lines, match.start()
+                )
+                issues.extend(return_issues)
         
         return issues
 
@@ -189,7 +405,7 @@ class TypeHintAnalyzer(BaseAnalyzer):
             return issues
             
         # Extraire le corps de la fonction
-        func_body = self._extract_function_body(content, func_start)
+        func_body = self._get_function_body(content, func_start)
         
         # Analyser les instructions return
         inferred_type = self._infer_return_type(func_body)
@@ -221,7 +437,7 @@ class TypeHintAnalyzer(BaseAnalyzer):
             return param_list
             
         # Séparer les paramètres (attention aux valeurs par défaut avec virgules)
-        params_raw = re.split(r',(?![^(]*\))', params)
+        params_raw = _PARAM_SPLIT_RE.split(params)
         
         for param in params_raw:
             param = param.strip()
@@ -229,7 +445,7 @@ class TypeHintAnalyzer(BaseAnalyzer):
                 continue
                 
             # Parser le type et le nom
-            type_match = re.match(r'(?:(\w+(?:\|\w+)*|\?\w+)\s+)?(\$\w+)', param)
+            type_match = _PARAM_TYPE_NAME_RE.match(param)
             if type_match:
                 param_type = type_match.group(1)
                 param_name = type_match.group(2)
@@ -245,135 +461,19 @@ class TypeHintAnalyzer(BaseAnalyzer):
         """Inférer le type d'un paramètre à partir de son usage"""
         
         # Extraire le corps de la fonction
-        func_body = self._extract_function_body(content, func_start)
-        
-        # Chercher des indices sur le type du paramètre
-        
-        # 1. Vérifications de type explicites
-        if re.search(rf'is_array\s*\(\s*{re.escape(param_name)}\s*\)', func_body):
-            return 'array'
-        if re.search(rf'is_string\s*\(\s*{re.escape(param_name)}\s*\)', func_body):
-            return 'string'
-        if re.search(rf'is_int\s*\(\s*{re.escape(param_name)}\s*\)', func_body):
-            return 'int'
-        if re.search(rf'is_float\s*\(\s*{re.escape(param_name)}\s*\)', func_body):
-            return 'float'
-        if re.search(rf'is_bool\s*\(\s*{re.escape(param_name)}\s*\)', func_body):
-            return 'bool'
-            
-        # 2. Usage comme array
-        if re.search(rf'{re.escape(param_name)}\s*\[', func_body):
-            return 'array'
-        if re.search(rf'foreach\s*\(\s*{re.escape(param_name)}\s+as', func_body):
-            return 'array'
-        if re.search(rf'count\s*\(\s*{re.escape(param_name)}\s*\)', func_body):
-            return 'array'
-        if re.search(rf'array_sum\s*\(\s*{re.escape(param_name)}\s*\)', func_body):
-            return 'array'
-        if re.search(rf'array_\w+\s*\(\s*{re.escape(param_name)}\s*\)', func_body):
-            return 'array'
-            
-        # 3. Usage comme string
-        if re.search(rf'strlen\s*\(\s*{re.escape(param_name)}\s*\)', func_body):
-            return 'string'
-        if re.search(rf'{re.escape(param_name)}\s*\.\s*["\']', func_body):
-            return 'string'
-        if re.search(rf'trim\s*\(\s*{re.escape(param_name)}\s*\)', func_body):
-            return 'string'
-            
-        # 4. Usage arithmétique
-        if re.search(rf'{re.escape(param_name)}\s*[+\-*/]\s*\d', func_body):
-            return 'int|float'
-        if re.search(rf'{re.escape(param_name)}\s*[+\-*/]\s*\$\w+', func_body):
-            return 'int|float'
-        if re.search(rf'\$\w+\s*[+\-*/]\s*{re.escape(param_name)}', func_body):
-            return 'int|float'
-        # Comparaisons arithmétiques
-        if re.search(rf'{re.escape(param_name)}\s*[<>=!]+\s*\d', func_body):
-            return 'int|float'
-        if re.search(rf'\d+\s*[<>=!]+\s*{re.escape(param_name)}', func_body):
-            return 'int|float'
-            
-        return None
+        func_body = self._get_function_body(content, func_start)
+        return _infer_parameter_type_in_body(param_name, func_body)
 
     def _infer_return_type(self, func_body: str) -> Optional[str]:
         """Inférer le type de retour d'une fonction"""
-        
-        # Chercher toutes les instructions return
-        return_matches = re.finditer(r'return\s+([^;]+);', func_body, re.IGNORECASE)
-        return_types = set()
-        has_null = False
-        
-        for match in return_matches:
-            return_expr = match.group(1).strip()
-            
-            # Analyser l'expression de retour
-            if return_expr in ['true', 'false']:
-                return_types.add('bool')
-            elif return_expr.lower() == 'null':
-                has_null = True
-            elif re.match(r'^\d+$', return_expr):
-                return_types.add('int')
-            elif re.match(r'^\d+\.\d+$', return_expr):
-                return_types.add('float')
-            elif re.match(r'^["\'].*["\']$', return_expr):
-                return_types.add('string')
-            elif return_expr.startswith('[') or return_expr.startswith('array('):
-                return_types.add('array')
-            # Fonctions connues (avant les expressions génériques)
-            elif 'count(' in return_expr or 'strlen(' in return_expr or 'sizeof(' in return_expr:
-                return_types.add('int')
-            elif any(func + '(' in return_expr for func in self.return_type_patterns['int']):
-                return_types.add('int')
-            elif any(func + '(' in return_expr for func in self.return_type_patterns['string']):
-                return_types.add('string')
-            elif any(func + '(' in return_expr for func in self.return_type_patterns['bool']):
-                return_types.add('bool')
-            elif any(func + '(' in return_expr for func in self.return_type_patterns['array']):
-                return_types.add('array')
-            elif any(func + '(' in return_expr for func in self.return_type_patterns['float']):
-                return_types.add('float')
-            # Expressions booléennes complexes (après les fonctions)
-            elif ('!==' in return_expr or '===' in return_expr or 
-                  '!=' in return_expr or '==' in return_expr or
-                  '>' in return_expr or '<' in return_expr or
-                  '>=' in return_expr or '<=' in return_expr or
-                  'false' in return_expr.lower() or 'true' in return_expr.lower()):
-                return_types.add('bool')
-            # Appels de fonctions inconnues - suggérer mixed
-            elif re.search(r'\w+\s*\([^)]*\)', return_expr):
-                return_types.add('mixed')
-            # Opérations arithmétiques - suggérer int|float
-            elif re.search(r'\$\w+\s*[+\-*/]\s*\$\w+', return_expr):
-                return_types.add('int|float')
-            elif re.search(r'\$\w+\s*[+\-*/]\s*\d+', return_expr):
-                return_types.add('int|float')
-            elif re.search(r'\d+\s*[+\-*/]\s*\$\w+', return_expr):
-                return_types.add('int|float')
-        
-        # Si tous les returns sont du même type
-        if len(return_types) == 1:
-            return_type = return_types.pop()
-            # Si on a null en plus d'un autre type, suggérer nullable
-            if has_null:
-                if return_type == 'mixed':
-                    return "?mixed"
-                else:
-                    return f"?{return_type}"
-            return return_type
-        
-        # Si plusieurs types, suggérer union type (PHP 8+)
-        if len(return_types) > 1:
-            union_type = '|'.join(sorted(return_types))
-            if has_null:
-                union_type = f"?({union_type})"
-            return union_type
-        
-        # Si seulement null
-        if has_null and not return_types:
-            return "?mixed"
-            
-        return None
+        return _infer_return_type_of_body(func_body)
+
+    def _get_function_body(self, content: str, func_start: int) -> str:
+        """Retourner le corps d'une fonction du fichier en cours, extrait une seule fois"""
+        func_body = self._function_bodies.get(func_start)
+        if func_body is None:
+            func_body = self._function_bodies[func_start] = self._extract_function_body(content, func_start)
+        return func_body
 
     def _extract_function_body(self, content: str, func_start: int) -> str:
         """Extraire le corps d'une fonction"""
@@ -383,18 +483,24 @@ class TypeHintAnalyzer(BaseAnalyzer):
         if brace_start == -1:
             return ""
             
-        # Compter les accolades pour trouver la fermeture
-        brace_count = 0
-        i = brace_start
-        
-        while i < len(content):
-            if content[i] == '{':
+        # Compter les accolades pour trouver la fermeture, d'accolade en accolade
+        # (str.find parcourt le texte intermédiaire sans boucle Python par caractère)
+        brace_count = 1
+        pos = brace_start + 1
+        
+        while True:
+            close_pos = content.find('}', pos)
+            if close_pos == -1:
+                break
+            open_pos = content.find('{', pos, close_pos)
+            if open_pos != -1:
                 brace_count += 1
-            elif content[i] == '}':
+                pos = open_pos + 1
+            else:
                 brace_count -= 1
                 if brace_count == 0:
-                    return content[brace_start + 1:i]
-            i += 1
+                    return content[brace_start + 1:close_pos]
+                pos = close_pos + 1
         
         return content[brace_start + 1:]
 
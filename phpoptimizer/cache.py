@@ -0,0 +1,167 @@
+"""
+Cache disque des résultats d'analyse
+
+Les analyseurs sont déterministes pour un couple (contenu, configuration) :
+les problèmes détectés sont mémorisés sur disque sous une clé dérivée de
+l'empreinte du contenu et de celle de la configuration, ce qui évite de
+réanalyser les fichiers inchangés d'une exécution à l'autre. Un index SQLite
+associe à chaque fichier (chemin, date de modification, taille) l'empreinte de
+son contenu : un fichier inchangé n'est même pas relu.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from . import __version__
+
+if TYPE_CHECKING:  # sqlite3 n'est importé qu'à l'exécution, à la première utilisation de l'index
+    import sqlite3
+
+try:  # Dépendance optionnelle : xxh3 est bien plus rapide qu'une empreinte cryptographique
+    import xxhash
+except ImportError:  # pragma: no cover - xxhash non installé
+    xxhash = None
+
+
+DEFAULT_CACHE_DIR = '.phpoptimizer_cache'
+INDEX_FILE_NAME = 'index.sqlite'
+
+# Un fichier modifié depuis moins longtemps peut l'être à nouveau sans que sa date
+# (résolution du système de fichiers) ni sa taille ne changent : il n'est pas indexé
+_RECENT_MTIME_NS = 2 * 10**9
+
+
+def content_hash(content: str) -> str:
+    """Calculer l'empreinte d'un contenu de fichier (xxh3 si disponible, sinon BLAKE2b)"""
+    data = content.encode('utf-8', 'surrogatepass')
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """Cache des problèmes détectés, un fichier json.gz par entrée"""
+
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        # Index SQLite (chemin, date, taille) -> empreinte, ouvert à la première utilisation
+        # (une connexion par processus : chaque processus de travail a son propre cache)
+        self._index: Optional['sqlite3.Connection'] = None
+        self._index_unavailable = False
+
+    def make_key(self, namespace: str, content: str, config_fingerprint: str) -> str:
+        """Construire la clé d'une entrée (analyseur, contenu, configuration, version)"""
+        return self.make_key_for_hash(namespace, content_hash(content), config_fingerprint)
+
+    def make_key_for_hash(self, namespace: str, digest: str, config_fingerprint: str) -> str:
+        """Construire la clé d'une entrée à partir de l'empreinte déjà calculée du contenu"""
+        raw = f'{namespace}:{__version__}:{config_fingerprint}:{digest}'
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _get_index(self) -> Optional['sqlite3.Connection']:
+        """Ouvrir l'index des fichiers (None s'il est inutilisable)"""
+        # Module importé seulement lorsque le cache est utilisé (import coûteux, ~5 ms)
+        import sqlite3
+        if self._index is None and not self._index_unavailable:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                index = sqlite3.connect(self.cache_dir / INDEX_FILE_NAME, timeout=10,
+                                        isolation_level=None)
+                # WAL : lectures concurrentes des processus de travail, écritures sans fsync
+                index.execute('PRAGMA journal_mode=WAL')
+                index.execute('PRAGMA synchronous=NORMAL')
+                index.execute('CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, '
+                              'mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, '
+                              'content_hash TEXT NOT NULL)')
+                self._index = index
+            except (OSError, sqlite3.Error):
+                self._index_unavailable = True
+        return self._index
+
+    def get_content_hash(self, file_path: Union[str, Path], file_stat: os.stat_result) -> Optional[str]:
+        """
+        Empreinte du contenu d'un fichier, sans le relire s'il n'a pas changé
+
+        Args:
+            file_path: Chemin du fichier
+            file_stat: Résultat de os.stat sur ce fichier
+
+        Returns:
+            Empreinte indexée si la date de modification et la taille sont inchangées, sinon None
+        """
+        import sqlite3
+        index = self._get_index()
+        if index is None:
+            return None
+        try:
+            row = index.execute(
+                'SELECT content_hash FROM files WHERE path = ? AND mtime_ns = ? AND size = ?',
+                (os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set_content_hash(self, file_path: Union[str, Path], file_stat: os.stat_result, digest: str) -> None:
+        """Indexer l'empreinte du contenu d'un fichier (les erreurs d'écriture sont ignorées)"""
+        if time.time_ns() - file_stat.st_mtime_ns < _RECENT_MTIME_NS:
+            return
+        import sqlite3
+        index = self._get_index()
+        if index is None:
+            return
+        try:
+            index.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)',
+                          (os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size, digest))
+        except sqlite3.Error:
+            pass
+
+    def _entry_path(self, key: str) -> Path:
+        # Entrées réparties en sous-dossiers selon les deux premiers caractères de la clé :
+        # aucun dossier démesuré sur les grandes arborescences
+        return self.cache_dir / key[:2] / f'{key}.json.gz'
+
+    def get(self, key: str, file_path: Union[str, Path]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lire une entrée du cache
+
+        Args:
+            key: Clé de l'entrée
+            file_path: Chemin courant du fichier, réécrit dans chaque problème
+
+        Returns:
+            Liste des problèmes, ou None si l'entrée est absente ou illisible
+        """
+        try:
+            with gzip.open(self._entry_path(key), 'rt', encoding='utf-8') as f:
+                issues = json.load(f)
+        except (OSError, EOFError, ValueError):
+            return None
+        # Entrée d'un autre format (ou altérée) : traitée comme absente
+        if not isinstance(issues, list) or not all(isinstance(issue, dict) for issue in issues):
+            return None
+
+        current_path = str(file_path)
+        for issue in issues:
+            issue['file_path'] = current_path
+        return issues
+
+    def set(self, key: str, issues: List[Dict[str, Any]]) -> None:
+        """Enregistrer une entrée du cache (les erreurs d'écriture sont ignorées)"""
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(issues, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
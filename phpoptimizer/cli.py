@@ -4,9 +4,10 @@ Interface en ligne de commande pour PHP Optimizer
 """
 
 import click
+import os
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Tuple
 from colorama import init, Fore, Style
 
 from .simple_analyzer import SimpleAnalyzer
@@ -37,12 +38,16 @@ init(autoreset=True)
 @click.option('--exclude-categories', default='', help='Catégories à exclure')
 @click.option('--min-weight', type=click.Choice(['0', '1', '2', '3', '4']), help='Poids minimum (0=très faible, 1=faible, 2=moyen, 3=élevé, 4=critique)')
 @click.option('--php-version', default='8.0', help='Version PHP cible (ex: 7.0, 7.1, 7.4, 8.0, 8.1, 8.2)')
+@click.option('--cache-dir', type=click.Path(file_okay=False),
+              help='Répertoire du cache des résultats entre exécutions (désactivé par défaut)')
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Nombre de processus d\'analyse (par défaut : nombre de cœurs, 1 = séquentiel)')
 @click.option('--verbose', '-v', is_flag=True,
               help='Mode verbose')
 def analyze(path: str, recursive: bool, output_format: str, output: Optional[str],
            rules: Optional[str], severity: str, exclude_rules: str, include_rules: str, 
            include_categories: str, exclude_categories: str, min_weight: Optional[str],
-           php_version: str, verbose: bool):
+           php_version: str, cache_dir: Optional[str], jobs: Optional[int], verbose: bool):
     """
     Analyse un fichier ou dossier PHP et permet de filtrer les types d'erreurs détectées.
 
@@ -77,6 +82,7 @@ def analyze(path: str, recursive: bool, output_format: str, output: Optional[str
             config.load_rules_file(rules)
         config.set_severity_level(severity)
         config.php_version = php_version  # Définir la version PHP cible
+        config.cache_dir = cache_dir
 
         # Préparer les filtres de règles individuelles
         exclude_rules_list = [r.strip() for r in exclude_rules.split(',') if r.strip()]
@@ -94,7 +100,7 @@ def analyze(path: str, recursive: bool, output_format: str, output: Optional[str
             config.set_min_severity_weight(min_weight)
 
         # Collecte des fichiers PHP
-        php_files = collect_php_files(Path(path), recursive)
+        php_files = collect_php_files(Path(path), recursive, config.excluded_paths)
 
         if not php_files:
             click.echo(f"{Fore.YELLOW}⚠️  Aucun fichier PHP trouvé{Style.RESET_ALL}")
@@ -113,14 +119,14 @@ def analyze(path: str, recursive: bool, output_format: str, output: Optional[str
         analyzer = SimpleAnalyzer(config, exclude_rules=exclude_rules_list, include_rules=include_rules_list)
         results = []
 
-        with click.progressbar(php_files, label='Analyse en cours') as files:
-            for file_path in files:
-                try:
-                    result = analyzer.analyze_file(file_path)
-                    results.append(result)
-                except Exception as e:
-                    if verbose:
-                        click.echo(f"\n{Fore.RED}❌ Erreur lors de l'analyse de {file_path}: {e}{Style.RESET_ALL}")
+        # Les fichiers sont indépendants : analyse répartie sur plusieurs processus,
+        # résultats reçus dans l'ordre des fichiers pour faire avancer la barre de progression.
+        # La barre n'est redessinée qu'environ 200 fois, quel que soit le nombre de fichiers
+        with click.progressbar(length=len(php_files), label='Analyse en cours',
+                               update_min_steps=max(1, len(php_files) // 200)) as progress:
+            for result in analyzer.iter_analyze_many(php_files, max_workers=jobs):
+                results.append(result)
+                progress.update(1)
 
         # Génération du rapport
         reporter = ReportGenerator()
@@ -155,18 +161,67 @@ def analyze(path: str, recursive: bool, output_format: str, output: Optional[str
         sys.exit(1)
 
 
-def collect_php_files(path: Path, recursive: bool) -> List[Path]:
+def collect_php_files(path: Path, recursive: bool,
+                      excluded_paths: Sequence[str] = ()) -> List[Path]:
     """Collecte tous les fichiers PHP dans le chemin donné."""
-    php_files = []
-    
+    return list(iter_php_files(path, recursive, excluded_paths))
+
+
+def iter_php_files(path: Path, recursive: bool,
+                   excluded_paths: Sequence[str] = ()) -> Iterator[Path]:
+    """
+    Parcourt les fichiers PHP du chemin donné au fil de l'exploration.
+
+    Chaque dossier est lu une seule fois et ses entrées triées par nom : l'ordre
+    obtenu est celui d'un tri complet des chemins, sans attendre la fin du parcours.
+    Les entrées dont le chemin relatif contient un des chemins exclus sont ignorées,
+    et les dossiers correspondants ne sont pas parcourus.
+    """
     if path.is_file():
         if path.suffix.lower() == '.php':
-            php_files.append(path)
+            yield path
     elif path.is_dir():
-        pattern = "**/*.php" if recursive else "*.php"
-        php_files.extend(path.glob(pattern))
-    
-    return sorted(php_files)
+        yield from _iter_php_directory(path, recursive, tuple(excluded_paths), '')
+
+
+def _is_excluded(path: str, excluded_paths: Tuple[str, ...]) -> bool:
+    """Vérifier si un chemin contient un des chemins exclus (même règle que Config.should_process_file)"""
+    # Boucle à sortie anticipée : plus rapide qu'any() sur un générateur, et qu'une
+    # alternative compilée en expression régulière pour quelques dizaines de chemins
+    for excluded in excluded_paths:
+        if excluded in path:
+            return True
+    return False
+
+
+def _iter_php_directory(directory: Path, recursive: bool,
+                        excluded_paths: Tuple[str, ...], relative: str) -> Iterator[Path]:
+    """Parcourt un dossier (et ses sous-dossiers si demandé) en profondeur, par nom trié."""
+    try:
+        with os.scandir(directory) as scanner:
+            entries = sorted(scanner, key=lambda entry: os.path.normcase(entry.name))
+    except OSError:
+        return
+
+    for entry in entries:
+        is_php = os.path.normcase(entry.name).endswith('.php')
+        # Liens symboliques vers des dossiers non suivis : pas de boucle possible
+        is_dir = recursive and entry.is_dir(follow_symlinks=False)
+        if not (is_php or is_dir):
+            continue
+
+        entry_relative = ''
+        if excluded_paths:
+            entry_relative = os.path.join(relative, entry.name)
+            # Un dossier exclu l'est avec tout son contenu : sous-arbre élagué sans être lu
+            if _is_excluded(entry_relative, excluded_paths):
+                continue
+
+        if is_php:
+            yield directory / entry.name
+        if is_dir:
+            yield from _iter_php_directory(directory / entry.name, recursive,
+                                           excluded_paths, entry_relative)
 
 
 @click.group()
@@ -2,9 +2,11 @@
 Configuration du système PHP Optimizer
 """
 
+import hashlib
 import json
+import os
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -49,198 +51,234 @@ class RuleConfig:
             self.params = {}
 
 
+# Règles par défaut, construites une seule fois à l'import ; chaque Config en reçoit des
+# copies indépendantes (les règles et leurs params sont modifiables)
+_DEFAULT_RULES: Dict[str, RuleConfig] = {
+    # Règles de sécurité - Poids CRITICAL
+    'security.sql_injection': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.ERROR,
+        category=RuleCategory.SECURITY,
+        weight=SeverityWeight.CRITICAL
+    ),
+    'security.xss_vulnerability': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.ERROR,
+        category=RuleCategory.SECURITY,
+        weight=SeverityWeight.CRITICAL
+    ),
+    'security.weak_password_hashing': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.ERROR,
+        category=RuleCategory.SECURITY,
+        weight=SeverityWeight.CRITICAL
+    ),
+    
+    # Règles d'erreur - Poids HIGH
+    'error.foreach_non_iterable': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.ERROR,
+        category=RuleCategory.ERROR,
+        weight=SeverityWeight.HIGH
+    ),
+    'dead_code.unreachable_after_return': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.WARNING,
+        category=RuleCategory.ERROR,
+        weight=SeverityWeight.HIGH
+    ),
+    'dead_code.always_false_condition': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.WARNING,
+        category=RuleCategory.ERROR,
+        weight=SeverityWeight.HIGH
+    ),
+    
+    # Règles de performance critique - Poids HIGH
+    'performance.inefficient_loops': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.WARNING,
+        category=RuleCategory.PERFORMANCE_CRITICAL,
+        weight=SeverityWeight.HIGH,
+        params={'max_nested_loops': 3}
+    ),
+    'performance.algorithmic_complexity': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.WARNING,
+        category=RuleCategory.PERFORMANCE_CRITICAL,
+        weight=SeverityWeight.HIGH
+    ),
+    
+    # Règles de performance générale - Poids MEDIUM
+    'performance.constant_propagation': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.PERFORMANCE_GENERAL,
+        weight=SeverityWeight.MEDIUM
+    ),
+    'performance.repeated_calculations': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.WARNING,
+        category=RuleCategory.PERFORMANCE_GENERAL,
+        weight=SeverityWeight.MEDIUM
+    ),
+    'performance.repetitive_array_access': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.PERFORMANCE_GENERAL,
+        weight=SeverityWeight.MEDIUM,
+        params={'min_occurrences': 3}
+    ),
+    'performance.dynamic_method_call': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.PERFORMANCE_GENERAL,
+        weight=SeverityWeight.MEDIUM
+    ),
+    'performance.dynamic_function_call': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.PERFORMANCE_GENERAL,
+        weight=SeverityWeight.MEDIUM
+    ),
+    
+    # Règles de mémoire - Poids MEDIUM
+    'performance.large_arrays': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.WARNING,
+        category=RuleCategory.MEMORY,
+        weight=SeverityWeight.MEDIUM,
+        params={'max_array_size': 1000}
+    ),
+    'performance.unused_variables': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.MEMORY,
+        weight=SeverityWeight.MEDIUM
+    ),
+    'performance.unused_global_variable': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.MEMORY,
+        weight=SeverityWeight.MEDIUM
+    ),
+    'performance.global_could_be_local': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.MEMORY,
+        weight=SeverityWeight.MEDIUM
+    ),
+    
+    # Règles de qualité de code - Poids LOW
+    'performance.missing_parameter_type': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.CODE_QUALITY,
+        weight=SeverityWeight.LOW
+    ),
+    'performance.missing_return_type': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.CODE_QUALITY,
+        weight=SeverityWeight.LOW
+    ),
+    'performance.mixed_type_opportunity': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.CODE_QUALITY,
+        weight=SeverityWeight.LOW
+    ),
+    'best_practices.function_complexity': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.WARNING,
+        category=RuleCategory.CODE_QUALITY,
+        weight=SeverityWeight.LOW,
+        params={'max_complexity': 10}
+    ),
+    'best_practices.missing_documentation': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.CODE_QUALITY,
+        weight=SeverityWeight.LOW
+    ),
+    
+    # Règles PSR - Poids VERY_LOW
+    'best_practices.psr_compliance': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.PSR,
+        weight=SeverityWeight.VERY_LOW
+    ),
+    'best_practices.line_length': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.PSR,
+        weight=SeverityWeight.VERY_LOW
+    ),
+    'best_practices.naming': RuleConfig(
+        enabled=True,
+        severity=SeverityLevel.INFO,
+        category=RuleCategory.PSR,
+        weight=SeverityWeight.VERY_LOW
+    ),
+}
+
+
+
+def _version_to_tuple(version: str) -> Tuple[int, ...]:
+    """Convertir une version PHP ("8.1") en tuple comparable ((8, 1))"""
+    return tuple(map(int, version.split('.')))
+
+
 class Config:
     """Gestionnaire de configuration pour PHP Optimizer"""
     
     def __init__(self):
         self.severity_level = SeverityLevel.INFO
-        self.rules: Dict[str, RuleConfig] = {}
+        # Règles construites au premier accès à self.rules (voir la propriété rules)
+        self._rules: Optional[Dict[str, RuleConfig]] = None
         self.excluded_paths: List[str] = []
         self.included_extensions: List[str] = ['.php']
         self.max_file_size: int = 10 * 1024 * 1024  # 10MB
-        self.php_version: str = "8.0"  # Version PHP cible par défaut
+        self.php_version = "8.0"  # Version PHP cible par défaut
         
         # Nouveaux filtres par catégorie et poids
         self.included_categories: List[RuleCategory] = []
         self.excluded_categories: List[RuleCategory] = []
         self.min_severity_weight: SeverityWeight = SeverityWeight.VERY_LOW
         
-        # Initialiser les règles par défaut
-        self._init_default_rules()
+        # Répertoire du cache des résultats (désactivé si None)
+        self.cache_dir: Optional[str] = None
+    
+    @property
+    def rules(self) -> Dict[str, RuleConfig]:
+        """Règles de la configuration, initialisées avec les règles par défaut au premier accès"""
+        if self._rules is None:
+            self._rules = {}
+            self._init_default_rules()
+        return self._rules
+    
+    @rules.setter
+    def rules(self, rules: Dict[str, RuleConfig]):
+        self._rules = rules
+    
+    @property
+    def php_version(self) -> str:
+        """Version PHP cible"""
+        return self._php_version
+    
+    @php_version.setter
+    def php_version(self, value: str):
+        # Version analysée une seule fois : les supports_* comparent directement des tuples
+        self._php_version_tuple = _version_to_tuple(value)
+        self._php_version = value
     
     def _init_default_rules(self):
-        """Initialiser les règles par défaut"""
-        default_rules = {
-            # Règles de sécurité - Poids CRITICAL
-            'security.sql_injection': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.ERROR,
-                category=RuleCategory.SECURITY,
-                weight=SeverityWeight.CRITICAL
-            ),
-            'security.xss_vulnerability': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.ERROR,
-                category=RuleCategory.SECURITY,
-                weight=SeverityWeight.CRITICAL
-            ),
-            'security.weak_password_hashing': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.ERROR,
-                category=RuleCategory.SECURITY,
-                weight=SeverityWeight.CRITICAL
-            ),
-            
-            # Règles d'erreur - Poids HIGH
-            'error.foreach_non_iterable': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.ERROR,
-                category=RuleCategory.ERROR,
-                weight=SeverityWeight.HIGH
-            ),
-            'dead_code.unreachable_after_return': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.WARNING,
-                category=RuleCategory.ERROR,
-                weight=SeverityWeight.HIGH
-            ),
-            'dead_code.always_false_condition': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.WARNING,
-                category=RuleCategory.ERROR,
-                weight=SeverityWeight.HIGH
-            ),
-            
-            # Règles de performance critique - Poids HIGH
-            'performance.inefficient_loops': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.WARNING,
-                category=RuleCategory.PERFORMANCE_CRITICAL,
-                weight=SeverityWeight.HIGH,
-                params={'max_nested_loops': 3}
-            ),
-            'performance.algorithmic_complexity': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.WARNING,
-                category=RuleCategory.PERFORMANCE_CRITICAL,
-                weight=SeverityWeight.HIGH
-            ),
-            
-            # Règles de performance générale - Poids MEDIUM
-            'performance.constant_propagation': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.PERFORMANCE_GENERAL,
-                weight=SeverityWeight.MEDIUM
-            ),
-            'performance.repeated_calculations': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.WARNING,
-                category=RuleCategory.PERFORMANCE_GENERAL,
-                weight=SeverityWeight.MEDIUM
-            ),
-            'performance.repetitive_array_access': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.PERFORMANCE_GENERAL,
-                weight=SeverityWeight.MEDIUM,
-                params={'min_occurrences': 3}
-            ),
-            'performance.dynamic_method_call': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.PERFORMANCE_GENERAL,
-                weight=SeverityWeight.MEDIUM
-            ),
-            'performance.dynamic_function_call': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.PERFORMANCE_GENERAL,
-                weight=SeverityWeight.MEDIUM
-            ),
-            
-            # Règles de mémoire - Poids MEDIUM
-            'performance.large_arrays': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.WARNING,
-                category=RuleCategory.MEMORY,
-                weight=SeverityWeight.MEDIUM,
-                params={'max_array_size': 1000}
-            ),
-            'performance.unused_variables': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.MEMORY,
-                weight=SeverityWeight.MEDIUM
-            ),
-            'performance.unused_global_variable': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.MEMORY,
-                weight=SeverityWeight.MEDIUM
-            ),
-            'performance.global_could_be_local': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.MEMORY,
-                weight=SeverityWeight.MEDIUM
-            ),
-            
-            # Règles de qualité de code - Poids LOW
-            'performance.missing_parameter_type': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.CODE_QUALITY,
-                weight=SeverityWeight.LOW
-            ),
-            'performance.missing_return_type': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.CODE_QUALITY,
-                weight=SeverityWeight.LOW
-            ),
-            'performance.mixed_type_opportunity': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.CODE_QUALITY,
-                weight=SeverityWeight.LOW
-            ),
-            'best_practices.function_complexity': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.WARNING,
-                category=RuleCategory.CODE_QUALITY,
-                weight=SeverityWeight.LOW,
-                params={'max_complexity': 10}
-            ),
-            'best_practices.missing_documentation': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.CODE_QUALITY,
-                weight=SeverityWeight.LOW
-            ),
-            
-            # Règles PSR - Poids VERY_LOW
-            'best_practices.psr_compliance': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.PSR,
-                weight=SeverityWeight.VERY_LOW
-            ),
-            'best_practices.line_length': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.PSR,
-                weight=SeverityWeight.VERY_LOW
-            ),
-            'best_practices.naming': RuleConfig(
-                enabled=True,
-                severity=SeverityLevel.INFO,
-                category=RuleCategory.PSR,
-                weight=SeverityWeight.VERY_LOW
-            ),
-        }
-        
-        self.rules.update(default_rules)
+        """Initialiser les règles par défaut (copies de _DEFAULT_RULES, params compris)"""
+        self.rules.update({
+            rule_name: RuleConfig(rule.enabled, rule.severity, rule.category, rule.weight, dict(rule.params))
+            for rule_name, rule in _DEFAULT_RULES.items()
+        })
     
     def load_rules_file(self, file_path: Path):
         """Charger les règles depuis un fichier JSON"""
@@ -288,8 +326,27 @@ class Config:
                 'params': rule_config.params
             }
         
+        # Document sérialisé d'un bloc puis écrit en une fois (json.dump écrit fragment par fragment)
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(config_data, indent=2, ensure_ascii=False))
+    
+    def fingerprint(self) -> str:
+        """Calculer une empreinte stable des paramètres qui influencent l'analyse"""
+        data = {
+            'severity_level': self.severity_level.value,
+            'php_version': self.php_version,
+            'included_categories': sorted(cat.value for cat in self.included_categories),
+            'excluded_categories': sorted(cat.value for cat in self.excluded_categories),
+            'min_severity_weight': self.min_severity_weight.value,
+            'rules': {
+                rule_name: [rule_config.enabled, rule_config.severity.value,
+                            rule_config.category.value, rule_config.weight.value,
+                            rule_config.params]
+                for rule_name, rule_config in self.rules.items()
+            }
+        }
+        serialized = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.blake2b(serialized.encode('utf-8'), digest_size=16).hexdigest()
     
     def set_severity_level(self, level: str):
         """Définir le niveau de sévérité minimum"""
@@ -317,7 +374,7 @@ class Config:
         
         # Vérifier la taille du fichier
         try:
-            if file_path.stat().st_size > self.max_file_size:
+            if os.path.getsize(file_path) > self.max_file_size:
                 return False
         except OSError:
             return False
@@ -326,30 +383,27 @@ class Config:
 
     def supports_union_types(self) -> bool:
         """Vérifier si la version PHP supporte les types union (PHP 8.0+)"""
-        return self._version_compare(self.php_version, "8.0") >= 0
+        return self._php_version_tuple >= (8, 0)
     
     def supports_nullable_types(self) -> bool:
         """Vérifier si la version PHP supporte les types nullable (PHP 7.1+)"""
-        return self._version_compare(self.php_version, "7.1") >= 0
+        return self._php_version_tuple >= (7, 1)
     
     def supports_mixed_type(self) -> bool:
         """Vérifier si la version PHP supporte le type mixed (PHP 8.0+)"""
-        return self._version_compare(self.php_version, "8.0") >= 0
+        return self._php_version_tuple >= (8, 0)
     
     def supports_never_type(self) -> bool:
         """Vérifier si la version PHP supporte le type never (PHP 8.1+)"""
-        return self._version_compare(self.php_version, "8.1") >= 0
+        return self._php_version_tuple >= (8, 1)
     
     def _version_compare(self, version1: str, version2: str) -> int:
         """
         Comparer deux versions PHP
         Retourne: -1 si version1 < version2, 0 si égales, 1 si version1 > version2
         """
-        def version_to_tuple(v: str) -> tuple:
-            return tuple(map(int, v.split('.')))
-        
-        v1_tuple = version_to_tuple(version1)
-        v2_tuple = version_to_tuple(version2)
+        v1_tuple = _version_to_tuple(version1)
+        v2_tuple = _version_to_tuple(version2)
         
         if v1_tuple < v2_tuple:
             return -1
@@ -373,13 +427,10 @@ class Config:
         """
         Vérifier si une règle doit être appliquée selon les filtres de catégorie et poids
         """
-        if rule_name not in self.rules:
-            return False
-            
-        rule_config = self.rules[rule_name]
+        rule_config = self.rules.get(rule_name)
         
-        # Vérifier si la règle est activée
-        if not rule_config.enabled:
+        # Vérifier si la règle existe et est activée
+        if rule_config is None or not rule_config.enabled:
             return False
             
         # Vérifier les catégories incluses
@@ -396,6 +447,15 @@ class Config:
             
         return True
 
+    def enabled_rules(self) -> FrozenSet[str]:
+        """
+        Ensemble des règles qui passent les filtres d'activation, de catégorie et de poids
+
+        Calculé en un seul parcours : les boucles de filtrage n'ont plus qu'un test
+        d'appartenance par règle. L'ensemble reflète la configuration au moment de l'appel.
+        """
+        return frozenset(rule_name for rule_name in self.rules if self.should_apply_rule(rule_name))
+
     def get_rules_by_category(self, category: RuleCategory) -> Dict[str, RuleConfig]:
         """Obtenir toutes les règles d'une catégorie"""
         return {
@@ -3,7 +3,7 @@ Parseur PHP utilisant phply pour l'analyse syntaxique
 """
 
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 import phply
 from phply import phplex
 from phply.phpparse import make_parser
@@ -16,6 +16,8 @@ class PHPParser:
     def __init__(self):
         self.lexer = phplex.lexer.clone()
         self.parser = make_parser()
+        # Noms (chaînes) des variables déjà relevées dans metadata['variables'] pour le fichier en cours
+        self._seen_variables: Set[str] = set()
     
     def parse_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """
@@ -82,6 +84,7 @@ class PHPParser:
         }
         
         # Analyser l'AST pour extraire les informations
+        self._seen_variables.clear()
         if ast:
             self._analyze_ast_node(ast, metadata)
         
@@ -165,12 +168,19 @@ class PHPParser:
         """Analyser une assignation de variable"""
         if hasattr(node, 'node') and hasattr(node.node, 'name'):
             var_name = node.node.name
-            if var_name not in [v['name'] for v in metadata['variables']]:
-                metadata['variables'].append({
-                    'name': var_name,
-                    'line': getattr(node, 'lineno', 0),
-                    'type': 'unknown'
-                })
+            if isinstance(var_name, str):
+                # Test d'appartenance en O(1) : pas de liste des noms reconstruite à chaque assignation
+                if var_name in self._seen_variables:
+                    return
+                self._seen_variables.add(var_name)
+            elif var_name in [v['name'] for v in metadata['variables']]:
+                # Nom dynamique ($this->$prop) : nœud phply non hachable, comparé par égalité
+                return
+            metadata['variables'].append({
+                'name': var_name,
+                'line': getattr(node, 'lineno', 0),
+                'type': 'unknown'
+            })
     
     def _analyze_include(self, node: Any, metadata: Dict[str, Any]):
         """Analyser une instruction include/require"""
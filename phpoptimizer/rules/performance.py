@@ -4,6 +4,19 @@ from . import BaseRule
 from ..analyzer import IssueType
 
 # --- Propagation de constantes ---
+# Motifs compilés une fois au chargement du module, partagés par toutes les analyses
+_CONST_ASSIGNMENT_RE = re.compile(
+    r"\s*\$([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*([\d]+|'[^']*'|\"[^\"]*\"|true|false|null)\s*;", re.IGNORECASE)
+_CONST_MODIFICATION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\$([a-zA-Z_][a-zA-Z0-9_]*)\+\+',           # $var++
+    r'\+\+\$([a-zA-Z_][a-zA-Z0-9_]*)',           # ++$var
+    r'\$([a-zA-Z_][a-zA-Z0-9_]*)\-\-',           # $var--
+    r'\-\-\$([a-zA-Z_][a-zA-Z0-9_]*)',           # --$var
+    r'\$([a-zA-Z_][a-zA-Z0-9_]*)\s*[+\-*\/%.]=', # $var += etc.
+    r'\$([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*(?![\d]+|\'[^\']*\'|\"[^\"]*\"|true|false|null\s*;)', # $var = non-constante
+))
+
+
 class ConstantPropagationRule(BaseRule):
     """Remplace les variables à valeur constante par leur valeur littérale partout où c'est possible."""
     def get_rule_name(self) -> str:
@@ -28,7 +41,7 @@ class ConstantPropagationRule(BaseRule):
         # Première passe : détecter les assignations constantes
         for line_num, line in enumerate(lines, 1):
             # $var = valeur; (valeur = nombre, string, booléen, null)
-            m = re.match(r"\s*\$([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*([\d]+|'[^']*'|\"[^\"]*\"|true|false|null)\s*;", line, re.IGNORECASE)
+            m = _CONST_ASSIGNMENT_RE.match(line)
             if m:
                 var, value = m.group(1), m.group(2)
                 if var not in const_assignments and var not in modified_vars:
@@ -37,17 +50,8 @@ class ConstantPropagationRule(BaseRule):
         # Deuxième passe : détecter toutes les modifications de variables
         for line_num, line in enumerate(lines, 1):
             # Variables incrémentées/décrémentées ou réaffectées
-            modification_patterns = [
-                r'\$([a-zA-Z_][a-zA-Z0-9_]*)\+\+',           # $var++
-                r'\+\+\$([a-zA-Z_][a-zA-Z0-9_]*)',           # ++$var
-                r'\$([a-zA-Z_][a-zA-Z0-9_]*)\-\-',           # $var--
-                r'\-\-\$([a-zA-Z_][a-zA-Z0-9_]*)',           # --$var
-                r'\$([a-zA-Z_][a-zA-Z0-9_]*)\s*[+\-*\/%.]=', # $var += etc.
-                r'\$([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*(?![\d]+|\'[^\']*\'|\"[^\"]*\"|true|false|null\s*;)', # $var = non-constante
-            ]
-            
-            for pattern in modification_patterns:
-                for match in re.finditer(pattern, line):
+            for pattern in _CONST_MODIFICATION_PATTERNS:
+                for match in pattern.finditer(line):
                     var = match.group(1)
                     modified_vars.add(var)
                     # Retirer de const_assignments si elle y était
@@ -196,6 +200,10 @@ class InefficientLoopsRule(BaseRule):
         return issues
 
 
+# Expression mathématique simple (opérande opérateur opérande), compilée une seule fois
+_MATH_EXPRESSION_RE = re.compile(r'[a-zA-Z_$][a-zA-Z0-9_$]*\s*[\+\-\*\/]\s*[a-zA-Z0-9_$]+')
+
+
 class RepeatedCalculationsRule(BaseRule):
     """Détecte les calculs répétés qui pourraient être mis en cache"""
     
@@ -218,10 +226,11 @@ class RepeatedCalculationsRule(BaseRule):
         
         for line_num, line in enumerate(lines, 1):
             # Rechercher les expressions mathématiques
-            expressions = re.findall(r'[a-zA-Z_$][a-zA-Z0-9_$]*\s*[\+\-\*\/]\s*[a-zA-Z0-9_$]+', line)
+            expressions = _MATH_EXPRESSION_RE.findall(line)
             
             for expr in expressions:
-                expr_clean = re.sub(r'\s+', ' ', expr.strip())
+                # Normalisation des espaces sans passer par le moteur d'expressions régulières
+                expr_clean = ' '.join(expr.split())
                 if expr_clean not in math_expressions:
                     math_expressions[expr_clean] = []
                 math_expressions[expr_clean].append((line_num, line.strip()))
@@ -9,6 +9,53 @@ from . import BaseRule
 from ..analyzer import Issue, IssueType
 
 
+# Patterns dangereux pour l'injection SQL
+_SQL_INJECTION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'mysql_query\s*\(\s*["\'].*\$.*["\']',  # mysql_query avec variables
+    r'mysqli_query\s*\(.*["\'].*\$.*["\']',   # mysqli_query avec variables
+    r'query\s*\(\s*["\'].*\$.*["\']',         # query générique avec variables
+    r'execute\s*\(\s*["\'].*\$.*["\']',       # execute avec variables
+    r'SELECT.*\$.*FROM',                      # SELECT avec variables
+    r'INSERT.*\$.*INTO',                      # INSERT avec variables
+    r'UPDATE.*SET.*\$',                       # UPDATE avec variables
+    r'DELETE.*WHERE.*\$',                     # DELETE avec variables
+))
+
+# Patterns dangereux pour XSS
+_XSS_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'echo\s+\$_GET\[',      # echo $_GET direct
+    r'echo\s+\$_POST\[',     # echo $_POST direct
+    r'print\s+\$_GET\[',     # print $_GET direct
+    r'print\s+\$_POST\[',    # print $_POST direct
+    r'<\?=\s*\$_GET\[',      # <?= $_GET direct
+    r'<\?=\s*\$_POST\[',     # <?= $_POST direct
+))
+
+# Fonctions de hachage faibles
+_WEAK_HASH_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'md5\s*\(',
+    r'sha1\s*\(',
+    r'hash\s*\(\s*["\']md5["\']',
+    r'hash\s*\(\s*["\']sha1["\']',
+    r'crypt\s*\(',  # Sans salt approprié
+))
+
+# Mots-clés indiquant un contexte de mot de passe
+_PASSWORD_KEYWORDS = ('password', 'passwd', 'pwd', 'pass')
+
+# Patterns dangereux pour l'inclusion de fichiers
+_FILE_INCLUSION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'include\s*\(\s*\$_GET\[',      # include($_GET[...])
+    r'include_once\s*\(\s*\$_GET\[', # include_once($_GET[...])
+    r'require\s*\(\s*\$_GET\[',      # require($_GET[...])
+    r'require_once\s*\(\s*\$_GET\[', # require_once($_GET[...])
+    r'include\s*\(\s*\$_POST\[',     # include($_POST[...])
+    r'include_once\s*\(\s*\$_POST\[',# include_once($_POST[...])
+    r'require\s*\(\s*\$_POST\[',     # require($_POST[...])
+    r'require_once\s*\(\s*\$_POST\[',# require_once($_POST[...])
+))
+
+
 class SQLInjectionRule(BaseRule):
     """Détecte les vulnérabilités d'injection SQL potentielles"""
     
@@ -26,23 +73,9 @@ class SQLInjectionRule(BaseRule):
         content = parse_result.get('content', '')
         lines = content.split('\n')
         
-        # Patterns dangereux pour l'injection SQL
-        dangerous_patterns = [
-            r'mysql_query\s*\(\s*["\'].*\$.*["\']',  # mysql_query avec variables
-            r'mysqli_query\s*\(.*["\'].*\$.*["\']',   # mysqli_query avec variables
-            r'query\s*\(\s*["\'].*\$.*["\']',         # query générique avec variables
-            r'execute\s*\(\s*["\'].*\$.*["\']',       # execute avec variables
-            r'SELECT.*\$.*FROM',                      # SELECT avec variables
-            r'INSERT.*\$.*INTO',                      # INSERT avec variables
-            r'UPDATE.*SET.*\$',                       # UPDATE avec variables
-            r'DELETE.*WHERE.*\$',                     # DELETE avec variables
-        ]
-        
         for line_num, line in enumerate(lines, 1):
-            line_upper = line.upper()
-            
-            for pattern in dangerous_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
+            for pattern in _SQL_INJECTION_PATTERNS:
+                if pattern.search(line):
                     issues.append(self.create_issue(
                         message="Requête SQL potentiellement vulnérable à l'injection",
                         line=line_num,
@@ -72,19 +105,9 @@ class XSSVulnerabilityRule(BaseRule):
         content = parse_result.get('content', '')
         lines = content.split('\n')
         
-        # Patterns dangereux pour XSS
-        dangerous_patterns = [
-            r'echo\s+\$_GET\[',      # echo $_GET direct
-            r'echo\s+\$_POST\[',     # echo $_POST direct
-            r'print\s+\$_GET\[',     # print $_GET direct
-            r'print\s+\$_POST\[',    # print $_POST direct
-            r'<\?=\s*\$_GET\[',      # <?= $_GET direct
-            r'<\?=\s*\$_POST\[',     # <?= $_POST direct
-        ]
-        
         for line_num, line in enumerate(lines, 1):
-            for pattern in dangerous_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
+            for pattern in _XSS_PATTERNS:
+                if pattern.search(line):
                     issues.append(self.create_issue(
                         message="Sortie de données utilisateur non échappée (risque XSS)",
                         line=line_num,
@@ -114,20 +137,12 @@ class WeakPasswordHashingRule(BaseRule):
         content = parse_result.get('content', '')
         lines = content.split('\n')
         
-        # Fonctions de hachage faibles
-        weak_hash_functions = [
-            r'md5\s*\(',
-            r'sha1\s*\(',
-            r'hash\s*\(\s*["\']md5["\']',
-            r'hash\s*\(\s*["\']sha1["\']',
-            r'crypt\s*\(',  # Sans salt approprié
-        ]
-        
         for line_num, line in enumerate(lines, 1):
-            for pattern in weak_hash_functions:
-                if re.search(pattern, line, re.IGNORECASE):
+            line_lower = line.lower()
+            for pattern in _WEAK_HASH_PATTERNS:
+                if pattern.search(line):
                     # Vérifier si c'est dans un contexte de mot de passe
-                    if any(keyword in line.lower() for keyword in ['password', 'passwd', 'pwd', 'pass']):
+                    if any(keyword in line_lower for keyword in _PASSWORD_KEYWORDS):
                         issues.append(self.create_issue(
                             message="Algorithme de hachage faible utilisé pour un mot de passe",
                             line=line_num,
@@ -157,21 +172,9 @@ class FileInclusionRule(BaseRule):
         content = parse_result.get('content', '')
         lines = content.split('\n')
         
-        # Patterns dangereux pour l'inclusion de fichiers
-        dangerous_patterns = [
-            r'include\s*\(\s*\$_GET\[',      # include($_GET[...])
-            r'include_once\s*\(\s*\$_GET\[', # include_once($_GET[...])
-            r'require\s*\(\s*\$_GET\[',      # require($_GET[...])
-            r'require_once\s*\(\s*\$_GET\[', # require_once($_GET[...])
-            r'include\s*\(\s*\$_POST\[',     # include($_POST[...])
-            r'include_once\s*\(\s*\$_POST\[',# include_once($_POST[...])
-            r'require\s*\(\s*\$_POST\[',     # require($_POST[...])
-            r'require_once\s*\(\s*\$_POST\[',# require_once($_POST[...])
-        ]
-        
         for line_num, line in enumerate(lines, 1):
-            for pattern in dangerous_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
+            for pattern in _FILE_INCLUSION_PATTERNS:
+                if pattern.search(line):
                     issues.append(self.create_issue(
                         message="Inclusion de fichier basée sur des données utilisateur",
                         line=line_num,
@@ -0,0 +1,231 @@
+"""
+Vérification statique des expressions régulières contre les risques de ReDoS
+
+Les analyseurs appliquent leurs expressions régulières à du code source PHP
+potentiellement hostile : un motif à retour arrière catastrophique permettrait
+à une seule ligne malveillante de bloquer l'analyse. Ce module inspecte l'arbre
+syntaxique produit par le parseur du module ``re`` pour détecter les deux
+formes classiques de complexité non linéaire :
+
+- les quantificateurs imbriqués ambigus, ex. ``(a+)+`` (explosion exponentielle)
+- les quantificateurs adjacents qui se chevauchent, ex. ``\\s+.*`` (polynomial)
+
+Outil réservé aux tests (test_regex_safety.py) : il s'appuie sur les modules
+internes du moteur ``re``, susceptibles de changer d'une version de Python à l'autre.
+"""
+
+import re
+from typing import FrozenSet, List, Union
+
+try:  # Python 3.11+
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse
+    import sre_constants
+
+
+# Alphabet d'échantillonnage utilisé pour comparer les classes de caractères
+_SAMPLE_ALPHABET = ''.join(chr(c) for c in range(128)) + ' é٠ 一'
+
+_CATEGORY_PATTERNS = {
+    sre_constants.CATEGORY_DIGIT: re.compile(r'\d'),
+    sre_constants.CATEGORY_NOT_DIGIT: re.compile(r'\D'),
+    sre_constants.CATEGORY_SPACE: re.compile(r'\s'),
+    sre_constants.CATEGORY_NOT_SPACE: re.compile(r'\S'),
+    sre_constants.CATEGORY_WORD: re.compile(r'\w'),
+    sre_constants.CATEGORY_NOT_WORD: re.compile(r'\W'),
+}
+
+_REPEAT_OPS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+if hasattr(sre_constants, 'POSSESSIVE_REPEAT'):
+    _POSSESSIVE_OPS = {sre_constants.POSSESSIVE_REPEAT}
+else:  # pragma: no cover - Python < 3.11
+    _POSSESSIVE_OPS = set()
+
+_ALL_CHARS = frozenset(_SAMPLE_ALPHABET)
+
+
+def find_redos_risks(pattern: Union[str, 're.Pattern']) -> List[str]:
+    """
+    Détecter les formes de motifs sujettes au retour arrière catastrophique
+
+    Args:
+        pattern: Motif (chaîne ou expression compilée) à vérifier
+
+    Returns:
+        Liste des problèmes détectés (vide si le motif est sûr)
+    """
+    flags = 0
+    if isinstance(pattern, re.Pattern):
+        flags = pattern.flags
+        pattern = pattern.pattern
+    if isinstance(pattern, bytes):
+        pattern = pattern.decode('latin-1')
+
+    parsed = sre_parse.parse(pattern, flags)
+    ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+    checker = _RedosChecker(ignore_case)
+    checker.check_sequence(list(parsed))
+    return checker.risks
+
+
+def is_redos_safe(pattern: Union[str, 're.Pattern']) -> bool:
+    """Vérifier qu'un motif ne présente aucune forme de ReDoS connue"""
+    return not find_redos_risks(pattern)
+
+
+class _RedosChecker:
+    """Parcours de l'arbre syntaxique d'un motif à la recherche d'ambiguïtés"""
+
+    def __init__(self, ignore_case: bool):
+        self.ignore_case = ignore_case
+        self.risks: List[str] = []
+
+    def check_sequence(self, items: list) -> None:
+        """Vérifier une séquence d'éléments puis ses sous-motifs"""
+        self._check_adjacent_repeats(items)
+        for op, av in items:
+            if op in _REPEAT_OPS:
+                self._check_nested_repeat(av)
+                self.check_sequence(list(av[2]))
+            elif op in _POSSESSIVE_OPS:
+                self.check_sequence(list(av[2]))
+            elif op == sre_constants.SUBPATTERN:
+                self.check_sequence(list(av[-1]))
+            elif op == sre_constants.BRANCH:
+                for branch in av[1]:
+                    self.check_sequence(list(branch))
+            elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+                self.check_sequence(list(av[1]))
+            elif op == getattr(sre_constants, 'ATOMIC_GROUP', None):
+                self.check_sequence(list(av))
+
+    def _check_nested_repeat(self, av) -> None:
+        """Quantificateur non borné contenant un autre quantificateur non borné ambigu"""
+        _, max_count, body = av
+        if max_count != sre_constants.MAXREPEAT:
+            return
+        body = list(body)
+        body_anchors = [self._charset(op, sub) for op, sub in body if self._min_width(op, sub) > 0
+                        and not self._is_unbounded(op, sub)]
+        for inner_op, inner_av in self._iter_unbounded(body):
+            inner_chars = self._charset(inner_op, inner_av)
+            # Un élément obligatoire disjoint de la répétition interne sépare les itérations
+            if any(not (anchor & inner_chars) for anchor in body_anchors):
+                continue
+            self.risks.append('quantificateurs imbriqués ambigus (risque exponentiel)')
+            return
+
+    def _check_adjacent_repeats(self, items: list) -> None:
+        """Deux quantificateurs non bornés qui se chevauchent dans la même séquence"""
+        for i, (op_a, av_a) in enumerate(items):
+            if not self._is_unbounded(op_a, av_a):
+                continue
+            chars_a = self._charset(op_a, av_a)
+            for j in range(i + 1, len(items)):
+                op_b, av_b = items[j]
+                if not self._is_unbounded(op_b, av_b):
+                    continue
+                chars_b = self._charset(op_b, av_b)
+                common = chars_a & chars_b
+                if not common:
+                    continue
+                # Chaque quantificateur doit pouvoir absorber une itération complète de l'autre
+                if not (self._can_absorb(av_a, chars_b) and self._can_absorb(av_b, chars_a)):
+                    continue
+                # Un élément obligatoire intermédiaire disjoint des caractères communs
+                # empêche de répartir une même sous-chaîne entre les deux quantificateurs
+                if any(self._min_width(op, av) > 0 and not (self._charset(op, av) & common)
+                       for op, av in items[i + 1:j]):
+                    continue
+                self.risks.append('quantificateurs adjacents qui se chevauchent (risque polynomial)')
+                return
+
+    def _can_absorb(self, av, chars: FrozenSet[str]) -> bool:
+        """Vérifier que tous les éléments obligatoires d'un quantificateur acceptent ces caractères"""
+        return all(self._charset(op, sub) & chars for op, sub in av[2]
+                   if self._min_width(op, sub) > 0)
+
+    def _iter_unbounded(self, items: list):
+        """Énumérer récursivement les quantificateurs non bornés d'une séquence"""
+        for op, av in items:
+            if self._is_unbounded(op, av):
+                yield op, av
+            elif op == sre_constants.SUBPATTERN:
+                yield from self._iter_unbounded(list(av[-1]))
+            elif op == sre_constants.BRANCH:
+                for branch in av[1]:
+                    yield from self._iter_unbounded(list(branch))
+            elif op in _REPEAT_OPS:
+                yield from self._iter_unbounded(list(av[2]))
+
+    def _is_unbounded(self, op, av) -> bool:
+        return op in _REPEAT_OPS and av[1] == sre_constants.MAXREPEAT
+
+    def _min_width(self, op, av) -> int:
+        if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            return 0
+        if op in _REPEAT_OPS or op in _POSSESSIVE_OPS:
+            return av[0] * self._sequence_min_width(list(av[2]))
+        if op == sre_constants.SUBPATTERN:
+            return self._sequence_min_width(list(av[-1]))
+        if op == sre_constants.BRANCH:
+            return min(self._sequence_min_width(list(b)) for b in av[1])
+        if op == sre_constants.GROUPREF:
+            return 0
+        return 1
+
+    def _sequence_min_width(self, items: list) -> int:
+        return sum(self._min_width(op, av) for op, av in items)
+
+    def _charset(self, op, av) -> FrozenSet[str]:
+        """Ensemble (échantillonné) des caractères qu'un élément peut consommer"""
+        if op == sre_constants.LITERAL:
+            chars = {chr(av)}
+        elif op == sre_constants.NOT_LITERAL:
+            chars = set(_ALL_CHARS) - {chr(av)}
+        elif op == sre_constants.ANY:
+            chars = set(_ALL_CHARS) - {'\n'}
+        elif op == sre_constants.IN:
+            chars = self._in_charset(av)
+        elif op in _REPEAT_OPS or op in _POSSESSIVE_OPS:
+            chars = self._sequence_charset(list(av[2]))
+        elif op == sre_constants.SUBPATTERN:
+            chars = self._sequence_charset(list(av[-1]))
+        elif op == sre_constants.BRANCH:
+            chars = set()
+            for branch in av[1]:
+                chars |= self._sequence_charset(list(branch))
+        elif op == getattr(sre_constants, 'ATOMIC_GROUP', None):
+            chars = self._sequence_charset(list(av))
+        else:
+            chars = set()
+        if self.ignore_case:
+            chars |= {c.swapcase() for c in chars}
+        return frozenset(chars)
+
+    def _sequence_charset(self, items: list) -> set:
+        chars = set()
+        for op, av in items:
+            chars |= self._charset(op, av)
+        return chars
+
+    def _in_charset(self, items: list) -> set:
+        chars = set()
+        negate = False
+        for op, av in items:
+            if op == sre_constants.NEGATE:
+                negate = True
+            elif op == sre_constants.LITERAL:
+                chars.add(chr(av))
+            elif op == sre_constants.RANGE:
+                low, high = av
+                chars |= {c for c in _SAMPLE_ALPHABET if low <= ord(c) <= high}
+            elif op == sre_constants.CATEGORY:
+                category = _CATEGORY_PATTERNS.get(av)
+                if category is not None:
+                    chars |= {c for c in _SAMPLE_ALPHABET if category.match(c)}
+        if negate:
+            chars = set(_ALL_CHARS) - chars
+        return chars
@@ -6,8 +6,15 @@ import unittest
 from pathlib import Path
 import tempfile
 import os
+from unittest import mock
 
 from phpoptimizer.simple_analyzer import SimpleAnalyzer
+from phpoptimizer.analyzers.base_analyzer import BaseAnalyzer
+from phpoptimizer.analyzers.code_quality_analyzer import CodeQualityAnalyzer
+from phpoptimizer.analyzers.dead_code_analyzer import DeadCodeAnalyzer
+from phpoptimizer.analyzers.dynamic_calls_analyzer import DynamicCallsAnalyzer
+from phpoptimizer.analyzers.performance_analyzer import PerformanceAnalyzer
+from phpoptimizer.analyzers.security_analyzer import SecurityAnalyzer
 from phpoptimizer.config import Config
 
 
@@ -111,6 +118,141 @@ class Example {
         
         # Nettoyer
         os.unlink(f.name)
+    
+    def test_multiline_block_comment_ignored(self):
+        """Test que l'intérieur d'un commentaire /* ... */ n'est pas analysé"""
+        php_code = """<?php
+/*
+   array_push($items, $value);
+   $query = "SELECT * FROM users WHERE id = " . $_GET['id'];
+*/
+$query = "SELECT * FROM users WHERE id = " . $_GET['id'];
+?>"""
+        
+        result = self.analyzer.analyze_content(php_code, Path('comment.php'))
+        flagged_lines = {issue['line'] for issue in result['issues']}
+        self.assertNotIn(3, flagged_lines)
+        self.assertNotIn(4, flagged_lines)
+        self.assertIn(6, flagged_lines)
+
+    def test_block_comment_ignored_by_line_analyzers(self):
+        """Test que l'intérieur d'un commentaire /* ... */ est ignoré par chaque analyseur ligne à ligne"""
+        php_code = """<?php
+/*
+$method = 'save';
+$obj->$method();
+return $value;
+echo 'dead';
+global $unusedGlobal;
+*/
+"""
+        lines = php_code.split('\n')
+        for analyzer_class in (CodeQualityAnalyzer, DeadCodeAnalyzer, DynamicCallsAnalyzer):
+            with self.subTest(analyzer=analyzer_class.__name__):
+                issues = analyzer_class(self.config).analyze(php_code, Path('comment.php'), lines)
+                self.assertEqual([issue for issue in issues if 3 <= issue['line'] <= 7], [])
+
+    def test_line_classification_follows_line_changes(self):
+        """Test qu'une liste de lignes modifiée sur place est classée à nouveau"""
+        analyzer = SecurityAnalyzer(self.config)
+        lines = ['<?php', '// eval($code);']
+        self.assertEqual(analyzer.analyze('\n'.join(lines), Path('a.php'), lines), [])
+        
+        lines[1] = 'eval($code);'
+        issues = analyzer.analyze('\n'.join(lines), Path('a.php'), lines)
+        self.assertEqual([issue['rule_name'] for issue in issues], ['security.dangerous_function'])
+
+    def test_overlong_line_skipped_by_performance_detectors(self):
+        """Test qu'une ligne minifiée trop longue n'est pas soumise aux détecteurs de performance"""
+        line = "$unusedValue = in_array($x, $list);"
+        short_result = self.analyzer.analyze_content(f"<?php\n{line}\n", Path('short.php'))
+        long_result = self.analyzer.analyze_content(f"<?php\n{line} /* {'x' * 5000} */\n", Path('long.php'))
+
+        short_rules = {issue['rule_name'] for issue in short_result['issues']}
+        long_rules = {issue['rule_name'] for issue in long_result['issues']}
+        self.assertIn('performance.unused_variables', short_rules)
+        self.assertNotIn('performance.unused_variables', long_rules)
+        self.assertIn('best_practices.line_length', long_rules)
+
+    def test_array_merge_with_nested_call_arguments(self):
+        """Test que array_merge(..., $var, array(...)) est détecté après un appel imbriqué"""
+        for line in ('array_merge($a, array(1));',
+                     'array_merge(foo($a, array(1)));',
+                     'array_merge(f(1, $a, array(1)));'):
+            with self.subTest(line=line):
+                code = f"<?php\n$r = {line}\n"
+                issues = PerformanceAnalyzer(self.config).analyze(code, Path('merge.php'), code.split('\n'))
+                rules = {issue['rule_name'] for issue in issues}
+                self.assertIn('performance.array_merge_single', rules)
+
+    def test_identical_content_reuses_issues(self):
+        """Test qu'un contenu déjà analysé redonne les mêmes problèmes avec le nouveau chemin"""
+        php_code = """<?php\n$query = "SELECT * FROM users WHERE id = " . $_GET['id'];\n?>"""
+        first = self.analyzer.analyze_content(php_code, Path('vendor/a.php'))
+        second = self.analyzer.analyze_content(php_code, Path('vendor/b.php'))
+
+        self.assertTrue(first['issues'])
+        self.assertTrue(all(issue['file_path'] == 'vendor/a.php' for issue in first['issues']))
+        self.assertEqual(second['issues'],
+                         [{**issue, 'file_path': 'vendor/b.php'} for issue in first['issues']])
+
+    def test_identical_content_memo_is_bounded(self):
+        """Test que seuls les derniers contenus analysés restent mémorisés"""
+        with mock.patch('phpoptimizer.simple_analyzer._ISSUES_BY_CONTENT_CACHE_SIZE', 2):
+            for i in range(5):
+                self.analyzer.analyze_content(f"<?php\n$value{i} = md5($password);\n", Path('a.php'))
+        self.assertEqual(len(self.analyzer._issues_by_content), 2)
+
+    def test_analyze_many_matches_sequential(self):
+        """Test que l'analyse parallèle produit les mêmes résultats que l'analyse séquentielle"""
+        php_codes = [
+            """<?php\n$query = "SELECT * FROM users WHERE id = " . $_GET['id'];\n?>""",
+            """<?php\necho $_GET['name'];\n?>""",
+            """<?php\n$hash = md5($password);\n?>""",
+        ]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for i, php_code in enumerate(php_codes):
+                path = Path(tmp_dir) / f'file{i}.php'
+                path.write_text(php_code, encoding='utf-8')
+                paths.append(path)
+            
+            sequential = [self.analyzer.analyze_file(path) for path in paths]
+            parallel = self.analyzer.analyze_many(paths, max_workers=2)
+        
+        self.assertEqual([r['file_path'] for r in parallel], [str(p) for p in paths])
+        self.assertEqual([r['issues'] for r in parallel], [r['issues'] for r in sequential])
+
+    def test_sequential_analysis_consumes_paths_lazily(self):
+        """Test que l'analyse séquentielle commence avant la fin de la découverte des fichiers"""
+        discovered = []
+        
+        def discover():
+            for name in ('a.php', 'b.php'):
+                discovered.append(name)
+                yield Path(name)
+        
+        results = self.analyzer.iter_analyze_many(discover(), max_workers=1)
+        next(results)
+        self.assertEqual(discovered, ['a.php'])
+
+    def test_analyzers_without_selected_rules_are_skipped(self):
+        """Test que seuls les analyseurs produisant une règle retenue sont exécutés"""
+        config = Config()
+        config.set_category_filters(['security'])
+        analyzer = SimpleAnalyzer(config)
+        
+        self.assertEqual([type(a).__name__ for a in analyzer.analyzers], ['SecurityAnalyzer'])
+        
+        # Chaque analyseur ne produit que des règles qu'il déclare
+        for php_file in sorted(Path(__file__).parent.parent.glob('examples/*.php')):
+            content = php_file.read_text(encoding='utf-8')
+            for analyzer_class in BaseAnalyzer.__subclasses__():
+                specialized = analyzer_class(self.config)
+                rule_names = {issue['rule_name'] for issue in
+                              specialized.analyze(content, php_file, content.split('\n'))}
+                self.assertLessEqual(rule_names, specialized.rule_names, php_file.name)
 
 
 class TestConfig(unittest.TestCase):
@@ -130,7 +272,16 @@ class TestConfig(unittest.TestCase):
         
         self.assertTrue(config.is_rule_enabled('security.sql_injection'))
         self.assertFalse(config.is_rule_enabled('nonexistent.rule'))
-    
+
+    def test_enabled_rules_follow_filters(self):
+        """Test que l'ensemble des règles retenues applique les filtres de catégorie et de poids"""
+        config = Config()
+        config.set_category_filters(['security'])
+        config.rules['security.xss_vulnerability'].enabled = False
+
+        self.assertEqual(config.enabled_rules(),
+                         {'security.sql_injection', 'security.weak_password_hashing'})
+
     def test_file_processing(self):
         """Test de vérification de traitement de fichier"""
         config = Config()
@@ -0,0 +1,113 @@
+"""
+Tests unitaires pour le cache des résultats d'analyse
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from phpoptimizer.analyzers.performance_analyzer import PerformanceAnalyzer
+from phpoptimizer.cache import ResultCache
+from phpoptimizer.config import Config
+from phpoptimizer.simple_analyzer import SimpleAnalyzer
+
+
+PHP_CODE = """<?php
+$total = $price * $quantity + $tax;
+$other = $price * $quantity + $tax;
+$result = array_unique($items);
+"""
+
+
+class TestResultCache(unittest.TestCase):
+    """Tests pour le cache disque des problèmes détectés"""
+
+    def setUp(self):
+        """Configuration des tests"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config = Config()
+        self.config.cache_dir = self.tmp_dir.name
+        self.lines = PHP_CODE.split('\n')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cache_hit_rewrites_file_path(self):
+        """Test que le chemin du fichier courant remplace celui mémorisé"""
+        SimpleAnalyzer(self.config).analyze_content(PHP_CODE, Path('a.php'))
+        issues = SimpleAnalyzer(self.config).analyze_content(PHP_CODE, Path('b.php'))['issues']
+        self.assertTrue(issues)
+        self.assertTrue(all(issue['file_path'] == 'b.php' for issue in issues))
+
+    def test_single_entry_per_analyzed_content(self):
+        """Test qu'un contenu analysé ne laisse qu'une entrée dans le cache"""
+        SimpleAnalyzer(self.config).analyze_content(PHP_CODE, Path('a.php'))
+        entries = list(Path(self.tmp_dir.name).glob('*/*.json.gz'))
+        self.assertEqual(len(entries), 1)
+
+    def test_config_change_invalidates_entry(self):
+        """Test qu'une modification de configuration change l'empreinte"""
+        fingerprint = self.config.fingerprint()
+        self.config.rules['performance.repeated_calculations'].enabled = False
+        self.assertNotEqual(fingerprint, self.config.fingerprint())
+
+    def test_simple_analyzer_cache_skips_analyzers(self):
+        """Test qu'un fichier inchangé est relu du cache sans exécuter les analyseurs"""
+        first = SimpleAnalyzer(self.config).analyze_content(PHP_CODE, Path('a.php'))
+        self.assertTrue(first['issues'])
+
+        analyzer = SimpleAnalyzer(self.config)
+        with mock.patch.object(PerformanceAnalyzer, 'analyze') as analyze:
+            second = analyzer.analyze_content(PHP_CODE, Path('a.php'))
+            analyze.assert_not_called()
+        self.assertEqual(first['issues'], second['issues'])
+        self.assertEqual(first['stats'], second['stats'])
+
+    def test_simple_analyzer_cache_depends_on_rule_filters(self):
+        """Test que les règles incluses/exclues font partie de la clé du cache"""
+        SimpleAnalyzer(self.config).analyze_content(PHP_CODE, Path('a.php'))
+        result = SimpleAnalyzer(self.config, include_rules=['performance.repeated_calculations']) \
+            .analyze_content(PHP_CODE, Path('a.php'))
+        self.assertEqual({issue['rule_name'] for issue in result['issues']},
+                         {'performance.repeated_calculations'})
+
+    def test_unchanged_file_is_not_read_again(self):
+        """Test qu'un fichier de date et taille inchangées est reconnu sans être relu"""
+        php_file = Path(self.tmp_dir.name, 'a.php')
+        php_file.write_text(PHP_CODE, encoding='utf-8')
+        os.utime(php_file, ns=(10**18, 10**18))
+        first = SimpleAnalyzer(self.config).analyze_file(php_file)
+
+        with mock.patch('phpoptimizer.simple_analyzer.content_hash') as hash_content:
+            second = SimpleAnalyzer(self.config).analyze_file(php_file)
+            hash_content.assert_not_called()
+        self.assertEqual(first['issues'], second['issues'])
+
+        # Contenu modifié (taille différente) : le fichier est relu et réanalysé
+        php_file.write_text('<?php\necho $_GET["name"];\n', encoding='utf-8')
+        os.utime(php_file, ns=(10**18, 10**18))
+        third = SimpleAnalyzer(self.config).analyze_file(php_file)
+        self.assertNotEqual(first['issues'], third['issues'])
+
+    def test_corrupted_entry_is_ignored(self):
+        """Test qu'une entrée illisible est traitée comme absente"""
+        cache = ResultCache(self.tmp_dir.name)
+        key = cache.make_key('SimpleAnalyzer', PHP_CODE, self.config.fingerprint())
+        entry_path = cache._entry_path(key)
+        entry_path.parent.mkdir(parents=True)
+        entry_path.write_bytes(b'not gzip')
+        self.assertIsNone(cache.get(key, 'a.php'))
+
+        # Entrée tronquée, puis contenu JSON qui n'est pas une liste de problèmes
+        cache.set(key, [{'rule_name': 'performance.repeated_calculations'}])
+        entry_path.write_bytes(entry_path.read_bytes()[:-10])
+        self.assertIsNone(cache.get(key, 'a.php'))
+        for payload in ({'issues': []}, [1, 2], 'text'):
+            cache.set(key, payload)
+            self.assertIsNone(cache.get(key, 'a.php'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Tests pour l'interface en ligne de commande
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from phpoptimizer.cli import main
+
+
+PHP_CODES = [
+    """<?php\n$query = "SELECT * FROM users WHERE id = " . $_GET['id'];\n?>""",
+    """<?php\necho $_GET['name'];\n?>""",
+    """<?php\nfunction add($a, $b) {\n    return $a + $b;\n}\n?>""",
+]
+
+
+class TestAnalyzeCommand(unittest.TestCase):
+    """Tests pour la commande analyze"""
+
+    def _run_json_report(self, tmp_dir: str, jobs: str) -> dict:
+        """Lancer l'analyse du dossier et relire le rapport JSON produit"""
+        report_path = Path(tmp_dir) / f'report_{jobs}.json'
+        result = CliRunner().invoke(main, [
+            'analyze', tmp_dir, '--output-format', 'json',
+            '--output', str(report_path), '--jobs', jobs
+        ])
+        self.assertEqual(result.exit_code, 0, result.output)
+        return json.loads(report_path.read_text(encoding='utf-8'))
+
+    def test_parallel_report_matches_sequential(self):
+        """Test que --jobs 2 produit le même rapport que l'analyse séquentielle"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for i, php_code in enumerate(PHP_CODES):
+                Path(tmp_dir, f'file{i}.php').write_text(php_code, encoding='utf-8')
+
+            sequential = self._run_json_report(tmp_dir, '1')
+            parallel = self._run_json_report(tmp_dir, '2')
+
+        self.assertEqual([r['file_path'] for r in parallel['results']],
+                         [r['file_path'] for r in sequential['results']])
+        self.assertEqual([r['issues'] for r in parallel['results']],
+                         [r['issues'] for r in sequential['results']])
+        self.assertGreater(parallel['summary']['total_issues'], 0)
+
+
+    def test_excluded_paths_prune_directories(self):
+        """Test que les chemins exclus du fichier de règles élaguent le parcours"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            Path(tmp_dir, 'src').mkdir()
+            Path(tmp_dir, 'vendor', 'lib').mkdir(parents=True)
+            Path(tmp_dir, 'src', 'app.php').write_text(PHP_CODES[0], encoding='utf-8')
+            Path(tmp_dir, 'vendor', 'lib', 'dep.php').write_text(PHP_CODES[1], encoding='utf-8')
+            rules_path = Path(tmp_dir, 'rules.json')
+            rules_path.write_text(json.dumps({'excluded_paths': ['vendor']}), encoding='utf-8')
+            report_path = Path(tmp_dir, 'report.json')
+
+            result = CliRunner().invoke(main, [
+                'analyze', tmp_dir, '--recursive', '--rules', str(rules_path),
+                '--output-format', 'json', '--output', str(report_path)
+            ])
+            self.assertEqual(result.exit_code, 0, result.output)
+            report = json.loads(report_path.read_text(encoding='utf-8'))
+
+        self.assertEqual([Path(r['file_path']).name for r in report['results']], ['app.php'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""
+Tests unitaires pour le parseur PHP
+"""
+
+import unittest
+
+from phpoptimizer.parser import PHPParser
+
+
+class TestPHPParser(unittest.TestCase):
+    """Tests pour le parseur phply"""
+
+    def setUp(self):
+        """Configuration des tests"""
+        self.parser = PHPParser()
+
+    def _collect_variables(self, php_code: str):
+        """Relever les variables des assignations de premier niveau"""
+        ast = self.parser.parser.parse(php_code, lexer=self.parser.lexer.clone())
+        metadata = {'variables': []}
+        self.parser._seen_variables.clear()
+        for node in ast:
+            self.parser._analyze_assignment(node, metadata)
+        return metadata['variables']
+
+    def test_assignment_variables_are_deduplicated(self):
+        """Test qu'une variable réassignée n'est relevée qu'une fois"""
+        variables = self._collect_variables("<?php\n$a = 1;\n$b = 2;\n$a = 3;\n?>")
+        self.assertEqual([(v['name'], v['line']) for v in variables], [('$a', 2), ('$b', 3)])
+
+    def test_dynamic_property_assignment(self):
+        """Test qu'une propriété dynamique ($this->$prop) est relevée sans erreur"""
+        variables = self._collect_variables(
+            "<?php\n$this->$prop = 1;\n$this->$prop = 2;\n$this->name = 3;\n?>"
+        )
+        self.assertEqual(len(variables), 2)
+        self.assertEqual(type(variables[0]['name']).__name__, 'Variable')
+        self.assertEqual(variables[1]['name'], 'name')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Tests unitaires pour la vérification statique des expressions régulières (ReDoS)
+"""
+
+import re
+import unittest
+
+from tests.regex_safety import find_redos_risks, is_redos_safe
+from phpoptimizer.analyzers import performance_analyzer, security_analyzer, type_hint_analyzer
+
+
+def _module_patterns(module):
+    """Collecter les motifs précompilés d'un module (constantes et tables de tuples)"""
+    patterns = []
+    for value in vars(module).values():
+        if isinstance(value, re.Pattern):
+            patterns.append(value)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                entries = item if isinstance(item, tuple) else (item,)
+                patterns.extend(entry for entry in entries if isinstance(entry, re.Pattern))
+    return patterns
+
+
+class TestRegexSafety(unittest.TestCase):
+    """Tests pour la détection des motifs à retour arrière catastrophique"""
+
+    def test_nested_quantifiers_detected(self):
+        """Test de détection des quantificateurs imbriqués"""
+        for pattern in (r'(a+)+$', r'(\w*)*x', r'(?:x\w+)+'):
+            with self.subTest(pattern=pattern):
+                risks = find_redos_risks(pattern)
+                self.assertTrue(any('imbriqués' in risk for risk in risks))
+
+    def test_overlapping_adjacent_quantifiers_detected(self):
+        """Test de détection des quantificateurs adjacents qui se chevauchent"""
+        for pattern in (r'\s+.*\$x', r'.*.*=', r'\w+(?:\w\w)+'):
+            with self.subTest(pattern=pattern):
+                risks = find_redos_risks(pattern)
+                self.assertTrue(any('adjacents' in risk for risk in risks))
+
+    def test_safe_patterns_not_flagged(self):
+        """Test que les motifs sans ambiguïté ne sont pas signalés"""
+        for pattern in (r'(?:\[[^\]]+\])+',
+                        r'\$\w+(?:\s*[+\-*/]\s*\$\w+)+',
+                        r'fgets\s*\(.*fopen\s*\(',
+                        r'preg_match\s*\([^)]*\.\*\.\*'):
+            with self.subTest(pattern=pattern):
+                self.assertTrue(is_redos_safe(pattern))
+
+    def test_compiled_pattern_flags(self):
+        """Test que les options d'un motif compilé sont prises en compte"""
+        self.assertTrue(is_redos_safe(r'[a-z]+[A-Z]+'))
+        self.assertFalse(is_redos_safe(re.compile(r'[a-z]+[A-Z]+', re.IGNORECASE)))
+
+    def test_performance_analyzer_patterns_are_safe(self):
+        """Test que les motifs précompilés de l'analyseur de performance sont sûrs"""
+        patterns = _module_patterns(performance_analyzer)
+
+        self.assertTrue(patterns)
+        for pattern in patterns:
+            with self.subTest(pattern=pattern.pattern):
+                self.assertEqual(find_redos_risks(pattern), [])
+
+    def test_security_analyzer_patterns_are_safe(self):
+        """Test que les motifs précompilés de l'analyseur de sécurité sont sûrs"""
+        patterns = _module_patterns(security_analyzer)
+
+        self.assertTrue(patterns)
+        for pattern in patterns:
+            with self.subTest(pattern=pattern.pattern):
+                self.assertEqual(find_redos_risks(pattern), [])
+
+    def test_type_hint_analyzer_patterns_are_safe(self):
+        """Test que les motifs précompilés de l'analyseur de type hints sont sûrs"""
+        patterns = _module_patterns(type_hint_analyzer)
+
+        self.assertTrue(patterns)
+        for pattern in patterns:
+            with self.subTest(pattern=pattern.pattern):
+                self.assertEqual(find_redos_risks(pattern), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ Tests pour l'analyseur de type hints
 
 import unittest
 from phpoptimizer.analyzers.type_hint_analyzer import TypeHintAnalyzer
+from phpoptimizer.config import Config
 
 
 class TestTypeHintAnalyzer(unittest.TestCase):
@@ -221,6 +222,25 @@ class Calculator {
         for rule in expected_rules:
             self.assertIn(rule, rules, f"La règle {rule} devrait être dans la liste")
 
+    
+    def test_disabled_rule_not_reported(self):
+        """Test qu'une règle désactivée dans la configuration n'est pas calculée"""
+        config = Config()
+        config.rules['performance.missing_return_type'].enabled = False
+        analyzer = TypeHintAnalyzer(config)
+        
+        code = """<?php
+function add($a, $b) {
+    return $a + $b;
+}
+"""
+        
+        issues = analyzer.analyze(code, 'test.php', code.split('\n'))
+        
+        rule_names = {issue['rule_name'] for issue in issues}
+        self.assertIn('performance.missing_parameter_type', rule_names)
+        self.assertNotIn('performance.missing_return_type', rule_names)
+
 
 if __name__ == '__main__':
     unittest.main()